@@ -339,6 +339,12 @@ class AgentConfigManager(ConfigStack):
     print_messages_markdown: bool | None = None  # None = auto-detect, True = always, False = never
     print_messages_role: list[Literal["system", "user", "assistant", "tool"]] | None = None
     message_validation_mode: Literal["strict", "warn", "silent"] = "warn"
+    # Resolve multiple pending tool calls together instead of one at a time
+    concurrent_tool_calls: bool = False
+    max_tool_concurrency: int | None = None  # None = unbounded
+    tool_call_timeout: float | None = None  # seconds per tool call, None = no limit
+    # Add provider cache_control breakpoints to the stable request prefix
+    prompt_caching: bool = False
 
     def __init__(self, *args, **kwargs):
         if kwargs.get("print_messages_role") is None:
@@ -51,6 +51,9 @@ class LLMCommonConfig(TypedDict, total=False):
     # Diagnostics
     debug: NotRequired[bool]
 
+    # Mark the stable request prefix with provider cache_control breakpoints
+    prompt_caching: NotRequired[bool]
+
     # OpenRouter-specific (OpenAI-compatible via extra_body)
     transforms: NotRequired[list | dict]
     route: NotRequired[str]
@@ -84,6 +87,9 @@ class AgentOnlyConfig(TypedDict, total=False):
     litellm_debug: NotRequired[bool]
     message_validation_mode: NotRequired[Literal["strict", "warn", "silent"]]
     enable_signal_handling: NotRequired[bool]
+    concurrent_tool_calls: NotRequired[bool]
+    max_tool_concurrency: NotRequired[int | None]
+    tool_call_timeout: NotRequired[float | None]
 
 
 class ModelConfig(LLMCommonConfig, TypedDict, total=False):
@@ -159,4 +165,8 @@ AGENT_CONFIG_KEYS: set[str] = PASS_THROUGH_KEYS | {
     "litellm_debug",
     "message_validation_mode",
     "enable_signal_handling",
+    "concurrent_tool_calls",
+    "max_tool_concurrency",
+    "tool_call_timeout",
+    "prompt_caching",
 }
@@ -11,12 +11,7 @@ from ulid import ULID
 from good_agent.agent.config import AGENT_CONFIG_KEYS
 from good_agent.agent.pool import AgentPool
 from good_agent.events import AgentEvents
-from good_agent.messages import (
-    AssistantMessage,
-    SystemMessage,
-    ToolMessage,
-    UserMessage,
-)
+from good_agent.messages import AssistantMessage
 from good_agent.tools import ToolCall, ToolCallFunction, ToolResponse
 
 if TYPE_CHECKING:
@@ -54,11 +49,12 @@ class ContextManager:
         Creates a new agent with:
         - New session_id (different from parent)
         - Same version_id (until modified)
-        - Optionally copied messages (with new IDs)
+        - Optionally the parent's messages, shared by reference (see
+          ``Agent._share_messages``) so forking does not copy the history
         - Same or modified configuration
 
         Args:
-            include_messages: Whether to copy messages to the forked agent
+            include_messages: Whether to share messages with the forked agent
             **kwargs: Configuration overrides for the new agent
         """
         # Avoid circular import
@@ -89,35 +85,8 @@ class ContextManager:
         # Create new agent using the constructor
         new_agent = Agent(**filtered_config)
 
-        # Copy messages if requested
         if include_messages:
-            for msg in self.agent._messages:
-                # Create new message with same content but new ID
-                # We need to create a new instance to get a new ID
-                msg_data = msg.model_dump(exclude={"id", "role"})
-
-                # Preserve content_parts directly to avoid triggering render
-                # which would cause event loop conflicts in async contexts
-                if hasattr(msg, "content_parts"):
-                    msg_data["content_parts"] = msg.content_parts
-
-                # Create new message of the same type and add via proper methods
-                match msg:
-                    case SystemMessage():
-                        # Use set_system_message for system messages
-                        new_msg = new_agent.model.create_message(**msg_data, role="system")
-                        new_agent.set_system_message(new_msg)
-                    case UserMessage():
-                        new_msg = new_agent.model.create_message(**msg_data, role="user")
-                        new_agent.append(new_msg)
-                    case AssistantMessage():
-                        new_msg = new_agent.model.create_message(**msg_data, role="assistant")
-                        new_agent.append(new_msg)
-                    case ToolMessage():
-                        new_msg = new_agent.model.create_message(**msg_data, role="tool")
-                        new_agent.append(new_msg)
-                    case _:
-                        raise ValueError(f"Unknown message type: {type(msg).__name__}")
+            new_agent._share_messages(self.agent._messages)
 
         # Set version to match source (until modified)
         new_agent._versioning_manager._version_id = self.agent._versioning_manager._version_id
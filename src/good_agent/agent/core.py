@@ -4,9 +4,9 @@ import asyncio
 import contextlib
 import functools
 import logging
-import threading
 import warnings
 import weakref
+from collections import ChainMap
 from collections.abc import (
     AsyncIterator,
     Awaitable,
@@ -39,7 +39,7 @@ from good_agent.agent.components import ComponentRegistry
 from good_agent.agent.context import ContextManager
 from good_agent.agent.hooks import HooksAccessor
 from good_agent.agent.llm import LLMCoordinator
-from good_agent.agent.locking import ReentrantAsyncLock
+from good_agent.agent.locking import ReentrantAsyncLock, current_owner_id
 from good_agent.agent.messages import MessageManager
 from good_agent.agent.modes import (
     MODE_HANDLER_SKIP_KWARG,
@@ -49,7 +49,7 @@ from good_agent.agent.modes import (
     ModeTransition,
     StandaloneMode,
 )
-from good_agent.agent.state import AgentState, AgentStateMachine
+from good_agent.agent.state import AgentState, AgentStateMachine, ConversationSnapshot
 from good_agent.agent.system_prompt import SystemPromptManager
 from good_agent.agent.tasks import AgentTaskManager
 from good_agent.agent.tools import ToolExecutor
@@ -110,6 +110,7 @@ from good_agent.messages import (
 from good_agent.messages.store import put_message
 from good_agent.messages.validation import MessageSequenceValidator, ValidationMode
 from good_agent.model.llm import LanguageModel
+from good_agent.model.protocols import StreamChunk
 from good_agent.tools import (
     BoundTool,
     Tool,
@@ -728,8 +729,7 @@ class Agent(EventRouter):
     async def state_guard(self) -> AsyncIterator[None]:
         """Serialize stateful operations under the Agent lock."""
 
-        current_task = asyncio.current_task()
-        owner_id = id(current_task) if current_task else id(threading.current_thread())
+        owner_id = current_owner_id()
 
         await self._state_lock.acquire(owner_id=owner_id)
         try:
@@ -1432,6 +1432,28 @@ class Agent(EventRouter):
         """
         self._component_registry.track_component_task(component, task)
 
+    def _share_messages(self, messages: Iterable[Message]) -> None:
+        """Seed a freshly forked agent's history with another agent's messages.
+
+        The fork gets its own binding of each message (see ``Message._for_agent``):
+        same ID and shared content, but rendering, ``index`` and ``agent`` resolve
+        against the fork. That is one shallow copy per message, so seeding stays
+        O(N) in the history length. Parent and fork only diverge as either side
+        appends or replaces messages. Messages with template parts carry per-agent render
+        state in their parts, so those are copied outright. No append events
+        fire; the messages already went through the parent's append pipeline.
+        """
+        shared: list[Message] = []
+        for message in messages:
+            if message._has_templates():
+                message = message.copy_with(content_parts=list(message.content_parts))
+                message._set_agent(self)
+                put_message(message)
+            else:
+                message = message._for_agent(self)
+            shared.append(message)
+        self._messages.extend(shared)
+
     async def _fork_with_messages(self, messages: list[Message]) -> Agent:
         """Helper method to fork with specific messages"""
         # Get current config
@@ -1447,33 +1469,8 @@ class Agent(EventRouter):
         # Create new agent using the constructor
         new_agent = Agent(**filtered_config)
 
-        # Copy specified messages
-        for msg in messages:
-            # Create new message with same content but new ID
-            # We need to create a new instance to get a new ID
-            msg_data = msg.model_dump(exclude={"id"})
-
-            # Also preserve content (stored as private attr)
-            msg_data["content"] = msg.content
-
-            # Create new message of the same type
-            new_msg: Message
-            match msg:
-                case SystemMessage():
-                    new_msg = new_agent.model.create_message(**msg_data)
-                case UserMessage():
-                    new_msg = new_agent.model.create_message(**msg_data)
-                case AssistantMessage():
-                    new_msg = new_agent.model.create_message(**msg_data)
-                case ToolMessage():
-                    new_msg = new_agent.model.create_message(**msg_data)
-                case _:
-                    raise ValueError(f"Unknown message type: {type(msg).__name__}")
-
-            # Use direct append for forking (skip event firing)
-            new_msg._set_agent(new_agent)
-            new_agent._messages.append(new_msg)
-            put_message(new_msg)  # Store in global store
+        # Share specified messages (skip event firing)
+        new_agent._share_messages(messages)
 
         # Set version to match source (until modified)
         new_agent._versioning_manager._version_id = self._versioning_manager._version_id
@@ -1485,6 +1482,50 @@ class Agent(EventRouter):
 
         return new_agent
 
+    def _snapshot_conversation(self) -> ConversationSnapshot:
+        """Capture the conversation-scoped state ``_reset_conversation`` returns to."""
+        components = {id(ext): ext for ext in self._component_registry.extensions_by_type.values()}
+        return ConversationSnapshot(
+            messages=tuple(self._messages),
+            context=tuple(dict(layer) for layer in self._context._chainmap.maps),
+            components=tuple((ext, ext._snapshot_state()) for ext in components.values()),
+        )
+
+    def _reset_conversation(
+        self, snapshot: ConversationSnapshot, messages: Sequence[Message] | None = None
+    ) -> None:
+        """Return to ``snapshot``, keeping components, tools and config warm.
+
+        Used by pooled agents to recycle an instance between requests instead of
+        re-forking. Messages, context, modes and component state (citations,
+        usage, tool results) go back to the snapshot; ``messages`` replaces the
+        snapshot's history when given. Each message is bound to this agent (see
+        ``Message._for_agent``), so messages owned by another agent are left
+        untouched. Version history and in-flight tool calls are discarded.
+        """
+        from good_agent.messages.versioning import MessageRegistry, VersionManager
+
+        self._tool_executor.cancel_started_tool_calls()
+
+        self._messages.clear()
+        self._message_registry = MessageRegistry()
+        self._versioning_manager._version_manager = VersionManager()
+        self._messages._init_versioning(
+            self._message_registry, self._versioning_manager._version_manager, self
+        )
+        history = snapshot.messages if messages is None else messages
+        self._messages.extend([msg._for_agent(self) for msg in history])
+
+        self._versioning_manager._version_id = create_monotonic_ulid()
+        self._versioning_manager._versions = (
+            [[msg.id for msg in self._messages]] if self._messages else []
+        )
+
+        self._context._chainmap = ChainMap(*(dict(layer) for layer in snapshot.context))
+        self._mode_manager._reset()
+        for component, state in snapshot.components:
+            component._restore_state(state)
+
     def replace_message(self, index: int, new_message: Message) -> None:
         """
         Replace a message at the given index with a new message.
@@ -1684,6 +1725,19 @@ class Agent(EventRouter):
         """
         return await self._llm_coordinator.llm_call(response_model=response_model, **kwargs)
 
+    async def _llm_stream(
+        self, *, start_tool_calls: bool = False, **kwargs: Any
+    ) -> AsyncIterator[StreamChunk | AssistantMessage]:
+        """Stream a single LLM call without tool execution.
+
+        Yields:
+            StreamChunk deltas, then the appended AssistantMessage
+        """
+        stream = self._llm_coordinator.llm_stream(start_tool_calls=start_tool_calls, **kwargs)
+        async with contextlib.aclosing(stream):
+            async for item in stream:
+                yield item
+
     @overload
     async def call(
         self,
@@ -1818,6 +1872,28 @@ class Agent(EventRouter):
 
             raise ValueError(f"Unknown mode transition type: {transition.transition_type}")
 
+    @overload
+    def execute(
+        self,
+        *content_parts: MessageContent,
+        role: Literal["user", "assistant", "system", "tool"] = "user",
+        context: dict | None = None,
+        streaming: Literal[False] = False,
+        max_iterations: int = 10,
+        **kwargs: Any,
+    ) -> AsyncIterator[Message]: ...
+
+    @overload
+    def execute(
+        self,
+        *content_parts: MessageContent,
+        role: Literal["user", "assistant", "system", "tool"] = "user",
+        context: dict | None = None,
+        streaming: Literal[True],
+        max_iterations: int = 10,
+        **kwargs: Any,
+    ) -> AsyncIterator[Message | StreamChunk]: ...
+
     @ensure_ready
     async def execute(
         self,
@@ -1827,16 +1903,18 @@ class Agent(EventRouter):
         streaming: bool = False,
         max_iterations: int = 10,
         **kwargs: Any,
-    ) -> AsyncIterator[Message]:
+    ) -> AsyncIterator[Message | StreamChunk]:
         """Yield each Assistant/Tool message while the agent runs.
 
         Enables streaming UIs, custom tool approval, and iteration control; call
         ``agent.call`` for the one-shot variant. Demonstrated in
         ``examples/agent/basic_chat.py``.
-        """
-        if streaming:
-            raise NotImplementedError("Streaming mode is not yet implemented.")
 
+        With ``streaming=True`` each LLM turn also yields ``StreamChunk`` deltas
+        (content and tool-call argument fragments) as they arrive, followed by the
+        assembled AssistantMessage. With ``concurrent_tool_calls`` enabled, tool
+        calls start executing as soon as their arguments finish streaming.
+        """
         skip_mode_handler = kwargs.pop(MODE_HANDLER_SKIP_KWARG, False)
 
         if not skip_mode_handler:
@@ -1903,14 +1981,21 @@ class Agent(EventRouter):
                         self.do(AgentEvents.EXECUTE_ITERATION_AFTER, **iteration_after_params)
                         continue
 
-                    precomputed = iteration_directive.get("response")
-                    if precomputed is not None:
-                        response = precomputed
+                    response = iteration_directive.get("response")
+
+                if response is None:
+                    if streaming:
+                        stream = self._llm_stream(start_tool_calls=True, **kwargs)
+                        async with contextlib.aclosing(stream):
+                            async for item in stream:
+                                if isinstance(item, Message):
+                                    response = item
+                                else:
+                                    yield item
+                        assert response is not None, "LLM stream ended without a message"
                     else:
+                        # Call the LLM to get next response (without auto-executing tools)
                         response = await self._llm_call(**kwargs)
-                else:
-                    # Call the LLM to get next response (without auto-executing tools)
-                    response = await self._llm_call(**kwargs)
 
                 iterations += 1
 
@@ -1984,6 +2069,10 @@ class Agent(EventRouter):
                 return
 
             raise
+        finally:
+            # Calls started while streaming are resolved above unless the
+            # consumer stopped iterating early
+            self._tool_executor.cancel_started_tool_calls()
 
         # Emit execute:complete event
         final_message = self.messages[-1] if self.messages else None
@@ -2057,11 +2146,11 @@ class Agent(EventRouter):
         Creates a new agent with:
         - New session_id (different from parent)
         - Same version_id (until modified)
-        - Optionally copied messages (with new IDs)
+        - Optionally the parent's messages, shared rather than copied
         - Same or modified configuration
 
         Args:
-            include_messages: Whether to copy messages to the forked agent
+            include_messages: Whether to share messages with the forked agent
             **kwargs: Configuration overrides for the new agent
         """
         return self._context_manager.fork(include_messages, **kwargs)
@@ -2490,13 +2579,18 @@ class Agent(EventRouter):
         """
         return self._tool_executor.has_pending_tool_calls()
 
-    async def resolve_pending_tool_calls(self) -> AsyncIterator[ToolMessage]:
+    async def resolve_pending_tool_calls(
+        self, *, concurrent: bool | None = None
+    ) -> AsyncIterator[ToolMessage]:
         """Find and execute all pending tool calls in conversation.
 
+        Args:
+            concurrent: Run pending calls together (defaults to ``concurrent_tool_calls`` config)
+
         Yields:
             ToolMessage for each resolved tool call
         """
-        async for msg in self._tool_executor.resolve_pending_tool_calls():
+        async for msg in self._tool_executor.resolve_pending_tool_calls(concurrent=concurrent):
             yield msg
 
     @overload
@@ -2779,25 +2873,21 @@ class Agent(EventRouter):
             Total token count across specified messages
         """
 
-        from good_agent.utilities.tokens import get_message_token_count
+        from good_agent.utilities.tokens import get_message_token_counts
 
-        # Use provided messages or all agent messages
-        msgs = messages if messages is not None else self.messages
+        if messages is None:
+            # Running tally maintained by the message list
+            counts = self.messages.token_counts(self.config.model, include_tools)
+            if not include_system:
+                counts.pop("system", None)
+            return sum(counts.values())
 
         # Filter messages if needed
+        msgs = messages
         if not include_system:
             msgs = [m for m in msgs if m.role != "system"]
 
-        # Sum token counts for all messages
-        total = 0
-        for msg in msgs:
-            total += get_message_token_count(
-                message=msg,
-                model=self.config.model,
-                include_tools=include_tools,
-            )
-
-        return total
+        return sum(get_message_token_counts(msgs, self.config.model, include_tools))
 
     def get_token_count_by_role(
         self,
@@ -2812,23 +2902,13 @@ class Agent(EventRouter):
             Dictionary mapping role to token count
         """
 
-        from good_agent.utilities.tokens import get_message_token_count
-
         counts: dict[str, int] = {
             "system": 0,
             "user": 0,
             "assistant": 0,
             "tool": 0,
         }
-
-        for msg in self.messages:
-            token_count = get_message_token_count(
-                message=msg,
-                model=self.config.model,
-                include_tools=include_tools,
-            )
-            counts[msg.role] = counts.get(msg.role, 0) + token_count
-
+        counts.update(self.messages.token_counts(self.config.model, include_tools))
         return counts
 
     @property
@@ -2854,9 +2934,9 @@ class Agent(EventRouter):
     #     """
     #     return self.get_token_count(include_system=True, include_tools=True)
 
-    def _update_version(self) -> None:
+    def _update_version(self, appended: Sequence[Message] = ()) -> None:
         """Update the agent's version ID when state changes."""
-        self._versioning_manager.update_version()
+        self._versioning_manager.update_version(appended)
 
     def __bool__(self):
         """Agent is always truthy - avoids __len__ conflict."""
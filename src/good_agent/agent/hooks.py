@@ -66,9 +66,10 @@ class HooksAccessor:
         *,
         priority: int = 100,
         predicate: Callable[[EventContext[Any, Any]], bool] | None = None,
+        pure: bool = False,
     ) -> Handler | Callable[[Handler], Handler]:
         def decorator(fn: Handler) -> Handler:
-            return self._agent.on(event, priority=priority, predicate=predicate)(fn)
+            return self._agent.on(event, priority=priority, predicate=predicate, pure=pure)(fn)
 
         if func is not None:
             return decorator(func)
@@ -151,14 +152,20 @@ class HooksAccessor:
         priority: int = 100,
         predicate: Callable[[EventContext[MessageRenderParams, list[Any] | None]], bool]
         | None = None,
+        pure: bool = False,
     ) -> Handler | Callable[[Handler], Handler]:
-        """Interceptable: modify renderable content parts before formatting."""
+        """Interceptable: modify renderable content parts before formatting.
+
+        Pass ``pure=True`` when the handler only depends on its parameters so the
+        formatter can reuse cached LLM payloads between turns.
+        """
 
         return self._register(
             AgentEvents.MESSAGE_RENDER_BEFORE,
             func,
             priority=priority,
             predicate=predicate,
+            pure=pure,
         )
 
     def on_message_render_after(
@@ -167,14 +174,20 @@ class HooksAccessor:
         *,
         priority: int = 100,
         predicate: Callable[[EventContext[MessageRenderParams, None]], bool] | None = None,
+        pure: bool = False,
     ) -> Handler | Callable[[Handler], Handler]:
-        """Signal: observe rendered content parts."""
+        """Signal: observe rendered content parts.
+
+        Pass ``pure=True`` when the handler only depends on its parameters so the
+        formatter can reuse cached LLM payloads between turns.
+        """
 
         return self._register(
             AgentEvents.MESSAGE_RENDER_AFTER,
             func,
             priority=priority,
             predicate=predicate,
+            pure=pure,
         )
 
     def on_message_replace_before(
@@ -306,14 +319,20 @@ class HooksAccessor:
         priority: int = 100,
         predicate: Callable[[EventContext[ToolsGenerateSignature, list[Tool] | None]], bool]
         | None = None,
+        pure: bool = False,
     ) -> Handler | Callable[[Handler], Handler]:
-        """Interceptable: filter or replace tool lists before LLM exposure."""
+        """Interceptable: filter or replace tool lists before LLM exposure.
+
+        Pass ``pure=True`` when the handler only depends on its parameters so the
+        agent can reuse cached tool definitions between turns.
+        """
 
         return self._register(
             AgentEvents.TOOLS_PROVIDE,
             func,
             priority=priority,
             predicate=predicate,
+            pure=pure,
         )
 
     def on_tools_generate_signature(
@@ -323,14 +342,20 @@ class HooksAccessor:
         priority: int = 100,
         predicate: Callable[[EventContext[ToolsGenerateSignature, ToolSignature | None]], bool]
         | None = None,
+        pure: bool = False,
     ) -> Handler | Callable[[Handler], Handler]:
-        """Interceptable: customize tool signatures before LLM calls."""
+        """Interceptable: customize tool signatures before LLM calls.
+
+        Pass ``pure=True`` when the handler only depends on its parameters so the
+        agent can reuse cached tool definitions between turns.
+        """
 
         return self._register(
             AgentEvents.TOOLS_GENERATE_SIGNATURE,
             func,
             priority=priority,
             predicate=predicate,
+            pure=pure,
         )
 
     # ======================================================================
@@ -4,14 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, TypeGuard, TypeVar
 
-from good_agent.core.event_router import EventContext
+from ulid import ULID
+
+from good_agent.core.event_router import EventContext, HandlerRegistration
 from good_agent.events import AgentEvents
 from good_agent.messages import AssistantMessage, AssistantMessageStructuredOutput
 from good_agent.messages.validation import ValidationError
-from good_agent.model.protocols import ResponseWithUsage
-from good_agent.tools import Tool, ToolSignature
+from good_agent.model.protocols import ResponseWithUsage, StreamChunk
+from good_agent.tools import Tool, ToolCall, ToolCallFunction, ToolSignature
 
 if TYPE_CHECKING:
     from litellm.types.utils import Choices
@@ -23,6 +27,31 @@ logger = logging.getLogger(__name__)
 T_Output = TypeVar("T_Output")
 
 
+def _same_items(left: Sequence[Any], right: Sequence[Any]) -> bool:
+    return len(left) == len(right) and all(a is b for a, b in zip(left, right, strict=True))
+
+
+@dataclass(slots=True)
+class _ToolDefinitionsSnapshot:
+    """Tool definitions computed for one combination of tools, handlers and modes."""
+
+    tools: tuple[Tool, ...]
+    signatures: tuple[ToolSignature, ...]
+    handlers: tuple[HandlerRegistration, ...]
+    predicates: tuple[Any, ...]
+    modes: tuple[str, ...]
+    definitions: list[ToolSignature] | None
+
+    def matches(self, other: _ToolDefinitionsSnapshot) -> bool:
+        return (
+            self.modes == other.modes
+            and _same_items(self.tools, other.tools)
+            and _same_items(self.signatures, other.signatures)
+            and _same_items(self.handlers, other.handlers)
+            and _same_items(self.predicates, other.predicates)
+        )
+
+
 def _is_choices_instance(obj: Any) -> TypeGuard[Choices]:
     """Type guard to check if an object is a Choices instance for type narrowing.
 
@@ -51,10 +80,60 @@ class LLMCoordinator:
             agent: Parent Agent instance
         """
         self.agent = agent
+        self._tool_definitions_snapshot: _ToolDefinitionsSnapshot | None = None
+
+    def invalidate_tool_definitions(self) -> None:
+        """Force the next get_tool_definitions() call to dispatch tool events again."""
+        self._tool_definitions_snapshot = None
+
+    def _capture_tool_definitions_state(self) -> _ToolDefinitionsSnapshot | None:
+        """Describe everything the tool definitions depend on, if they are cacheable.
+
+        Returns None when any TOOLS_PROVIDE / TOOLS_GENERATE_SIGNATURE handler has not
+        been declared pure, since its output may change from turn to turn.
+        """
+        handlers = (
+            *self.agent._get_sorted_handlers(AgentEvents.TOOLS_PROVIDE),
+            *self.agent._get_sorted_handlers(AgentEvents.TOOLS_GENERATE_SIGNATURE),
+        )
+        if not all(registration.pure for registration in handlers):
+            return None
+
+        tools = tuple(self.agent.tools.values())
+        return _ToolDefinitionsSnapshot(
+            tools=tools,
+            signatures=tuple(tool.signature for tool in tools),
+            handlers=handlers,
+            predicates=tuple(registration.predicate for registration in handlers),
+            modes=tuple(self.agent.modes.mode_stack),
+            definitions=None,
+        )
 
     async def get_tool_definitions(self) -> list[ToolSignature] | None:
         """Get tool definitions for the LLM call.
 
+        The result is cached while the registered tools, the active modes and the
+        tool event handlers stay the same and every such handler is declared pure.
+        Otherwise TOOLS_PROVIDE and TOOLS_GENERATE_SIGNATURE are dispatched each call.
+
+        Returns:
+            List of tool signatures or None if no tools available
+        """
+        state = self._capture_tool_definitions_state()
+        if state is None:
+            self._tool_definitions_snapshot = None
+            return await self._build_tool_definitions()
+
+        snapshot = self._tool_definitions_snapshot
+        if snapshot is None or not snapshot.matches(state):
+            state.definitions = await self._build_tool_definitions()
+            self._tool_definitions_snapshot = snapshot = state
+
+        return list(snapshot.definitions) if snapshot.definitions is not None else None
+
+    async def _build_tool_definitions(self) -> list[ToolSignature] | None:
+        """Dispatch tool events to build the tool definitions for the LLM call.
+
         Returns:
             List of tool signatures or None if no tools available
         """
@@ -89,25 +168,8 @@ class LLMCoordinator:
             return tool_definitions
         return None
 
-    async def llm_call(
-        self,
-        response_model: type[T_Output] | None = None,
-        **kwargs: Any,
-    ) -> AssistantMessage | AssistantMessageStructuredOutput:
-        """Make a single LLM call without tool execution.
-
-        Args:
-            response_model: Optional structured output model
-            **kwargs: Additional model parameters
-
-        Returns:
-            Assistant message response (may contain tool calls)
-
-        Raises:
-            ValidationError: If message sequence validation fails
-            Exception: LLM API errors are propagated after events
-        """
-        # Update kwargs with tools if available
+    async def _prepare_call_kwargs(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Attach tool definitions and parallel tool call flags to LLM kwargs."""
         if tool_definitions := await self.get_tool_definitions():
             kwargs["tools"] = tool_definitions
             if "parallel_tool_calls" not in kwargs:
@@ -122,18 +184,16 @@ class LLMCoordinator:
 
                 if should_enable:
                     kwargs["parallel_tool_calls"] = True
+        return kwargs
 
-        # Prepare parameters for event
-        llm_params = {
-            "model": self.agent.model.config.model,
-            **kwargs,
-        }
+    def _validate_sequence(self, allow_pending_tools: bool = False) -> None:
+        """Validate the message sequence before sending it to the LLM.
 
-        # Validate message sequence before LLM call
-        # When requesting structured output (response_model provided), allow pending tool calls
-        # since we may inject synthetic tool responses only in the outbound API payload.
+        When requesting structured output, pending tool calls are allowed since
+        synthetic tool responses may be injected only in the outbound API payload.
+        """
         try:
-            if response_model is not None:
+            if allow_pending_tools:
                 self.agent._sequence_validator.validate_partial_sequence(
                     self.agent.messages, allow_pending_tools=True
                 )
@@ -143,6 +203,34 @@ class LLMCoordinator:
             logger.error(f"Message sequence validation failed: {e}")
             raise
 
+    async def llm_call(
+        self,
+        response_model: type[T_Output] | None = None,
+        **kwargs: Any,
+    ) -> AssistantMessage | AssistantMessageStructuredOutput:
+        """Make a single LLM call without tool execution.
+
+        Args:
+            response_model: Optional structured output model
+            **kwargs: Additional model parameters
+
+        Returns:
+            Assistant message response (may contain tool calls)
+
+        Raises:
+            ValidationError: If message sequence validation fails
+            Exception: LLM API errors are propagated after events
+        """
+        kwargs = await self._prepare_call_kwargs(kwargs)
+
+        # Prepare parameters for event
+        llm_params = {
+            "model": self.agent.model.config.model,
+            **kwargs,
+        }
+
+        self._validate_sequence(allow_pending_tools=response_model is not None)
+
         try:
             output = None
             response: AssistantMessage | AssistantMessageStructuredOutput
@@ -283,3 +371,117 @@ class LLMCoordinator:
         except Exception as e:
             self.agent.do(AgentEvents.LLM_ERROR, error=e, parameters=llm_params, agent=self.agent)
             raise
+
+    async def llm_stream(
+        self, *, start_tool_calls: bool = False, **kwargs: Any
+    ) -> AsyncIterator[StreamChunk | AssistantMessage]:
+        """Stream a single LLM call without waiting for tool execution.
+
+        Yields every ``StreamChunk`` as it arrives, then the assembled
+        ``AssistantMessage`` once the stream finishes (after it has been appended).
+        With ``start_tool_calls`` and ``concurrent_tool_calls`` enabled, each
+        streamed tool call is handed to the ToolExecutor as soon as its arguments
+        are complete, so tool execution overlaps the rest of the stream. The
+        caller then owns resolving those calls. Calls started by a stream that
+        does not finish (error, cancellation, or a consumer that stops early) are
+        cancelled.
+
+        Args:
+            start_tool_calls: Start tool calls before the stream finishes
+            **kwargs: Additional model parameters
+
+        Yields:
+            StreamChunk deltas followed by the final AssistantMessage
+        """
+        kwargs = await self._prepare_call_kwargs(kwargs)
+        llm_params = {
+            "model": self.agent.model.config.model,
+            **kwargs,
+        }
+
+        self._validate_sequence()
+
+        tool_executor = self.agent._tool_executor
+        start_tool_calls = start_tool_calls and bool(
+            self.agent.config.get("concurrent_tool_calls", False)
+        )
+        content_parts: list[str] = []
+        partial_calls: dict[int, dict[str, Any]] = {}
+        started: set[int] = set()
+        usage: Any = None
+        completed = False
+
+        def start_completed(before_index: int | None = None) -> None:
+            if not start_tool_calls:
+                return
+            # A fragment for a later index means every earlier call is complete
+            for index in sorted(partial_calls):
+                if index in started or (before_index is not None and index >= before_index):
+                    continue
+                started.add(index)
+                tool_executor.start_tool_call(_build_streamed_tool_call(partial_calls[index]))
+
+        try:
+            _messages = await self.agent.model.format_message_list_for_llm(self.agent.messages)
+
+            async for chunk in self.agent.model.stream(_messages, **kwargs):
+                if chunk.content:
+                    content_parts.append(chunk.content)
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                for delta in chunk.tool_calls or ():
+                    if delta.index not in partial_calls:
+                        start_completed(before_index=delta.index)
+                        partial_calls[delta.index] = {"id": None, "name": "", "arguments": []}
+                    partial = partial_calls[delta.index]
+                    if delta.id:
+                        partial["id"] = delta.id
+                    if delta.name:
+                        partial["name"] += delta.name
+                    if delta.arguments:
+                        partial["arguments"].append(delta.arguments)
+                yield chunk
+
+            tool_calls = [
+                _build_streamed_tool_call(partial_calls[index]) for index in sorted(partial_calls)
+            ]
+            start_completed()
+
+            if usage is not None:
+                kwargs["usage"] = (
+                    usage.model_dump() if hasattr(usage, "model_dump") else dict(usage)
+                )
+
+            response = self.agent.model.create_message(
+                "".join(content_parts),
+                output=None,
+                role="assistant",
+                tool_calls=tool_calls or None,
+                **kwargs,
+            )
+            await self.agent._append_message(response)
+            completed = True
+            yield response
+
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            raise
+        except Exception as e:
+            self.agent.do(AgentEvents.LLM_ERROR, error=e, parameters=llm_params, agent=self.agent)
+            raise
+        finally:
+            if not completed:
+                tool_executor.cancel_started_tool_calls()
+
+
+def _build_streamed_tool_call(partial: dict[str, Any]) -> ToolCall:
+    """Build a ToolCall from accumulated stream fragments, assigning an ID if missing."""
+    if not partial["id"]:
+        partial["id"] = f"call_{ULID()}"
+    return ToolCall(
+        id=partial["id"],
+        type="function",
+        function=ToolCallFunction(
+            name=partial["name"],
+            arguments="".join(partial["arguments"]) or "{}",
+        ),
+    )
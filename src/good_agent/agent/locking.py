@@ -2,99 +2,147 @@ from __future__ import annotations
 
 import asyncio
 import threading
-import time
+from collections import deque
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True, eq=False)
+class _Waiter:
+    owner: int
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future[None]
+    granted: bool = field(default=False)
+
+
+def current_owner_id() -> int:
+    """Identify the caller for ownership: the running task, else the current thread."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return id(task) if task is not None else id(threading.current_thread())
+
+
+def _wake(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
 
 
 class ReentrantAsyncLock:
-    """A re-entrant lock that works across event loops and threads."""
+    """A task re-entrant async lock that works across event loops and threads.
+
+    Ownership is tracked per task (or per explicit ``owner_id``), so a task that
+    already holds the lock can re-acquire it without blocking. Uncontended
+    acquisition completes on the caller's own loop without yielding. Contended
+    waiters park on a future in their own loop and are handed the lock in FIFO
+    order; a waiter on another thread is woken with ``call_soon_threadsafe``, so
+    the lock never needs a helper thread or event loop of its own.
+    """
 
     def __init__(self) -> None:
-        self._lock: asyncio.Lock | None = None
-        self._lock_loop: asyncio.AbstractEventLoop | None = None
-        self._lock_thread: threading.Thread | None = None
+        self._mutex = threading.Lock()
         self._owner_id: int | None = None
         self._depth = 0
-
-    def __del__(self) -> None:
-        try:
-            self.close()
-        except Exception:
-            pass
-
-    def _ensure_lock_loop(self) -> asyncio.AbstractEventLoop:
-        loop = self._lock_loop
-        if loop is None or loop.is_closed():
-            loop = asyncio.new_event_loop()
-            thread = threading.Thread(target=loop.run_forever, name="ReentrantAsyncLock", daemon=True)
-            thread.start()
-            while not loop.is_running():
-                time.sleep(0.001)
-            self._lock_loop = loop
-            self._lock_thread = thread
-        return loop
+        self._waiters: deque[_Waiter] = deque()
 
     @property
     def locked(self) -> bool:
-        lock = self._lock
-        return lock.locked() if lock else False
-
-    async def _acquire_on_lock_loop(self, owner_id: int | None) -> None:
-        if self._lock is None:
-            self._lock = asyncio.Lock()
+        return self._owner_id is not None
 
+    @staticmethod
+    def _resolve_owner(owner_id: int | None, error: str) -> int:
+        if owner_id is not None:
+            return owner_id
         current = asyncio.current_task()
         if current is None:
-            raise RuntimeError("ReentrantAsyncLock requires an active asyncio Task")
-
-        owner = owner_id or id(current)
-
+            raise RuntimeError(error)
+        return id(current)
+
+    def try_acquire(self, owner_id: int) -> bool:
+        """Acquire without waiting; return False if another owner holds the lock."""
+        with self._mutex:
+            return self._try_acquire(owner_id)
+
+    def _try_acquire(self, owner: int) -> bool:
+        if self._owner_id is None:
+            self._owner_id = owner
+            self._depth = 1
+            return True
         if self._owner_id == owner:
             self._depth += 1
-            return
-
-        await self._lock.acquire()
-        self._owner_id = owner
-        self._depth = 1
+            return True
+        return False
 
     async def acquire(self, owner_id: int | None = None) -> None:
-        loop = self._ensure_lock_loop()
-        await asyncio.wrap_future(
-            asyncio.run_coroutine_threadsafe(
-                self._acquire_on_lock_loop(owner_id), loop
-            )
-        )
-
-    async def _release_on_lock_loop(self, owner_id: int | None) -> None:
-        if self._lock is None:
-            raise RuntimeError("Cannot release an uninitialized lock")
-
-        current = asyncio.current_task()
-        if current is None:
-            raise RuntimeError("ReentrantAsyncLock can only be released by its owner")
+        owner = self._resolve_owner(owner_id, "ReentrantAsyncLock requires an active asyncio Task")
 
-        owner = owner_id or id(current)
+        with self._mutex:
+            if self._try_acquire(owner):
+                return
 
-        if self._owner_id != owner:
-            raise RuntimeError("ReentrantAsyncLock can only be released by its owner")
+            loop = asyncio.get_running_loop()
+            waiter = _Waiter(owner, loop, loop.create_future())
+            self._waiters.append(waiter)
 
-        if self._depth <= 0:
-            raise RuntimeError("ReentrantAsyncLock release called too many times")
-
-        self._depth -= 1
-        if self._depth == 0:
-            self._owner_id = None
-            self._lock.release()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._mutex:
+                if waiter.granted:
+                    # Ownership was handed over just as we were cancelled; pass it on.
+                    self._hand_off()
+                elif waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            raise
 
     async def release(self, owner_id: int | None = None) -> None:
-        loop = self._lock_loop
-        if loop is None:
-            raise RuntimeError("ReentrantAsyncLock has not been acquired")
-
-        await asyncio.wrap_future(
-            asyncio.run_coroutine_threadsafe(
-                self._release_on_lock_loop(owner_id), loop
-            )
+        owner = self._resolve_owner(
+            owner_id, "ReentrantAsyncLock can only be released by its owner"
         )
+        self.release_nowait(owner)
+
+    def release_nowait(self, owner_id: int) -> None:
+        """Synchronous counterpart to :meth:`release` for :meth:`try_acquire` callers."""
+        owner = owner_id
+        with self._mutex:
+            if self._owner_id is None and self._depth == 0:
+                raise RuntimeError("ReentrantAsyncLock has not been acquired")
+            if self._owner_id != owner:
+                raise RuntimeError("ReentrantAsyncLock can only be released by its owner")
+            if self._depth <= 0:
+                raise RuntimeError("ReentrantAsyncLock release called too many times")
+
+            self._depth -= 1
+            if self._depth == 0:
+                self._hand_off()
+
+    def _hand_off(self) -> None:
+        """Give the lock to the next live waiter, or mark it free. Caller holds ``_mutex``."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if waiter.future.done():
+                continue
+
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+
+            self._owner_id = waiter.owner
+            self._depth = 1
+            waiter.granted = True
+            if waiter.loop is running:
+                _wake(waiter.future)
+                return
+            try:
+                waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+                return
+            except RuntimeError:
+                # The waiter's loop has been closed; nobody is left to take the lock.
+                waiter.granted = False
+
+        self._owner_id = None
+        self._depth = 0
 
     async def __aenter__(self) -> ReentrantAsyncLock:
         await self.acquire()
@@ -104,18 +152,4 @@ class ReentrantAsyncLock:
         await self.release()
 
     def close(self) -> None:
-        loop = self._lock_loop
-        thread = self._lock_thread
-        self._lock_loop = None
-        self._lock_thread = None
-
-        if loop is None:
-            return
-
-        if loop.is_running():
-            loop.call_soon_threadsafe(loop.stop)
-            if thread and thread.is_alive():
-                thread.join(timeout=1)
-
-        if not loop.is_closed():
-            loop.close()
+        """No-op kept for compatibility; the lock owns no threads or loops."""
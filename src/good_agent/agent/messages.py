@@ -7,12 +7,14 @@ replacing, filtering, and system message management.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import threading
 import warnings
-from collections.abc import Coroutine
+from collections.abc import Coroutine, Iterator
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 
+from good_agent.agent.locking import current_owner_id
 from good_agent.core.event_router import EventContext
 from good_agent.core.types import URL
 from good_agent.events import AgentEvents, MessageAppendBeforeParams
@@ -40,32 +42,45 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
-class MessageManager:
-    """Manages message list operations, filtering, and validation.
+class _BlockingBridge:
+    """Process-wide event loop thread that runs coroutines for synchronous callers.
 
-    This manager centralizes all message-related functionality that was
-    previously scattered throughout the Agent class.
+    Started lazily and shared by every agent, so a blocking call costs one
+    cross-thread hand-off instead of a new thread and event loop. Calls made
+    from the bridge thread itself (a sync API used inside a coroutine that is
+    already running on the bridge) get a one-off loop to avoid deadlocking.
     """
 
-    def __init__(self, agent: Agent):
-        """Initialize MessageManager with agent reference.
-
-        Args:
-            agent: The agent instance this manager belongs to
-        """
-
-        self.agent = agent
-        self._blocking_loop: asyncio.AbstractEventLoop | None = None
-        self._blocking_thread: threading.Thread | None = None
-
-    def __del__(self) -> None:
-        try:
-            self.shutdown_blocking_loop()
-        except Exception:
-            # Avoid raising during garbage collection
-            pass
-
-    def _run_blocking(self, coro: Coroutine[Any, Any, T]) -> T:
+    _lock = threading.Lock()
+    _loop: asyncio.AbstractEventLoop | None = None
+    _thread: threading.Thread | None = None
+
+    @classmethod
+    def _ensure_loop(cls) -> asyncio.AbstractEventLoop:
+        with cls._lock:
+            loop = cls._loop
+            if loop is None or loop.is_closed():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+                loop.call_soon(started.set)
+                thread = threading.Thread(
+                    target=loop.run_forever, name="AgentBlockingBridge", daemon=True
+                )
+                thread.start()
+                started.wait()
+                cls._loop = loop
+                cls._thread = thread
+            return loop
+
+    @classmethod
+    def run(cls, coro: Coroutine[Any, Any, T]) -> T:
+        if threading.current_thread() is cls._thread:
+            return cls._run_in_new_thread(coro)
+        loop = cls._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    @staticmethod
+    def _run_in_new_thread(coro: Coroutine[Any, Any, T]) -> T:
         result: list[T] = []
         error: list[BaseException] = []
 
@@ -84,10 +99,53 @@ class MessageManager:
 
         return result[0]
 
+
+class MessageManager:
+    """Manages message list operations, filtering, and validation.
+
+    This manager centralizes all message-related functionality that was
+    previously scattered throughout the Agent class.
+    """
+
+    def __init__(self, agent: Agent):
+        """Initialize MessageManager with agent reference.
+
+        Args:
+            agent: The agent instance this manager belongs to
+        """
+
+        self.agent = agent
+
+    def _run_blocking(self, coro: Coroutine[Any, Any, T]) -> T:
+        return _BlockingBridge.run(coro)
+
     def shutdown_blocking_loop(self) -> None:
-        # No persistent loop to shutdown with per-call asyncio.run
-        self._blocking_loop = None
-        self._blocking_thread = None
+        # The blocking bridge loop is shared process-wide and outlives individual agents
+        pass
+
+    @contextlib.contextmanager
+    def _sync_state_guard(self, event: AgentEvents) -> Iterator[bool]:
+        """Hold the state lock synchronously when ``event`` has only sync handlers.
+
+        Yields ``False`` without taking the lock when an async handler is
+        registered or another owner holds the lock; callers then fall back to
+        running the async variant through ``_run_blocking``.
+        """
+        handlers = self.agent._get_sorted_handlers(event)
+        if any(h.is_async for h in handlers):
+            yield False
+            return
+
+        lock = self.agent.state_lock
+        owner_id = current_owner_id()
+        if not lock.try_acquire(owner_id):
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            lock.release_nowait(owner_id)
 
     @property
     def messages(self) -> MessageList[Message]:
@@ -97,20 +155,17 @@ class MessageManager:
     @property
     def user(self) -> FilteredMessageList[UserMessage]:
         """Filter messages to only user messages."""
-        filtered = self.messages.filter(role="user")
-        return FilteredMessageList(self.agent, "user", filtered)
+        return FilteredMessageList(self.agent, "user")
 
     @property
     def assistant(self) -> FilteredMessageList[AssistantMessage]:
         """Filter messages to only assistant messages."""
-        filtered = self.messages.filter(role="assistant")
-        return FilteredMessageList(self.agent, "assistant", filtered)
+        return FilteredMessageList(self.agent, "assistant")
 
     @property
     def tool(self) -> FilteredMessageList[ToolMessage]:
         """Filter messages to only tool messages."""
-        filtered = self.messages.filter(role="tool")
-        return FilteredMessageList(self.agent, "tool", filtered)
+        return FilteredMessageList(self.agent, "tool")
 
     def _prepare_message(
         self,
@@ -153,8 +208,7 @@ class MessageManager:
     @property
     def system(self) -> FilteredMessageList[SystemMessage]:
         """Filter messages to only system messages."""
-        filtered = self.messages.filter(role="system")
-        return FilteredMessageList(self.agent, "system", filtered)
+        return FilteredMessageList(self.agent, "system")
 
     async def _append_message(self, message: Message) -> Message:
         """Append a message with interception support.
@@ -182,29 +236,51 @@ class MessageManager:
                 )
             )
 
-            replacement = ctx.return_value
-            if replacement is None:
-                out = ctx.output
-                if isinstance(out, Message):
-                    replacement = out
+            return self._commit_append(message, ctx)
 
-            if replacement is not None:
-                message = replacement
-                message._set_agent(self.agent)
+    def _append_message_sync(self, message: Message) -> Message:
+        """Synchronous ``_append_message`` for use under ``_sync_state_guard``."""
+        message._set_agent(self.agent)
 
-            # Add to message list
-            self.agent._messages.append(message)
+        ctx: EventContext[MessageAppendBeforeParams, Message | None] = self.agent.events.typed(
+            MessageAppendBeforeParams, Message
+        ).apply_sync(
+            AgentEvents.MESSAGE_APPEND_BEFORE,
+            message=message,
+            agent=self.agent,
+            output=message,
+        )
 
-            # Store in global message store
-            put_message(message)
+        return self._commit_append(message, ctx)
 
-            # Update version
-            self.agent._update_version()
+    def _commit_append(
+        self,
+        message: Message,
+        ctx: EventContext[MessageAppendBeforeParams, Message | None],
+    ) -> Message:
+        replacement = ctx.return_value
+        if replacement is None:
+            out = ctx.output
+            if isinstance(out, Message):
+                replacement = out
+
+        if replacement is not None:
+            message = replacement
+            message._set_agent(self.agent)
+
+        # Add to message list
+        self.agent._messages.append(message)
 
-            # Emit consistent MESSAGE_APPEND_AFTER event
-            self.agent.do(AgentEvents.MESSAGE_APPEND_AFTER, message=message, agent=self.agent)
+        # Store in global message store
+        put_message(message)
 
-            return message
+        # Update version
+        self.agent._update_version(appended=(message,))
+
+        # Emit consistent MESSAGE_APPEND_AFTER event
+        self.agent.do(AgentEvents.MESSAGE_APPEND_AFTER, message=message, agent=self.agent)
+
+        return message
 
     @overload
     async def append_async(self, content: Message) -> Message: ...
@@ -279,13 +355,7 @@ class MessageManager:
         """Set or update the system message under the Agent lock."""
 
         async with self.agent.state_guard():
-            if content:
-                message = self.agent.model.create_message(*content, role="system")
-
-            if not message:
-                raise ValueError("System message content is required")
-
-            message._set_agent(self.agent)
+            message = self._prepare_system_message(*content, message=message)
 
             ctx: EventContext[Any, SystemMessage] = await self.agent.events.typed(
                 return_type=SystemMessage
@@ -293,27 +363,44 @@ class MessageManager:
                 AgentEvents.MESSAGE_SET_SYSTEM_BEFORE, output=message, agent=self.agent
             )
 
-            if ctx.return_value is not None:
-                message = ctx.return_value
+            self._commit_system_message(message, ctx)
+
+    def _prepare_system_message(
+        self, *content: MessageContent, message: SystemMessage | None
+    ) -> SystemMessage:
+        if content:
+            message = self.agent.model.create_message(*content, role="system")
+
+        if not message:
+            raise ValueError("System message content is required")
+
+        message._set_agent(self.agent)
+        return message
+
+    def _commit_system_message(
+        self, message: SystemMessage, ctx: EventContext[Any, SystemMessage]
+    ) -> None:
+        if ctx.return_value is not None:
+            message = ctx.return_value
 
-            if self.agent._messages:
-                if isinstance(self.agent._messages[0], SystemMessage):
-                    self.agent._messages.replace_at(0, message)
-                else:
-                    self.agent._messages.prepend(message)
+        if self.agent._messages:
+            if isinstance(self.agent._messages[0], SystemMessage):
+                self.agent._messages.replace_at(0, message)
             else:
-                self.agent._messages.append(message)
+                self.agent._messages.prepend(message)
+        else:
+            self.agent._messages.append(message)
 
-            put_message(message)
+        put_message(message)
 
-            self.agent.do(AgentEvents.MESSAGE_SET_SYSTEM_AFTER, message=message, agent=self.agent)
+        self.agent.do(AgentEvents.MESSAGE_SET_SYSTEM_AFTER, message=message, agent=self.agent)
 
-            self.agent._update_version()
+        self.agent._update_version()
 
-            if self.agent.config.print_messages and message.role in (
-                self.agent.config.print_messages_role or [message.role]
-            ):
-                self.agent.print(message, mode=self.agent.config.print_messages_mode)
+        if self.agent.config.print_messages and message.role in (
+            self.agent.config.print_messages_role or [message.role]
+        ):
+            self.agent.print(message, mode=self.agent.config.print_messages_mode)
 
     def set_system_message(
         self,
@@ -322,6 +409,17 @@ class MessageManager:
     ) -> None:
         """Set or update the system message."""
 
+        with self._sync_state_guard(AgentEvents.MESSAGE_SET_SYSTEM_BEFORE) as guarded:
+            if guarded:
+                message = self._prepare_system_message(*content, message=message)
+                ctx: EventContext[Any, SystemMessage] = self.agent.events.typed(
+                    return_type=SystemMessage
+                ).apply_sync(
+                    AgentEvents.MESSAGE_SET_SYSTEM_BEFORE, output=message, agent=self.agent
+                )
+                self._commit_system_message(message, ctx)
+                return
+
         runner = self.set_system_message_async(*content, message=message)
         self._run_blocking(runner)
 
@@ -389,6 +487,11 @@ class MessageManager:
             *content_parts, role=role, context=context, citations=citations, **kwargs
         )
 
+        with self._sync_state_guard(AgentEvents.MESSAGE_APPEND_BEFORE) as guarded:
+            if guarded:
+                self._append_message_sync(message)
+                return
+
         self._run_blocking(self._append_message(message))
 
     def add_tool_response(
@@ -1356,6 +1356,17 @@ You are now operating in {mode_name} mode. Your responses should align with this
         self._ensure_no_pending_mode_change()
         self._pending_mode_exit = True
 
+    def _reset(self) -> None:
+        """Drop the mode stack, pending transitions and history without running exits.
+
+        Used when a pooled agent is recycled for a new conversation; registered
+        modes are kept.
+        """
+        self._mode_stack = ModeStack()
+        self._pending_mode_switch = None
+        self._pending_mode_exit = False
+        self._mode_history = []
+
     def has_pending_transition(self) -> bool:
         """Check if there's a pending mode switch or exit scheduled.
 
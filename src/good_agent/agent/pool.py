@@ -1,8 +1,13 @@
-from collections.abc import Iterator
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
 from typing import TYPE_CHECKING, overload
 
 if TYPE_CHECKING:
     from good_agent.agent.core import Agent
+    from good_agent.agent.state import ConversationSnapshot
+    from good_agent.messages import Message
 
 
 class AgentPool:
@@ -45,3 +50,146 @@ class AgentPool:
             Single agent or list of agents
         """
         return self._agents[index]
+
+
+class AgentPoolExhaustedError(TimeoutError):
+    """Raised when no pooled agent becomes available within the acquire timeout."""
+
+
+class WarmAgentPool:
+    """Bounded checkout pool of warm Agents for request-scoped workloads.
+
+    Unlike :class:`AgentPool`, agents are leased to one caller at a time. Each
+    slot is forked from the template once, on first use or during
+    :meth:`warm_up`, and then recycled: acquiring an agent swaps in the request's
+    conversation and releasing it restores the slot's starting state (messages,
+    context, modes and component state such as citations and usage), so
+    components, tools and config are built only once per slot.
+
+    When every agent is leased, :meth:`acquire` waits up to ``acquire_timeout``
+    seconds (forever when ``None``) and then raises
+    :class:`AgentPoolExhaustedError`.
+
+    Example:
+        >>> pool = WarmAgentPool(lambda: template, size=4)
+        >>> await pool.warm_up()
+        >>> async with pool.lease([UserMessage("Hi")]) as agent:
+        ...     response = await agent.call()
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Agent],
+        size: int = 4,
+        *,
+        acquire_timeout: float | None = None,
+    ):
+        """Configure the pool; no agents are created until first use or ``warm_up``.
+
+        Args:
+            factory: Returns the template Agent each slot is forked from
+            size: Maximum number of agents, and therefore concurrent leases
+            acquire_timeout: Seconds to wait for a free agent before failing
+        """
+        if size < 1:
+            raise ValueError("WarmAgentPool size must be at least 1")
+        self._factory = factory
+        self._size = size
+        self._acquire_timeout = acquire_timeout
+        self._slots = asyncio.Semaphore(size)
+        self._idle: deque[Agent] = deque()
+        self._baselines: dict[int, ConversationSnapshot] = {}
+        self._leased: set[int] = set()
+        self._building = 0
+
+    @property
+    def size(self) -> int:
+        """Maximum number of pooled agents."""
+        return self._size
+
+    @property
+    def created(self) -> int:
+        """Number of agents built so far."""
+        return len(self._baselines)
+
+    @property
+    def in_use(self) -> int:
+        """Number of agents currently leased."""
+        return len(self._leased)
+
+    async def warm_up(self, count: int | None = None) -> None:
+        """Build up to ``count`` agents (default: the full pool) ahead of traffic.
+
+        Each build holds a slot like a lease does, so warming up while requests
+        are acquiring agents never builds more than ``size`` agents.
+        """
+        target = min(self._size if count is None else count, self._size)
+        while self.created + self._building < target:
+            async with self._slots:
+                if self.created + self._building >= target:
+                    break
+                self._idle.append(await self._create())
+
+    async def _create(self) -> Agent:
+        # Counted before the first await so concurrent builders see the reservation
+        self._building += 1
+        try:
+            template = self._factory()
+            agent = await template._fork_with_messages(list(template.messages))
+            await agent.initialize()
+            baseline = agent._snapshot_conversation()
+            self._baselines[id(agent)] = baseline
+            # Forked components can share state with the template (e.g. the citation
+            # index); restoring gives the slot its own copy before the first lease
+            agent._reset_conversation(baseline)
+            return agent
+        finally:
+            self._building -= 1
+
+    async def acquire(self, messages: Sequence[Message] | None = None) -> Agent:
+        """Lease an agent whose conversation is ``messages`` (template messages if None)."""
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self._acquire_timeout)
+        except TimeoutError as e:
+            raise AgentPoolExhaustedError(
+                f"No agent available after {self._acquire_timeout}s "
+                f"({self._size} of {self._size} in use)"
+            ) from e
+
+        try:
+            agent = self._idle.popleft() if self._idle else await self._create()
+            if messages is not None:
+                agent._reset_conversation(self._baselines[id(agent)], messages)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._leased.add(id(agent))
+        return agent
+
+    def release(self, agent: Agent) -> None:
+        """Return a leased agent, restoring its starting state."""
+        if id(agent) not in self._leased:
+            raise ValueError("Agent is not leased from this pool")
+        self._leased.discard(id(agent))
+        try:
+            agent._reset_conversation(self._baselines[id(agent)])
+            self._idle.append(agent)
+        finally:
+            self._slots.release()
+
+    @contextlib.asynccontextmanager
+    async def lease(self, messages: Sequence[Message] | None = None) -> AsyncIterator[Agent]:
+        """Context manager pairing :meth:`acquire` with :meth:`release`."""
+        agent = await self.acquire(messages)
+        try:
+            yield agent
+        finally:
+            self.release(agent)
+
+    async def close(self) -> None:
+        """Close idle agents; leased agents are closed by their holders."""
+        while self._idle:
+            agent = self._idle.popleft()
+            self._baselines.pop(id(agent), None)
+            await agent.close()
@@ -6,11 +6,14 @@ Manages agent state transitions and validation.
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 from enum import IntEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from good_agent.agent import Agent
+    from good_agent.core.components import AgentComponent
+    from good_agent.messages import Message
 
 
 class AgentState(IntEnum):
@@ -37,6 +40,15 @@ STATE_FLOWS = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class ConversationSnapshot:
+    """Conversation-scoped agent state, restored by ``Agent._reset_conversation``."""
+
+    messages: tuple[Message, ...]
+    context: tuple[dict[str, Any], ...]
+    components: tuple[tuple[AgentComponent, Any], ...]
+
+
 class AgentStateMachine:
     """Manages agent state transitions and validation."""
 
@@ -1,5 +1,6 @@
 """ToolExecutor manages tool execution, parallel invocation, and pending tool call resolution."""
 
+import asyncio
 import contextlib
 import logging
 from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
@@ -10,7 +11,7 @@ from ulid import ULID
 
 from good_agent.core.event_router import EventContext
 from good_agent.events import AgentEvents
-from good_agent.messages import AssistantMessage, ToolMessage
+from good_agent.messages import ToolMessage
 from good_agent.tools import (
     BoundTool,
     Tool,
@@ -44,6 +45,8 @@ class ToolExecutor:
             agent: Parent Agent instance
         """
         self.agent = agent
+        self._started: dict[str, asyncio.Task[ToolMessage]] = {}
+        self._limit: tuple[int, asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
 
     async def _apply_tool_event(self, *args: Any, **kwargs: Any):
         apply_fn = getattr(getattr(self.agent, "events", None), "apply", None)
@@ -53,6 +56,12 @@ class ToolExecutor:
             return None
         return await apply_fn(*args, **kwargs)
 
+    def _config_value(self, key: str, default: Any = None) -> Any:
+        config = getattr(self.agent, "config", None)
+        if config is None:
+            return default
+        return config.get(key, default)
+
     def _format_tool_message_content(self, tool_response: ToolResponse) -> str:
         """Render tool responses into message content strings."""
 
@@ -125,6 +134,47 @@ class ToolExecutor:
         Returns:
             ToolResponse with execution result
         """
+        tool_response, tool_call = await self._execute_invocation(
+            tool,
+            tool_name=tool_name,
+            tool_call_id=tool_call_id,
+            hide=hide,
+            **parameters,
+        )
+
+        # Add assistant message with tool call if not skipped
+        if not skip_assistant_message:
+            assistant_message = self.agent.model.create_message(
+                content="",
+                role="assistant",
+                tool_calls=[tool_call],
+            )
+            await self.agent.append_async(assistant_message)
+
+        # Create and add tool message
+        tool_message = self._create_tool_message(
+            tool_response,
+            tool_call_id=tool_call.id,
+            tool_name=tool_call.function.name,
+        )
+        await self.agent.append_async(tool_message)
+
+        return tool_response
+
+    async def _execute_invocation(
+        self,
+        tool: Tool | Callable | str,
+        *,
+        tool_name: str | None = None,
+        tool_call_id: str | None = None,
+        hide: list[str] | None = None,
+        **parameters: Any,
+    ) -> tuple[ToolResponse, ToolCall]:
+        """Run a tool and fire its ``TOOL_CALL_*`` events without touching the message list.
+
+        Returns:
+            Tuple of (final ToolResponse, ToolCall describing the visible parameters)
+        """
         # Render any Template parameters with agent context
         rendered_params = await self.agent._render_template_parameters(parameters)
 
@@ -194,8 +244,9 @@ class ToolExecutor:
             execution_params.pop("_agent", None)
             execution_params.pop("_tool_call", None)
 
-            result = await resolved_tool(
-                **execution_params, _agent=self.agent, _tool_call=tool_call
+            result = await self._await_with_timeout(
+                resolved_tool(**execution_params, _agent=self.agent, _tool_call=tool_call),
+                resolved_name,
             )
 
             # Handle different return types
@@ -262,26 +313,7 @@ class ToolExecutor:
                 tool_response=tool_response,
             )
 
-        # Add assistant message with tool call if not skipped
-        if not skip_assistant_message:
-            assistant_message = self.agent.model.create_message(
-                content="",
-                role="assistant",
-                tool_calls=[tool_call],
-            )
-            await self.agent.append_async(assistant_message)
-
-        # Create and add tool message
-        tool_message = self.agent.model.create_message(
-            content=self._format_tool_message_content(tool_response),
-            tool_call_id=tool_call_id,
-            tool_name=resolved_name,
-            tool_response=tool_response,
-            role="tool",
-        )
-        await self.agent.append_async(tool_message)
-
-        return tool_response
+        return tool_response, tool_call
 
     async def invoke_many(
         self,
@@ -390,16 +422,21 @@ class ToolExecutor:
                     if is_bound:
                         # Route through bound invoke_func helper so hidden params merge properly
                         bound_callable = cast(Callable[..., Awaitable[ToolResponse]], t)
-                        result = await bound_callable(
-                            **execution_params,
-                            _agent=self.agent,
-                            _from_invoke_many=True,
-                            _tool_call_id=tid,
-                            _tool_call=tc,
+                        result = await self._await_with_timeout(
+                            bound_callable(
+                                **execution_params,
+                                _agent=self.agent,
+                                _from_invoke_many=True,
+                                _tool_call_id=tid,
+                                _tool_call=tc,
+                            ),
+                            tn,
                         )
                     else:
                         # Execute tool
-                        result = await t(**execution_params, _agent=self.agent, _tool_call=tc)
+                        result = await self._await_with_timeout(
+                            t(**execution_params, _agent=self.agent, _tool_call=tc), tn
+                        )
 
                     # Handle return types
                     if isinstance(result, ToolResponse):
@@ -456,8 +493,6 @@ class ToolExecutor:
         await self.agent.append_async(assistant_message)
 
         # Execute all tools in parallel
-        import asyncio
-
         results = await asyncio.gather(*tasks)
 
         # Add tool messages for all results (preserve tool_call_id ordering)
@@ -597,59 +632,159 @@ class ToolExecutor:
 
         return bound_invoke_many
 
-    async def resolve_pending_tool_calls(self) -> AsyncIterator[ToolMessage]:
+    async def resolve_pending_tool_calls(
+        self, *, concurrent: bool | None = None
+    ) -> AsyncIterator[ToolMessage]:
         """Find and execute all pending tool calls in conversation.
 
+        When ``concurrent`` is enabled (defaults to the ``concurrent_tool_calls``
+        config value) all pending calls start together, bounded by
+        ``max_tool_concurrency``. Otherwise calls run one at a time, except
+        that consecutive calls to MCP servers configured with ``pipeline`` are
+        pipelined over their sessions. Either way each server keeps at most
+        ``max_in_flight`` requests outstanding. Tool messages are
+        still appended and yielded in the order the calls appear in the
+        conversation.
+
+        Args:
+            concurrent: Override the agent's ``concurrent_tool_calls`` setting
+
         Yields:
             ToolMessage for each resolved tool call
         """
         pending = self.get_pending_tool_calls()
-        for tool_call in pending:
-            tool_name = tool_call.function.name
+        if concurrent is None:
+            concurrent = bool(self._config_value("concurrent_tool_calls", False))
 
-            if tool_name not in self.agent.tools:
-                logger.warning(f"Tool '{tool_name}' not found for pending tool call {tool_call.id}")
+        if concurrent and len(pending) > 1:
+            async for tool_message in self._resolve_concurrently(pending):
+                yield tool_message
+            return
 
-                # Create error response
-                tool_response = ToolResponse(
-                    tool_name=tool_name,
-                    tool_call_id=tool_call.id,
-                    response=None,
-                    parameters=tool_call.parameters,
-                    success=False,
-                    error=f"Tool '{tool_name}' not found",
-                )
+        index = 0
+        while index < len(pending):
+            batch = self._pipelined_batch(pending, index)
+            if len(batch) > 1:
+                async for tool_message in self._resolve_concurrently(batch):
+                    yield tool_message
+                index += len(batch)
+                continue
 
-                tool_response = await self._apply_tool_error(
-                    tool_name=tool_name,
-                    tool_call_id=tool_call.id,
-                    error=tool_response.error or "Tool not found",
-                    parameters=tool_call.parameters,
-                    tool_call=tool_call,
-                    tool_response=tool_response,
-                )
+            tool_message = await self._execute_pending_tool_call(pending[index])
+            await self.agent.append_async(tool_message)
+            yield tool_message
+            index += 1
 
-                # Create and add tool message for the error
-                tool_message = self.agent.model.create_message(
-                    content=self._format_tool_message_content(tool_response),
-                    tool_call_id=tool_call.id,
-                    tool_name=tool_name,
-                    tool_response=tool_response,
-                    role="tool",
-                )
-                self.agent.append(tool_message)
-                yield tool_message
-            else:
-                tool_response = await self.invoke(
-                    tool_name,
-                    tool_call_id=tool_call.id,
-                    skip_assistant_message=True,
-                    **tool_call.parameters,
-                )
+    def _pipelined_batch(self, pending: Sequence[ToolCall], start: int) -> Sequence[ToolCall]:
+        """Return the run of consecutive pipelined MCP tool calls starting at ``start``."""
+        from good_agent.mcp.adapter import MCPToolAdapter
 
-                tool_message = self.agent.tool[-1]
-                assert tool_message.tool_call_id == tool_call.id
+        end = start
+        while end < len(pending):
+            tool_name = pending[end].function.name
+            if tool_name not in self.agent.tools:
+                break
+            tool = self.agent.tools[tool_name]
+            if not isinstance(tool, MCPToolAdapter) or not tool.pipelined:
+                break
+            end += 1
+        return pending[start:end]
+
+    async def _resolve_concurrently(
+        self, pending: Sequence[ToolCall]
+    ) -> AsyncIterator[ToolMessage]:
+        """Run pending tool calls together and yield their messages in call order."""
+        tasks = [
+            asyncio.ensure_future(self._execute_pending_tool_call(tool_call))
+            for tool_call in pending
+        ]
+        try:
+            for task in tasks:
+                tool_message = await task
+                await self.agent.append_async(tool_message)
                 yield tool_message
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _limiter(self) -> asyncio.Semaphore | None:
+        """Semaphore applying ``max_tool_concurrency`` to every running call on this loop."""
+        limit = self._config_value("max_tool_concurrency")
+        if not limit:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._limit is None or self._limit[0] != limit or self._limit[1] is not loop:
+            self._limit = (limit, loop, asyncio.Semaphore(limit))
+        return self._limit[2]
+
+    async def _run_limited(self, tool_call: ToolCall) -> ToolMessage:
+        semaphore = self._limiter()
+        if semaphore is None:
+            return await self._run_pending_tool_call(tool_call)
+        async with semaphore:
+            return await self._run_pending_tool_call(tool_call)
+
+    def start_tool_call(self, tool_call: ToolCall) -> None:
+        """Begin executing a tool call before its AssistantMessage is appended.
+
+        Streaming uses this so a tool runs as soon as its arguments are complete.
+        The call counts against ``max_tool_concurrency`` like any other, and its
+        result is picked up (and appended) by ``resolve_pending_tool_calls``.
+        Callers must cancel calls they do not resolve (``cancel_started_tool_calls``).
+        """
+        if tool_call.id in self._started:
+            return
+        self._started[tool_call.id] = asyncio.ensure_future(self._run_limited(tool_call))
+
+    def cancel_started_tool_calls(self) -> None:
+        """Cancel tool calls started via ``start_tool_call`` that were never resolved."""
+        started, self._started = self._started, {}
+        for task in started.values():
+            task.cancel()
+
+    async def _execute_pending_tool_call(self, tool_call: ToolCall) -> ToolMessage:
+        """Execute a single pending tool call and build (but not append) its ToolMessage."""
+        task = self._started.pop(tool_call.id, None)
+        if task is not None:
+            return await task
+        return await self._run_limited(tool_call)
+
+    async def _run_pending_tool_call(self, tool_call: ToolCall) -> ToolMessage:
+        tool_name = tool_call.function.name
+
+        if tool_name not in self.agent.tools:
+            logger.warning(f"Tool '{tool_name}' not found for pending tool call {tool_call.id}")
+
+            # Create error response
+            tool_response = ToolResponse(
+                tool_name=tool_name,
+                tool_call_id=tool_call.id,
+                response=None,
+                parameters=tool_call.parameters,
+                success=False,
+                error=f"Tool '{tool_name}' not found",
+            )
+
+            tool_response = await self._apply_tool_error(
+                tool_name=tool_name,
+                tool_call_id=tool_call.id,
+                error=tool_response.error or "Tool not found",
+                parameters=tool_call.parameters,
+                tool_call=tool_call,
+                tool_response=tool_response,
+            )
+        else:
+            tool_response, _ = await self._execute_invocation(
+                tool_name,
+                tool_call_id=tool_call.id,
+                **tool_call.parameters,
+            )
+
+        return self._create_tool_message(
+            tool_response, tool_call_id=tool_call.id, tool_name=tool_name
+        )
 
     def record_invocation(
         self,
@@ -668,20 +803,7 @@ class ToolExecutor:
         visible_params = parameters or tool_response.parameters or {}
 
         if not skip_assistant_message:
-            existing_tool_call = False
-            for msg in reversed(self.agent._messages):
-                match msg:
-                    case AssistantMessage(tool_calls=tool_calls) if tool_calls:
-                        for tc in tool_calls:
-                            if tc.id == tool_call_id:
-                                existing_tool_call = True
-                                break
-                        if existing_tool_call:
-                            break
-                    case _:
-                        continue
-
-            if not existing_tool_call:
+            if tool_call_id not in self.agent._messages._tool_call_index().calls:
                 tool_call = ToolCall(
                     id=tool_call_id,
                     type="function",
@@ -794,24 +916,8 @@ class ToolExecutor:
         Returns:
             List of ToolCall objects that are pending execution
         """
-        from good_agent.messages import AssistantMessage, ToolMessage
-
-        pending_calls = []
-        resolved_call_ids = set()
-
-        # Collect all resolved tool call IDs
-        for msg in self.agent.messages:
-            if isinstance(msg, ToolMessage) and msg.tool_call_id:
-                resolved_call_ids.add(msg.tool_call_id)
-
-        # Find assistant messages with unresolved tool calls
-        for msg in self.agent.messages:
-            if isinstance(msg, AssistantMessage) and msg.tool_calls:
-                for tool_call in msg.tool_calls:
-                    if tool_call.id not in resolved_call_ids:
-                        pending_calls.append(tool_call)
-
-        return pending_calls
+        pending = self.agent.messages._tool_call_index().pending
+        return [tool_call for _, tool_call in pending.values()]
 
     def has_pending_tool_calls(self) -> bool:
         """Check if there are any pending tool calls.
@@ -819,10 +925,32 @@ class ToolExecutor:
         Returns:
             True if there are pending tool calls
         """
-        return len(self.get_pending_tool_calls()) > 0
+        return bool(self.agent.messages._tool_call_index().pending)
 
     # Helper methods
 
+    def _create_tool_message(
+        self, tool_response: ToolResponse, *, tool_call_id: str, tool_name: str
+    ) -> ToolMessage:
+        """Build the ToolMessage recording ``tool_response`` for ``tool_call_id``."""
+        return self.agent.model.create_message(
+            content=self._format_tool_message_content(tool_response),
+            tool_call_id=tool_call_id,
+            tool_name=tool_name,
+            tool_response=tool_response,
+            role="tool",
+        )
+
+    async def _await_with_timeout(self, awaitable: Awaitable[Any], tool_name: str) -> Any:
+        """Await a tool result, enforcing the ``tool_call_timeout`` config when set."""
+        timeout = self._config_value("tool_call_timeout")
+        if not timeout:
+            return await awaitable
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except TimeoutError as exc:
+            raise TimeoutError(f"Tool '{tool_name}' timed out after {timeout}s") from exc
+
     async def _apply_tool_error(
         self,
         *,
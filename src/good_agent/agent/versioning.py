@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING
 
 from ulid import ULID
@@ -13,6 +14,7 @@ from good_agent.messages.versioning import VersionManager
 
 if TYPE_CHECKING:
     from good_agent.agent import Agent
+    from good_agent.messages import Message
 
 logger = logging.getLogger(__name__)
 
@@ -38,12 +40,24 @@ class AgentVersioningManager:
         # Version ID (changes with each modification)
         self._version_id: ULID = create_monotonic_ulid()
 
-        # Version history (legacy - kept for backward compatibility)
-        self._versions: list[list[ULID]] = []
+        # Version history (legacy - kept for backward compatibility). Stored in a
+        # VersionManager so successive snapshots share structure.
+        self._history = VersionManager()
 
         # Low-level version manager
         self._version_manager = VersionManager()
 
+    @property
+    def _versions(self) -> Sequence[list[ULID]]:
+        """Legacy snapshot history as a list of message ID lists."""
+        return self._history._versions
+
+    @_versions.setter
+    def _versions(self, versions: Iterable[list[ULID]]) -> None:
+        self._history = VersionManager()
+        self._history._versions = versions
+        self._history._current_version_index = self._history.version_count - 1
+
     @property
     def version_id(self) -> ULID:
         """Agent's version identifier (changes with modifications)."""
@@ -87,8 +101,14 @@ class AgentVersioningManager:
 
         logger.debug(f"Agent {self.agent._id} reverted to version {version_index}")
 
-    def update_version(self) -> None:
-        """Update the agent's version ID when state changes."""
+    def update_version(self, appended: Sequence[Message] = ()) -> None:
+        """Update the agent's version ID when state changes.
+
+        Args:
+            appended: Messages just appended to the end of the conversation. When the
+                rest of the conversation matches the latest version, only these IDs
+                are recorded instead of snapshotting every message.
+        """
         old_version = self._version_id
         # Use monotonic ULID generation to ensure strict ordering
         # create_monotonic_ulid() ensures monotonic ordering even within the same millisecond
@@ -96,13 +116,19 @@ class AgentVersioningManager:
         self._version_id = create_monotonic_ulid()
 
         # Update version history
-        current_message_ids = [msg.id for msg in self.agent._messages]
-        self._versions.append(current_message_ids)
+        messages = self.agent._messages
+        previous_length = self._history.get_version_length(-1) if self._history.version_count else 0
+        if appended and previous_length + len(appended) == len(messages):
+            self._history.append_message_ids([msg.id for msg in appended])
+        else:
+            self._history.add_version([msg.id for msg in messages])
 
         # Emit agent:version:change event
         changes = {
-            "messages": len(self.agent._messages),
-            "last_version_messages": len(self._versions[-2]) if len(self._versions) > 1 else 0,
+            "messages": len(messages),
+            "last_version_messages": (
+                self._history.get_version_length(-2) if self._history.version_count > 1 else 0
+            ),
         }
         # @TODO: event naming
         self.agent.do(
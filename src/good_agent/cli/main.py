@@ -137,13 +137,26 @@ def serve(
     agent_path: str = typer.Argument(..., help="Path to the agent (e.g. module:agent_instance)"),
     host: str = typer.Option("127.0.0.1", "--host", "-h", help="Host to bind to"),
     port: int = typer.Option(8000, "--port", "-p", help="Port to bind to"),
+    pool_size: int = typer.Option(
+        4, "--pool-size", help="Number of warm agent instances serving requests"
+    ),
+    pool_timeout: float = typer.Option(
+        30.0, "--pool-timeout", help="Seconds to wait for a free agent before returning 503"
+    ),
 ):
     """
     Serve an agent as an OpenAI-compatible API.
     Pass extra arguments to the agent factory by appending them to the command.
     """
     extra_args = ctx.args
-    serve_agent(agent_path, host=host, port=port, extra_args=extra_args)
+    serve_agent(
+        agent_path,
+        host=host,
+        port=port,
+        extra_args=extra_args,
+        pool_size=pool_size,
+        acquire_timeout=pool_timeout,
+    )
 
 
 if __name__ == "__main__":
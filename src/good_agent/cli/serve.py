@@ -1,13 +1,16 @@
+import contextlib
 import sys
 import time
 import uuid
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
 from typing import Any
 
 # Optional dependencies check
 try:
     import uvicorn
     from fastapi import FastAPI, HTTPException
+    from fastapi.responses import StreamingResponse
 except ImportError:
     print("Error: 'fastapi' and 'uvicorn' are required for the 'serve' command.")
     print(
@@ -15,25 +18,30 @@ except ImportError:
     )
     sys.exit(1)
 
+import orjson
 from pydantic import BaseModel
 
 from good_agent.agent.core import Agent
+from good_agent.agent.pool import AgentPoolExhaustedError, WarmAgentPool
 from good_agent.cli.utils import load_agent_from_path
 from good_agent.messages import (
     AssistantMessage,
     SystemMessage,
+    ToolMessage,
     UserMessage,
 )
 from good_agent.messages import (
     Message as GAMessage,
 )
+from good_agent.model.protocols import StreamChunk
+from good_agent.tools import ToolCall, ToolCallFunction
 
 # --- OpenAI-compatible Models ---
 
 
 class ChatMessage(BaseModel):
     role: str
-    content: str | list[dict[str, Any]]
+    content: str | list[dict[str, Any]] | None = None
     name: str | None = None
     tool_calls: list[dict[str, Any]] | None = None
     tool_call_id: str | None = None
@@ -61,86 +69,216 @@ class ChatCompletionResponse(BaseModel):
     usage: dict[str, int] | None = None
 
 
+# --- Request/Response Mapping ---
+
+
+def _convert_tool_calls(tool_calls: list[dict[str, Any]]) -> list[ToolCall]:
+    converted = []
+    for tool_call in tool_calls:
+        function = tool_call.get("function") or {}
+        arguments = function.get("arguments", "{}")
+        if not isinstance(arguments, str):
+            arguments = orjson.dumps(arguments).decode("utf-8")
+        converted.append(
+            ToolCall(
+                id=tool_call.get("id") or f"call_{uuid.uuid4().hex}",
+                type=tool_call.get("type", "function"),
+                function=ToolCallFunction(name=function.get("name", ""), arguments=arguments),
+            )
+        )
+    return converted
+
+
+def _convert_messages(messages: list[ChatMessage]) -> list[GAMessage]:
+    """Map OpenAI chat messages (including tool calls and results) onto Good Agent messages."""
+    ga_messages: list[GAMessage] = []
+    tool_names: dict[str, str] = {}
+
+    for msg in messages:
+        content = msg.content or ""
+        if msg.role == "system":
+            ga_messages.append(SystemMessage(content=content))
+        elif msg.role == "user":
+            ga_messages.append(UserMessage(content=content))
+        elif msg.role == "assistant":
+            tool_calls = _convert_tool_calls(msg.tool_calls) if msg.tool_calls else None
+            for tool_call in tool_calls or ():
+                tool_names[tool_call.id] = tool_call.function.name
+            ga_messages.append(AssistantMessage(content=content, tool_calls=tool_calls))
+        elif msg.role == "tool":
+            tool_call_id = msg.tool_call_id or ""
+            ga_messages.append(
+                ToolMessage(
+                    content=content,
+                    tool_call_id=tool_call_id,
+                    tool_name=msg.name or tool_names.get(tool_call_id, ""),
+                )
+            )
+
+    return ga_messages
+
+
+def _usage_payload(messages: Iterable[AssistantMessage]) -> dict[str, int] | None:
+    """Sum OpenAI-style token usage over the LLM calls that produced ``messages``."""
+    payload: dict[str, int] = {}
+    for message in messages:
+        usage = message.usage
+        if usage is None:
+            continue
+        for key in ("prompt_tokens", "completion_tokens", "total_tokens"):
+            value = usage.get(key) if isinstance(usage, dict) else getattr(usage, key, None)
+            if isinstance(value, int):
+                payload[key] = payload.get(key, 0) + value
+    return payload or None
+
+
+def _finish_reason(message: AssistantMessage | None) -> str:
+    # Tool calls are executed on the server, so an assistant message that still
+    # asks for tools means the agent hit its iteration limit
+    return "length" if message is not None and message.tool_calls else "stop"
+
+
+def _sse(payload: dict[str, Any] | str) -> bytes:
+    data = payload if isinstance(payload, str) else orjson.dumps(payload).decode("utf-8")
+    return f"data: {data}\n\n".encode()
+
+
+async def _stream_completion(
+    pool: WarmAgentPool, agent: Agent, completion_id: str, model: str
+) -> AsyncIterator[bytes]:
+    """Run the agent in streaming mode and emit ``chat.completion.chunk`` SSE events.
+
+    Like the non-streaming path this runs the agent's full turn, executing its
+    tools on the server; content deltas from every LLM call are forwarded. The
+    leased agent is returned to the pool once the stream finishes or is cancelled.
+    """
+    created = int(time.time())
+
+    def chunk(delta: dict[str, Any], finish_reason: str | None = None, **extra: Any) -> bytes:
+        return _sse(
+            {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                **extra,
+            }
+        )
+
+    try:
+        yield chunk({"role": "assistant"})
+        responses: list[AssistantMessage] = []
+        try:
+            stream = agent.execute(streaming=True, stream_options={"include_usage": True})
+            async with contextlib.aclosing(stream):
+                async for item in stream:
+                    if isinstance(item, AssistantMessage):
+                        responses.append(item)
+                    elif isinstance(item, StreamChunk) and item.content:
+                        yield chunk({"content": item.content})
+        except Exception as e:
+            yield _sse(
+                {"error": {"message": f"Agent execution failed: {e}", "type": "server_error"}}
+            )
+        else:
+            final = responses[-1] if responses else None
+            yield chunk({}, _finish_reason(final), usage=_usage_payload(responses))
+        yield _sse("[DONE]")
+    finally:
+        pool.release(agent)
+
+
 # --- Server Implementation ---
 
 
-def create_app(agent_factory: Callable[[], Agent]) -> FastAPI:
-    """Create a FastAPI application exposing an OpenAI-compatible chat endpoint."""
-    app = FastAPI(title="Good Agent API", version="1.0.0")
+def create_app(
+    agent_factory: Callable[[], Agent],
+    *,
+    pool_size: int = 4,
+    acquire_timeout: float | None = 30.0,
+) -> FastAPI:
+    """Create a FastAPI application exposing an OpenAI-compatible chat endpoint.
+
+    Requests are served by a :class:`WarmAgentPool` of ``pool_size`` agents forked
+    from ``agent_factory()``; the pool is warmed up on startup. When every agent is
+    busy for longer than ``acquire_timeout`` seconds the request fails with 503.
+    """
+
+    def template_factory() -> Agent:
+        agent = agent_factory()
+        if not isinstance(agent, Agent):
+            raise TypeError("Factory did not return an Agent")
+        return agent
+
+    pool = WarmAgentPool(template_factory, size=pool_size, acquire_timeout=acquire_timeout)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        await pool.warm_up()
+        yield
+        await pool.close()
+
+    app = FastAPI(title="Good Agent API", version="1.0.0", lifespan=lifespan)
+    app.state.agent_pool = pool
 
     @app.post("/v1/chat/completions", response_model=ChatCompletionResponse)
     async def chat_completions(request: ChatCompletionRequest):
-        if request.stream:
-            raise HTTPException(status_code=501, detail="Streaming not yet supported")
-
-        # 1. Instantiate/Get Agent
-        # We assume agent_factory returns an Agent instance.
-        # Ideally, we want a fresh scope.
-        # If it returns a fresh agent, great. If it returns a shared one, we fork it.
-        base_agent = agent_factory()
-        if not isinstance(base_agent, Agent):
-            raise HTTPException(
-                status_code=500,
-                detail="Server configuration error: Factory did not return an Agent",
-            )
+        # 1. Convert Messages
+        ga_messages = _convert_messages(request.messages)
 
-        # 2. Convert Messages
-        ga_messages: list[GAMessage] = []
-        for msg in request.messages:
-            if msg.role == "system":
-                ga_messages.append(SystemMessage(content=msg.content))
-            elif msg.role == "user":
-                ga_messages.append(UserMessage(content=msg.content))
-            elif msg.role == "assistant":
-                # TODO: Handle tool calls in history if needed
-                ga_messages.append(AssistantMessage(content=msg.content))
-            elif msg.role == "tool":
-                # TODO: Map tool messages correctly
-                pass
-
-        # 3. Fork Agent with History
-        # Use private method _fork_with_messages to get a fresh agent with this history
+        # 2. Lease a warm agent holding exactly this history
         try:
-            # If base_agent is fresh, we can just set messages?
-            # _fork_with_messages is designed to create a new agent from an existing one with new state.
-            # If the factory creates a NEW agent every time, we can just append messages.
-            # But we can't be sure. Safest is to use the fork mechanism if available,
-            # or just set the messages if we know it's fresh.
-            # Let's try to use _fork_with_messages on the instance.
-            request_agent = await base_agent._fork_with_messages(ga_messages)
+            request_agent = await pool.acquire(ga_messages)
+        except AgentPoolExhaustedError as e:
+            raise HTTPException(status_code=503, detail=str(e)) from e
+        except TypeError as e:
+            raise HTTPException(status_code=500, detail=f"Server configuration error: {e}") from e
         except Exception as e:
-            # Fallback if _fork_with_messages fails or isn't appropriate
-            # raise HTTPException(status_code=500, detail=f"Agent fork failed: {e}")
-
-            # Alternative: If we trust the factory returned a fresh agent
-            request_agent = base_agent
-            # Clear existing and add new?
-            # request_agent.messages.clear() # No clear method on MessageList?
-            # Let's rely on _fork_with_messages as it was seen in core.py
-            raise HTTPException(status_code=500, detail=f"Agent fork failed: {e}") from e
-
-        # 4. Run Agent
-        # We use call() for a single turn
+            raise HTTPException(status_code=500, detail=f"Agent setup failed: {e}") from e
+
+        completion_id = f"chatcmpl-{uuid.uuid4()}"
+        model = request.model or request_agent.config.model
+
+        if request.stream:
+            return StreamingResponse(
+                _stream_completion(pool, request_agent, completion_id, model),
+                media_type="text/event-stream",
+            )
+
+        # 3. Run Agent
+        # The full turn runs here, including the agent's own tool calls
+        responses: list[AssistantMessage] = []
         try:
-            response_message = await request_agent.call()
+            async for message in request_agent.execute():
+                if isinstance(message, AssistantMessage):
+                    responses.append(message)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Agent execution failed: {e}") from e
+        finally:
+            pool.release(request_agent)
+
+        if not responses:
+            raise HTTPException(
+                status_code=500, detail="Agent execution failed: no assistant response"
+            )
+        response_message = responses[-1]
 
-        # 5. Format Response
+        # 4. Format Response
         content = str(response_message.content) if response_message.content else ""
 
         choice = ChatCompletionResponseChoice(
             index=0,
             message=ChatMessage(role="assistant", content=content),
-            finish_reason="stop",
+            finish_reason=_finish_reason(response_message),
         )
 
         return ChatCompletionResponse(
-            id=f"chatcmpl-{uuid.uuid4()}",
+            id=completion_id,
             created=int(time.time()),
-            model=request.model or base_agent.config.model,
+            model=model,
             choices=[choice],
-            # usage=... # TODO: extract usage
+            usage=_usage_payload(responses),
         )
 
     return app
@@ -151,6 +289,8 @@ def serve_agent(
     host: str = "127.0.0.1",
     port: int = 8000,
     extra_args: list[str] | None = None,
+    pool_size: int = 4,
+    acquire_timeout: float | None = 30.0,
 ):
     """
     Serve an agent as an OpenAI-compatible API.
@@ -186,7 +326,7 @@ def serve_agent(
         return
 
     # Create App
-    app = create_app(agent_factory)
+    app = create_app(agent_factory, pool_size=pool_size, acquire_timeout=acquire_timeout)
 
     print(f"🚀 Serving agent '{agent_path}' on http://{host}:{port}")
     uvicorn.run(app, host=host, port=port)
@@ -144,9 +144,9 @@ class TemplateContentPart(BaseContentPart):
                 # Simple Jinja2 fallback with sandbox by default
                 from good_agent.core import templating
 
-                # Create sandboxed environment
-                env = templating.create_environment(use_sandbox=True)
-                template = env.from_string(self.template)
+                # Shared sandboxed environment
+                env = templating.default_environment(use_sandbox=True)
+                template = templating.compile_template(env, self.template)
                 rendered = template.render(**render_context)
         except Exception:
             # Re-raise template errors to make them fatal
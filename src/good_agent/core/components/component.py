@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import logging
 from abc import ABCMeta
+from collections.abc import Hashable
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from good_agent.core.components.tool_adapter import ToolAdapter, ToolAdapterRegistry
@@ -109,6 +110,18 @@ class AgentComponent(EventRouter, metaclass=AgentComponentType):
             adapter_clone.component = self
             self._tool_adapter_registry.register(adapter_clone)
 
+    def _snapshot_state(self) -> Any:
+        """Capture state that accumulates over a conversation.
+
+        Pooled agents take a snapshot once per slot and pass it to
+        ``_restore_state`` between requests, so each request starts from the
+        same component state. The default component keeps no such state.
+        """
+        return None
+
+    def _restore_state(self, state: Any) -> None:
+        """Return to a snapshot taken by ``_snapshot_state``."""
+
     def clone(self: T_AgentComponent) -> T_AgentComponent:
         args, kwargs = self._clone_init_args()
         try:
@@ -215,6 +228,7 @@ class AgentComponent(EventRouter, metaclass=AgentComponentType):
                             event,
                             priority=config["priority"],
                             predicate=config.get("predicate"),
+                            pure=config.get("pure", False),
                         )(bound_method)
             except Exception:
                 # Skip any attributes that can't be accessed
@@ -315,6 +329,7 @@ class AgentComponent(EventRouter, metaclass=AgentComponentType):
             adapter: The tool adapter to register
         """
         self._tool_adapter_registry.register(adapter)
+        self._invalidate_tool_definitions()
 
         # If already installed on an agent, set up handlers
         # if self._agent is not None and not hasattr(self, "_adapter_handlers_setup"):
@@ -328,8 +343,24 @@ class AgentComponent(EventRouter, metaclass=AgentComponentType):
             adapter: The tool adapter to unregister
         """
         self._tool_adapter_registry.unregister(adapter)
+        self._invalidate_tool_definitions()
+
+    def _invalidate_tool_definitions(self) -> None:
+        """Drop the agent's cached tool definitions after adapter or state changes."""
+        coordinator = getattr(self._agent, "_llm_coordinator", None)
+        if coordinator is not None:
+            coordinator.invalidate_tool_definitions()
+
+    def render_cache_key(self) -> Hashable:
+        """Describe component state that this component's render handlers read.
+
+        The message formatter reuses cached LLM payloads only while every
+        component returns the same key. Override this when a ``pure=True``
+        MESSAGE_RENDER_* handler depends on component state.
+        """
+        return None
 
-    @on(AgentEvents.TOOLS_GENERATE_SIGNATURE, priority=200)
+    @on(AgentEvents.TOOLS_GENERATE_SIGNATURE, priority=200, pure=True)
     def _on_tools_generate_signature_adapter(
         self, ctx: EventContext[ToolsGenerateSignature, ToolSignature]
     ):
@@ -378,7 +409,7 @@ class AgentComponent(EventRouter, metaclass=AgentComponentType):
             ctx.output = adapted_params
 
     @on(AgentEvents.MESSAGE_APPEND_BEFORE, priority=50)
-    async def _on_message_append_before_adapter(self, ctx: EventContext):
+    def _on_message_append_before_adapter(self, ctx: EventContext):
         """Handle response adaptation before tool messages are appended."""
 
         if not self.enabled or not self._tool_adapter_registry._adapters:
@@ -439,3 +470,4 @@ class AgentComponent(EventRouter, metaclass=AgentComponentType):
             else:
                 # Unregister tools when disabling
                 self._unregister_component_tools()
+            self._invalidate_tool_definitions()
@@ -26,6 +26,7 @@ from good_agent.core.event_router.protocols import (
 from good_agent.core.event_router.registration import (
     HandlerRegistration,
     HandlerRegistry,
+    is_coroutine_handler,
 )
 from good_agent.core.event_router.sync_bridge import SyncBridge
 
@@ -102,6 +103,7 @@ class EventRouter:
                             event,
                             priority=config["priority"],
                             predicate=config.get("predicate"),
+                            pure=config.get("pure", False),
                         )(bound_method)
             except Exception as e:
                 # Skip any attributes that can't be accessed
@@ -440,12 +442,16 @@ class EventRouter:
         event: EventName,
         priority: int = 100,
         predicate: Callable[..., bool] | None = None,
+        pure: bool = False,
     ) -> Callable[[F], F]:
         """Register a handler for ``event`` with optional priority and predicate.
 
         The handler ID is attached to the returned function as `_handler_id` attribute,
         which can be used with `deregister()` to remove the handler.
 
+        Set ``pure=True`` when the handler (and its predicate) only depend on the
+        event parameters; see ``HandlerRegistration.pure``.
+
         See ``examples/event_router/basic_usage.py`` for typical patterns.
         """
 
@@ -465,6 +471,7 @@ class EventRouter:
                 handler=handler_callable,
                 priority=priority,
                 predicate=predicate,
+                pure=pure,
             )
             # Attach handler ID to function for later deregistration
             attr_target._handler_id = handler_id  # type: ignore[attr-defined]
@@ -472,10 +479,18 @@ class EventRouter:
 
         return decorator
 
-    def _get_sorted_handlers(self, event: EventName) -> list[HandlerRegistration]:
+    def _get_sorted_handlers(self, event: EventName) -> tuple[HandlerRegistration, ...]:
         """Return handlers ordered by priority (includes broadcast targets)."""
         return self._handler_registry.get_sorted_handlers(event)
 
+    def has_subscribers(self, event: EventName) -> bool:
+        """Return True when dispatching ``event`` would run a handler or emit a trace.
+
+        Callers on hot paths can check this first and skip building event
+        parameters entirely when nobody is listening.
+        """
+        return self._event_trace or self._handler_registry.has_handlers(event)
+
     def _should_run_handler(self, registration: HandlerRegistration, ctx: EventContext) -> bool:
         """Check if handler should run based on predicate result."""
         return self._handler_registry.should_run_handler(registration, ctx)
@@ -498,25 +513,25 @@ class EventRouter:
     def _is_async_handler(self, handler: Callable[..., Any]) -> bool:
         """Detect coroutine functions, including bound methods."""
 
-        return inspect.iscoroutinefunction(handler) or (
-            inspect.ismethod(handler) and inspect.iscoroutinefunction(handler.__func__)  # type: ignore[attr-defined]
-        )
+        return is_coroutine_handler(handler)
 
     def do(self, event: EventName, **kwargs):
         """Dispatch event handlers without waiting for completion."""
 
+        # Get all handlers
+        handlers = self._get_sorted_handlers(event)
+        if not handlers and not self._event_trace:
+            return
+
         # Create context with timestamp
         ctx: EventContext = EventContext(parameters=kwargs, invocation_timestamp=time.time())
         ctx.event = event
 
-        # Get all handlers
-        handlers = self._get_sorted_handlers(event)
-
         # Log event dispatch
         self._log_event(event, "do", kwargs, len(handlers))
 
         # Check if we have any async handlers
-        has_async = any(self._is_async_handler(h.handler) for h in handlers)
+        has_async = any(h.is_async for h in handlers)
 
         if not has_async:
             # All sync - run directly
@@ -541,7 +556,7 @@ class EventRouter:
                     if not self._should_run_handler(registration, ctx):
                         continue
                     handler = registration.handler
-                    is_async_handler = self._is_async_handler(handler)
+                    is_async_handler = registration.is_async
                     try:
                         if is_async_handler:
                             await handler(ctx)
@@ -586,22 +601,28 @@ class EventRouter:
                 "Use 'await router.apply_async()' instead for nested event dispatch."
             )
 
+        handlers = self._get_sorted_handlers(event)
         ctx: EventContext[dict[str, Any], Any] = EventContext(
-            parameters=kwargs, invocation_timestamp=time.time()
+            parameters=kwargs, invocation_timestamp=time.time(), event=event
         )
-        ctx.event = event
+        if not handlers and not self._event_trace:
+            # Nobody is listening: skip the contextvar, timing and trace bookkeeping
+            return ctx
+
+        start_time = time.perf_counter()
         token = event_ctx.set(ctx)
         sync_exception_to_raise: BaseException | None = None
 
         try:
-            handlers = self._get_sorted_handlers(event)
+            # Log event start
+            self._log_event(event, "apply_sync", kwargs, len(handlers))
 
             for registration in handlers:
                 if not self._should_run_handler(registration, ctx):
                     continue
 
                 handler = registration.handler
-                is_async_handler = self._is_async_handler(handler)
+                is_async_handler = registration.is_async
                 try:
                     if is_async_handler:
                         result = self._sync_bridge.run_coroutine_from_sync(
@@ -646,6 +667,18 @@ class EventRouter:
         finally:
             event_ctx.reset(token)
 
+            # Log event completion with timing
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            self._log_event(
+                event,
+                "apply_sync",
+                kwargs,
+                len(handlers),
+                duration_ms=duration_ms,
+                result=ctx.output,
+                error=ctx.exception,
+            )
+
         if (
             sync_exception_to_raise is not None
             and not ctx.stopped_with_exception
@@ -662,6 +695,11 @@ class EventRouter:
         Returns context with results.
         """
 
+        handlers = self._get_sorted_handlers(event)
+        if not handlers and not self._event_trace:
+            # Nobody is listening: skip the contextvar, timing and trace bookkeeping
+            return EventContext(parameters=kwargs, invocation_timestamp=time.time(), event=event)
+
         start_time = time.perf_counter()
 
         ctx: EventContext[dict[str, Any], Any] = EventContext(
@@ -671,8 +709,6 @@ class EventRouter:
         token = event_ctx.set(ctx)
 
         try:
-            handlers = self._get_sorted_handlers(event)
-
             # Log event start
             self._log_event(event, "apply_async", kwargs, len(handlers))
 
@@ -681,7 +717,7 @@ class EventRouter:
                     continue
 
                 handler = registration.handler
-                is_async_handler = self._is_async_handler(handler)
+                is_async_handler = registration.is_async
                 try:
                     if is_async_handler:
                         result = await handler(ctx)
@@ -739,11 +775,21 @@ class EventRouter:
         ``examples/event_router/basic_usage.py`` for a complete sample.
         """
 
-        start_time = time.perf_counter()
-
         # Extract output if provided (don't remove from kwargs)
         initial_output = kwargs.get("output")
 
+        handlers = self._get_sorted_handlers(event)
+        if not handlers and not self._event_trace:
+            # Nobody is listening: the initial output is the result
+            idle: EventContext[T_Parameters, T_Return] = EventContext(
+                parameters=self._build_typed_parameters(params_type, kwargs),
+                output=initial_output,
+                event=event,
+            )
+            return idle
+
+        start_time = time.perf_counter()
+
         typed_params = self._build_typed_parameters(params_type, kwargs)
 
         # Create typed context
@@ -754,8 +800,6 @@ class EventRouter:
         token = event_ctx.set(ctx)
 
         try:
-            handlers = self._get_sorted_handlers(event)
-
             # Log event start
             self._log_event(event, "apply_typed", kwargs, len(handlers))
 
@@ -764,7 +808,7 @@ class EventRouter:
                     continue
 
                 handler = registration.handler
-                is_async_handler = self._is_async_handler(handler)
+                is_async_handler = registration.is_async
                 try:
                     if is_async_handler:
                         result = await handler(ctx)
@@ -815,11 +859,21 @@ class EventRouter:
     ) -> EventContext[T_Parameters, T_Return]:
         """Synchronous counterpart to ``apply_typed``."""
 
-        start_time = time.perf_counter()
-
         # Extract output if provided (don't remove from kwargs)
         initial_output = kwargs.get("output")
 
+        handlers = self._get_sorted_handlers(event)
+        if not handlers and not self._event_trace:
+            # Nobody is listening: the initial output is the result
+            idle: EventContext[T_Parameters, T_Return] = EventContext(
+                parameters=self._build_typed_parameters(params_type, kwargs),
+                output=initial_output,
+                event=event,
+            )
+            return idle
+
+        start_time = time.perf_counter()
+
         typed_params = self._build_typed_parameters(params_type, kwargs)
 
         # Create typed context
@@ -830,8 +884,6 @@ class EventRouter:
         token = event_ctx.set(ctx)
 
         try:
-            handlers = self._get_sorted_handlers(event)
-
             # Log event start
             self._log_event(event, "apply_typed_sync", kwargs, len(handlers))
 
@@ -842,7 +894,7 @@ class EventRouter:
                 handler = registration.handler
                 try:
                     # Only run sync handlers in sync mode
-                    if self._is_async_handler(handler):
+                    if registration.is_async:
                         continue  # Skip async handlers
 
                     result = handler(ctx)
@@ -44,12 +44,14 @@ def on(
     *events: EventName,
     priority: int = 100,
     predicate: Callable[[EventContext], bool] | None = None,
+    pure: bool = False,
 ) -> Callable[[F], F]:
     """Attach event metadata used by EventRouter/Agent auto-registration.
 
     Methods decorated with ``@on`` must accept an ``EventContext`` and will be
-    subscribed with the given priority/predicate. Usage is shown in
-    ``examples/events/basic_events.py``.
+    subscribed with the given priority/predicate. Pass ``pure=True`` when the
+    handler's effect depends only on the event parameters, so callers may reuse
+    earlier results. Usage is shown in ``examples/events/basic_events.py``.
     """
 
     def decorator(fn: F) -> F:
@@ -59,6 +61,7 @@ def on(
             "events": events,
             "priority": priority,
             "predicate": predicate,
+            "pure": pure,
         }
         return fn
 
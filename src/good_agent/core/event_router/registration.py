@@ -11,7 +11,8 @@ CONTENTS:
 - current_test_nodeid: Context variable for pytest integration
 
 THREAD SAFETY: All handler registration operations are protected by threading.RLock
-to ensure safe concurrent access during registration and dispatch.
+to ensure safe concurrent access during registration and dispatch. Handler lookup
+reads precompiled, generation-stamped tuples without taking the lock.
 """
 
 from __future__ import annotations
@@ -19,8 +20,10 @@ from __future__ import annotations
 import collections
 import contextvars
 import enum
+import inspect
 import logging
 import threading
+import weakref
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
@@ -42,6 +45,8 @@ class HandlerRegistration:
     Attributes:
         handler: The callable handler function or method
         predicate: Optional condition function that determines if handler should execute
+        is_async: Whether the handler is a coroutine function
+        pure: Whether the handler's effect depends only on the event parameters
     """
 
     handler: Callable[..., Any]
@@ -50,6 +55,23 @@ class HandlerRegistration:
     predicate: Callable[[EventContext], bool] | None = None
     """Optional predicate function for conditional execution."""
 
+    is_async: bool = False
+    """Whether the handler is a coroutine function, computed once at registration."""
+
+    pure: bool = False
+    """Declares that the handler's effect depends only on the event parameters.
+
+    Callers may memoize the outcome of an event whose handlers are all pure and
+    skip dispatch while the parameters are unchanged.
+    """
+
+
+def is_coroutine_handler(handler: Callable[..., Any]) -> bool:
+    """Detect coroutine functions, including bound methods."""
+    return inspect.iscoroutinefunction(handler) or (
+        inspect.ismethod(handler) and inspect.iscoroutinefunction(handler.__func__)
+    )
+
 
 class LifecyclePhase(enum.Flag):
     """Phases in method lifecycle for @emit decorator.
@@ -112,6 +134,12 @@ class HandlerRegistry:
 
     Higher priority values execute first. Within a priority level, handlers
     execute in registration order.
+
+    Lookups are served from a per-event table of precompiled handler tuples
+    (including broadcast targets). Each entry is stamped with ``_generation``;
+    registration, deregistration and broadcast linking bump the generation here
+    and in every registry that broadcasts to this one, so stale tables are never
+    returned.
     """
 
     def __init__(self, debug: bool = False):
@@ -140,12 +168,40 @@ class HandlerRegistry:
         self._handler_map: dict[int, tuple[EventName, EventPriority, HandlerRegistration]] = {}
         """Mapping from handler ID to (event, priority, registration) for deregistration."""
 
+        self._generation: int = 0
+        """Bumped whenever dispatch order may change here or in a broadcast target."""
+
+        self._compiled: dict[EventName, tuple[int, tuple[HandlerRegistration, ...]]] = {}
+        """Per-event (generation, handlers) tables built by get_sorted_handlers()."""
+
+        self._sources: weakref.WeakSet[HandlerRegistry] = weakref.WeakSet()
+        """Registries that broadcast to this one and must see our changes."""
+
+    @property
+    def generation(self) -> int:
+        """Current dispatch table generation."""
+        return self._generation
+
+    def _invalidate(self) -> None:
+        """Bump the generation here and in every registry that broadcasts to us."""
+        pending: list[HandlerRegistry] = [self]
+        seen: set[int] = set()
+        while pending:
+            registry = pending.pop()
+            if id(registry) in seen:
+                continue
+            seen.add(id(registry))
+            registry._generation += 1
+            registry._compiled = {}
+            pending.extend(registry._sources)
+
     def register_handler(
         self,
         event: EventName,
         handler: Callable[..., Any],
         priority: EventPriority = 100,
         predicate: Callable[[EventContext], bool] | None = None,
+        pure: bool = False,
     ) -> int:
         """Register a handler for an event with thread safety.
 
@@ -158,6 +214,7 @@ class HandlerRegistry:
             handler: Callable handler function or method
             priority: Execution priority (higher = earlier, default: 100)
             predicate: Optional condition for handler execution
+            pure: Whether the handler's effect depends only on the event parameters
 
         Returns:
             Unique handler ID that can be used with deregister()
@@ -180,6 +237,7 @@ class HandlerRegistry:
                 ):
                     # Update predicate for existing handler
                     registration.predicate = predicate
+                    registration.pure = pure
                     if self._debug:
                         logger.debug(f"Updated predicate for {handler.__name__} on {event!r}")
                     return handler_id
@@ -188,9 +246,15 @@ class HandlerRegistry:
             handler_id = self._next_handler_id
             self._next_handler_id += 1
 
-            registration = HandlerRegistration(handler=handler, predicate=predicate)
+            registration = HandlerRegistration(
+                handler=handler,
+                predicate=predicate,
+                is_async=is_coroutine_handler(handler),
+                pure=pure,
+            )
             registrations.append(registration)
             self._handler_map[handler_id] = (event, priority, registration)
+            self._invalidate()
 
             if self._debug:
                 logger.debug(
@@ -231,14 +295,14 @@ class HandlerRegistry:
 
             # Remove from handler map
             del self._handler_map[handler_id]
+            self._invalidate()
             return True
 
     def get_sorted_handlers(
         self,
         event: EventName,
         include_broadcasts: bool = True,
-        _visited: set[int] | None = None,
-    ) -> list[HandlerRegistration]:
+    ) -> tuple[HandlerRegistration, ...]:
         """Get all handlers for an event, sorted by priority (high to low).
 
         This method returns handlers sorted by priority in descending order
@@ -250,14 +314,40 @@ class HandlerRegistry:
             include_broadcasts: Include handlers from broadcast targets
 
         Returns:
-            List of HandlerRegistration instances sorted by priority
+            Tuple of HandlerRegistration instances sorted by priority
 
-        THREAD SAFETY: Protected by self._lock for reading handler list
+        THREAD SAFETY: Compiled tables are read without locking; a table is
+        rebuilt under self._lock when its generation is stale.
         """
-        handlers: list[HandlerRegistration] = []
+        if not include_broadcasts:
+            return tuple(self._collect_handlers(event, include_broadcasts=False, _visited=set()))
+
+        compiled = self._compiled.get(event)
+        if compiled is not None and compiled[0] == self._generation:
+            return compiled[1]
 
-        if _visited is None:
-            _visited = set()
+        with self._lock:
+            generation = self._generation
+            handlers = tuple(self._collect_handlers(event, include_broadcasts=True, _visited=set()))
+            self._compiled[event] = (generation, handlers)
+        return handlers
+
+    def has_handlers(self, event: EventName) -> bool:
+        """Check whether any handler (wildcards and broadcast targets included) would run.
+
+        Served from the compiled dispatch table, so it is a lock-free read once the
+        event has been looked up.
+        """
+        return bool(self.get_sorted_handlers(event))
+
+    def _collect_handlers(
+        self,
+        event: EventName,
+        include_broadcasts: bool,
+        _visited: set[int],
+    ) -> list[HandlerRegistration]:
+        """Merge exact and wildcard handlers by priority, then append broadcast targets."""
+        handlers: list[HandlerRegistration] = []
 
         registry_id = id(self)
         if registry_id in _visited:
@@ -300,7 +390,7 @@ class HandlerRegistry:
                 for target in self._broadcast_to:
                     # Recursive call to get handlers from broadcast targets
                     handlers.extend(
-                        target.get_sorted_handlers(
+                        target._collect_handlers(
                             event,
                             include_broadcasts=True,
                             _visited=_visited,
@@ -356,6 +446,8 @@ class HandlerRegistry:
         with self._lock:
             if target not in self._broadcast_to:
                 self._broadcast_to.append(target)
+                target._sources.add(self)
+                self._invalidate()
                 return len(self._broadcast_to) - 1
             return self._broadcast_to.index(target)
 
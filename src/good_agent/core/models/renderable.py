@@ -9,7 +9,8 @@ from pydantic import BaseModel, Field
 from good_agent.core.models.mixins import ModelAllFields
 from good_agent.core.templating import (
     AbstractTemplate,
-    create_environment,
+    compile_template,
+    default_environment,
 )
 from good_agent.utilities.lxml import extract_first_level_xml
 
@@ -169,10 +170,10 @@ class Renderable(BaseModel, ModelAllFields, AbstractTemplate, ABC):
 
         data["__config__"] = self._template_config.new_child(config)
 
-        env = create_environment()
+        env = default_environment()
 
         try:
-            template = env.from_string(self.get_template())
+            template = compile_template(env, self.get_template())
             return unindent(template.render(data))
         except TemplateError as e:
             logger.error(
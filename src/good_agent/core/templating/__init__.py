@@ -5,11 +5,14 @@ from good_agent.core.templating._core import (
     register_function,
 )
 from good_agent.core.templating._environment import (
+    COMPILED_TEMPLATE_CACHE_SIZE,
     TEMPLATE_REGISTRY,
     TemplateLike,
     TemplateRegistry,
     add_named_template,
+    compile_template,
     create_environment,
+    default_environment,
     get_named_template,
     render_template,
 )
@@ -21,6 +24,9 @@ __all__ = [
     "add_named_template",
     "get_named_template",
     "create_environment",
+    "default_environment",
+    "compile_template",
+    "COMPILED_TEMPLATE_CACHE_SIZE",
     "render_template",
     "TEMPLATE_REGISTRY",
     "TemplateRegistry",
@@ -119,6 +119,8 @@ class TemplateDependencyRegistry:
     def __init__(self):
         self.filters = {}
         self.functions = {}
+        # Bumped on every registration so cached environments can be rebuilt
+        self.version = 0
 
     def register_filter(
         self,
@@ -137,6 +139,7 @@ class TemplateDependencyRegistry:
                 raise TypeError(f"Filter function must be callable, got {type(func).__name__}")
             # Register primary name
             self.filters[name] = func
+            self.version += 1
             # Register deprecated aliases as wrappers that emit a warning
             if deprecated_aliases:
                 for alias in deprecated_aliases:
@@ -170,6 +173,7 @@ class TemplateDependencyRegistry:
                 raise TypeError(f"Function must be callable, got {type(func).__name__}")
             # Register primary name
             self.functions[name] = func
+            self.version += 1
             # Register deprecated aliases as wrappers that emit a warning
             if deprecated_aliases:
                 for alias in deprecated_aliases:
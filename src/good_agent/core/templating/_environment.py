@@ -1,4 +1,5 @@
 import datetime
+import functools
 import inspect
 import logging
 from collections import ChainMap
@@ -6,12 +7,14 @@ from collections.abc import Callable
 from typing import Any
 
 from good_common.utilities import filter_nulls
-from jinja2 import BaseLoader, Environment, TemplateNotFound, TemplateSyntaxError
+from jinja2 import BaseLoader, Environment, Template, TemplateNotFound, TemplateSyntaxError
 from jinja2.sandbox import SandboxedEnvironment
+from jinja2.utils import LRUCache
 from markupsafe import Markup
 
 from good_agent.core.templating import _extensions as extensions
 from good_agent.core.templating._core import (
+    TEMPLATE_DEPENDENCIES,
     AbstractTemplate,
     Context,
     _compose_environment,
@@ -297,6 +300,58 @@ def create_environment(
     return env
 
 
+COMPILED_TEMPLATE_CACHE_SIZE = 256
+"""Compiled templates kept per environment by :func:`compile_template`."""
+
+_default_environments: dict[bool, tuple[int, Environment]] = {}
+
+
+def default_environment(use_sandbox: bool = False) -> Environment:
+    """Return a shared environment with the default config and global template registry.
+
+    The environment is rebuilt when filters or functions are registered after it
+    was created, so it always matches what ``create_environment()`` would return.
+    Callers must not modify it; use ``create_environment()`` for a private one.
+
+    Args:
+        use_sandbox: Return the shared sandboxed environment instead.
+    """
+    version = TEMPLATE_DEPENDENCIES.version
+    cached = _default_environments.get(use_sandbox)
+    if cached is None or cached[0] != version:
+        cached = (version, create_environment(use_sandbox=use_sandbox))
+        _default_environments[use_sandbox] = cached
+    return cached[1]
+
+
+def compile_template(environment: Environment, source: str) -> Template:
+    """Compile ``source`` in ``environment``, reusing earlier compilations.
+
+    Jinja only caches templates it loads by name; ``from_string`` parses and
+    compiles on every call. Compiled templates are kept in a bounded LRU stored
+    on the environment, keyed by source, so entries never outlive or leak
+    across environments.
+
+    Args:
+        environment: Environment to compile in.
+        source: Template source.
+    """
+    cache: LRUCache | None = getattr(environment, "_compiled_templates", None)
+    if cache is None:
+        cache = LRUCache(COMPILED_TEMPLATE_CACHE_SIZE)
+        environment._compiled_templates = cache  # type: ignore[attr-defined]
+    template = cache.get(source)
+    if template is None:
+        template = environment.from_string(source)
+        cache[source] = template
+    return template
+
+
+@functools.lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def _dedent(source: str) -> str:
+    return inspect.cleandoc(source).strip()
+
+
 @register_filter("render", pass_context=True)
 def _render_template(
     context: Context,
@@ -350,22 +405,22 @@ def render_template(
     """
     try:
         context = context or {}
-        env = environment or create_environment(
-            config=environment_config,
-            loader=environment_loader,
-        )
+        if environment is not None:
+            env = environment
+        elif environment_config or environment_loader:
+            env = create_environment(config=environment_config, loader=environment_loader)
+        else:
+            env = default_environment()
         if isinstance(template, bytes):
             template = template.decode("utf-8")
 
         if auto_dedent and isinstance(template, str):
-            import inspect
-
-            template = inspect.cleandoc(template).strip()
+            template = _dedent(template)
 
         if isinstance(template, AbstractTemplate):
             return template.render(**filter_nulls(context))
         elif isinstance(template, str):
-            _template = env.from_string(template)
+            _template = compile_template(env, template)
             return _template.render(**filter_nulls(context))
         else:
             raise TypeError(f"Template must be a string or AbstractTemplate, got {type(template)}")
@@ -47,6 +47,25 @@ class CitationPatterns:
     # Pattern for already-processed reference blocks that got converted to [!CITE_X!]: [!CITE_Y!] format
     PROCESSED_REF_BLOCK = re.compile(r"^\s*\[!CITE_\d+!\]:\s*\[!CITE_\d+!\]\s*$", re.MULTILINE)
 
+    # Inline link and URL patterns - group 1 captures the URL (group 2 for links)
+    MARKDOWN_LINK = re.compile(r"\[([^\]]+)\]\((https?://[^\s)]+)\)")
+    BARE_URL = re.compile(r'(?<!["\'>])(https?://[^\s<>"\']+)(?!["\'>])')
+
+    # Runs of blank lines left behind after removing reference blocks
+    EXCESS_BLANK_LINES = re.compile(r"\n\s*\n\s*\n+")
+
+    # Every inline citation form in one alternation, so a single scan finds them
+    # all in document order. ``match.lastgroup`` names the form that matched;
+    # alternatives are tried in this order at each position, which keeps link
+    # URLs and attribute values from also matching as bare URLs.
+    INLINE = re.compile(
+        r"\[!CITE_(?P<llm>\d+)!\]"
+        r'|(?:url|href)="(?P<xml_url>[^"]+)"'
+        r"|\[(?P<link_text>[^\]]+)\]\((?P<link_url>https?://[^\s)]+)\)"
+        r"|\[(?P<markdown>\d+)\]"
+        r'|(?<!["\'>])(?P<url>https?://[^\s<>"\']+)(?!["\'>])'
+    )
+
     @classmethod
     def detect_format(cls, text: str) -> CitationFormat:
         """
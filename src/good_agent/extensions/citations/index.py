@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import threading
 from collections.abc import Iterator
 from typing import Any
 
+import orjson
+
 from good_agent.core.indexing import Index
 from good_agent.core.models import Renderable
 from good_agent.core.types import URL
@@ -12,9 +15,19 @@ from good_agent.core.types import URL
 
 # type Renderable = SupportsDisplay | SupportsLLM | SupportsRender | SupportsString | str
 
+SNAPSHOT_VERSION = 1
+"""Format version written by ``CitationIndex.snapshot()``."""
+
 
 class CitationIndex(Index[URL, int, Renderable]):
-    """Deduplicated URL↔index registry backing ``CitationManager``."""
+    """Deduplicated URL↔index registry backing ``CitationManager``.
+
+    One index can be shared by many agents and threads. Writes are serialized
+    by an internal lock; lookups read plain dicts and never wait on it. Tags,
+    metadata values and aliases are also kept in inverted indexes, so
+    ``find_by_tag``, ``find_by_tags``, ``find_by_metadata`` and alias listing do
+    not scan every entry. Results are returned in index order.
+    """
 
     def __init__(self, index_offset: int = 1):
         """
@@ -35,6 +48,28 @@ class CitationIndex(Index[URL, int, Renderable]):
         self.tags_store: dict[str, set[str]] = {}
         self.next_index = index_offset
 
+        # Bumped whenever a URL or alias is added, so callers can cache results
+        # derived from the index contents
+        self.generation = 0
+
+        # Inverted indexes, kept in step with tags_store, metadata_store and aliases
+        self._tag_index: dict[str, set[int]] = {}
+        self._metadata_keys: dict[str, set[int]] = {}
+        self._metadata_values: dict[tuple[str, Any], set[int]] = {}
+        self._alias_sources: dict[str, set[str]] = {}
+
+        # Serializes writers; readers never take it
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
     def _to_url(self, value: URL | str, fallback: URL | str | None = None) -> URL:
         """Convert arbitrary input into a URL, falling back when conversion fails."""
 
@@ -113,33 +148,36 @@ class CitationIndex(Index[URL, int, Renderable]):
 
         canonical_url = self._get_canonical_url(key)
 
-        # Check if URL already exists
-        if canonical_url in self.url_to_index:
-            existing_index = self.url_to_index[canonical_url]
-            # Update value if provided
-            if value is not None:
-                self.index_to_value[existing_index] = value
-            # Update metadata/tags if provided
+        with self._lock:
+            # Check if URL already exists
+            if canonical_url in self.url_to_index:
+                existing_index = self.url_to_index[canonical_url]
+                # Update value if provided
+                if value is not None:
+                    self.index_to_value[existing_index] = value
+                # Update metadata/tags if provided
+                if metadata:
+                    self._update_metadata(canonical_url, metadata)
+                if tags:
+                    self._update_tags(canonical_url, tags)
+                return existing_index
+
+            # Add new URL
+            current_index = self.next_index
+            self.url_to_index[canonical_url] = current_index
+            self.index_to_url[current_index] = URL(canonical_url)
+            self.index_to_value[current_index] = value  # Store the value
+
+            # Add metadata and tags
             if metadata:
-                self._update_metadata(canonical_url, metadata)
+                self.metadata_store[canonical_url] = metadata.copy()
+                self._index_metadata(current_index, metadata)
             if tags:
                 self._update_tags(canonical_url, tags)
-            return existing_index
-
-        # Add new URL
-        current_index = self.next_index
-        self.url_to_index[canonical_url] = current_index
-        self.index_to_url[current_index] = URL(canonical_url)
-        self.index_to_value[current_index] = value  # Store the value
-
-        # Add metadata and tags
-        if metadata:
-            self.metadata_store[canonical_url] = metadata.copy()
-        if tags:
-            self.tags_store[canonical_url] = set(tags) if isinstance(tags, list) else {tags}
 
-        self.next_index += 1
-        return current_index
+            self.next_index += 1
+            self.generation += 1
+            return current_index
 
     def lookup(self, key: URL | str) -> int | None:
         """
@@ -251,13 +289,19 @@ class CitationIndex(Index[URL, int, Renderable]):
         primary_canonical = self._get_canonical_url(url)
         alias_canonical = self._get_canonical_url(alias)
 
-        # Primary URL must exist
-        if primary_canonical not in self.url_to_index:
-            raise ValueError(f"Primary URL {url} not found in index")
+        with self._lock:
+            # Primary URL must exist
+            if primary_canonical not in self.url_to_index:
+                raise ValueError(f"Primary URL {url} not found in index")
 
-        # Add alias mapping
-        self.aliases[alias_canonical] = primary_canonical
-        return self.url_to_index[primary_canonical]
+            # Add alias mapping, moving it off any previous target
+            previous = self.aliases.get(alias_canonical)
+            if previous is not None:
+                self._discard(self._alias_sources, previous, alias_canonical)
+            self.aliases[alias_canonical] = primary_canonical
+            self._alias_sources.setdefault(primary_canonical, set()).add(alias_canonical)
+            self.generation += 1
+            return self.url_to_index[primary_canonical]
 
     def merge(self, local_citations: list[URL | str]) -> dict[int, int]:
         """
@@ -285,9 +329,11 @@ class CitationIndex(Index[URL, int, Renderable]):
 
         mapping = {}
 
-        for local_idx, url in enumerate(local_citations, 1):  # 1-based local indexing
-            global_idx = self.add(url)  # Add to global index (or get existing)
-            mapping[local_idx] = global_idx
+        # Hold the lock so a message's new citations get consecutive indices
+        with self._lock:
+            for local_idx, url in enumerate(local_citations, 1):  # 1-based local indexing
+                global_idx = self.add(url)  # Add to global index (or get existing)
+                mapping[local_idx] = global_idx
 
         return mapping
 
@@ -349,12 +395,7 @@ class CitationIndex(Index[URL, int, Renderable]):
         Returns:
             List of citation indices
         """
-        results = []
-        for canonical_url, tags in self.tags_store.items():
-            if tag in tags:
-                index = self.url_to_index[canonical_url]
-                results.append(index)
-        return results
+        return sorted(self._tag_index.get(tag, ()))
 
     def items(self) -> Iterator[tuple[int, URL]]:
         """
@@ -450,18 +491,50 @@ class CitationIndex(Index[URL, int, Renderable]):
 
     def _update_metadata(self, canonical_url: str, metadata: dict[str, Any]) -> None:
         """Update metadata for a URL."""
-        if canonical_url not in self.metadata_store:
-            self.metadata_store[canonical_url] = {}
-        self.metadata_store[canonical_url].update(metadata)
+        with self._lock:
+            current = self.metadata_store.setdefault(canonical_url, {})
+            index = self.url_to_index.get(canonical_url)
+            if index is not None:
+                self._unindex_metadata(
+                    index, {key: current[key] for key in metadata.keys() & current.keys()}
+                )
+                self._index_metadata(index, metadata)
+            current.update(metadata)
 
     def _update_tags(self, canonical_url: str, tags: str | list[str]) -> None:
         """Update tags for a URL."""
-        if canonical_url not in self.tags_store:
-            self.tags_store[canonical_url] = set()
-        if isinstance(tags, str):
-            self.tags_store[canonical_url].add(tags)
-        else:
-            self.tags_store[canonical_url].update(tags)
+        tags = [tags] if isinstance(tags, str) else list(tags)
+        with self._lock:
+            self.tags_store.setdefault(canonical_url, set()).update(tags)
+            index = self.url_to_index.get(canonical_url)
+            if index is not None:
+                for tag in tags:
+                    self._tag_index.setdefault(tag, set()).add(index)
+
+    @staticmethod
+    def _discard(inverted: dict[Any, set[Any]], key: Any, item: Any) -> None:
+        """Remove ``item`` from an inverted index entry, dropping emptied entries."""
+        items = inverted.get(key)
+        if items is not None:
+            items.discard(item)
+            if not items:
+                del inverted[key]
+
+    def _index_metadata(self, index: int, metadata: dict[str, Any]) -> None:
+        for key, value in metadata.items():
+            self._metadata_keys.setdefault(key, set()).add(index)
+            try:
+                self._metadata_values.setdefault((key, value), set()).add(index)
+            except TypeError:
+                pass  # Unhashable values are matched by scanning entries with the key
+
+    def _unindex_metadata(self, index: int, metadata: dict[str, Any]) -> None:
+        for key, value in metadata.items():
+            self._discard(self._metadata_keys, key, index)
+            try:
+                self._discard(self._metadata_values, (key, value), index)
+            except TypeError:
+                pass
 
     def as_dict(self) -> dict[int, URL]:
         """
@@ -511,14 +584,16 @@ class CitationIndex(Index[URL, int, Renderable]):
         canonical_url = self._get_canonical_url(key)
         canonical_url = self._resolve_aliases_str(canonical_url)
 
-        # Find all aliases that point to this canonical URL
+        # Find all aliases that point to this canonical URL; snapshot the set
+        # so concurrent add()/merge() calls cannot resize it mid-iteration
+        with self._lock:
+            alias_urls = tuple(self._alias_sources.get(canonical_url, ()))
         aliases = set()
-        for alias_url, target_url in self.aliases.items():
-            if target_url == canonical_url:
-                try:
-                    aliases.add(URL(alias_url))
-                except ValueError:
-                    pass  # Skip invalid URLs
+        for alias_url in alias_urls:
+            try:
+                aliases.add(URL(alias_url))
+            except ValueError:
+                pass  # Skip invalid URLs
 
         return aliases
 
@@ -551,13 +626,16 @@ class CitationIndex(Index[URL, int, Renderable]):
         url = self.index_to_url[ref]
         canonical_url = self._get_canonical_url(url)
 
-        if canonical_url in self.tags_store:
-            tags_to_remove = {tag} if isinstance(tag, str) else set(tag)
-            self.tags_store[canonical_url] -= tags_to_remove
+        with self._lock:
+            if canonical_url in self.tags_store:
+                tags_to_remove = {tag} if isinstance(tag, str) else set(tag)
+                self.tags_store[canonical_url] -= tags_to_remove
+                for removed in tags_to_remove:
+                    self._discard(self._tag_index, removed, ref)
 
-            # Clean up empty tag sets
-            if not self.tags_store[canonical_url]:
-                del self.tags_store[canonical_url]
+                # Clean up empty tag sets
+                if not self.tags_store[canonical_url]:
+                    del self.tags_store[canonical_url]
 
     def find_by_tags(self, tags: list[str], match_all: bool = False) -> list[int]:
         """
@@ -570,20 +648,19 @@ class CitationIndex(Index[URL, int, Renderable]):
         Returns:
             List of citation indices
         """
-        results = []
-        tags_set = set(tags)
-
-        for canonical_url, url_tags in self.tags_store.items():
-            if match_all:
-                # Require all tags to be present
-                if tags_set.issubset(url_tags):
-                    results.append(self.url_to_index[canonical_url])
-            else:
-                # Match any tag
-                if tags_set & url_tags:  # Set intersection
-                    results.append(self.url_to_index[canonical_url])
+        if not tags:
+            if not match_all:
+                return []
+            # Every tagged citation trivially has all of no tags
+            with self._lock:
+                return sorted(self.url_to_index[url] for url in self.tags_store)
 
-        return results
+        matches = [self._tag_index.get(tag, set()) for tag in set(tags)]
+        if match_all:
+            # Intersect starting from the rarest tag
+            matches.sort(key=len)
+            return sorted(matches[0].intersection(*matches[1:]))
+        return sorted(set().union(*matches))
 
     def set_metadata(self, ref: int, **metadata) -> None:
         """
@@ -600,7 +677,10 @@ class CitationIndex(Index[URL, int, Renderable]):
 
         url = self.index_to_url[ref]
         canonical_url = self._get_canonical_url(url)
-        self.metadata_store[canonical_url] = metadata.copy()
+        with self._lock:
+            self._unindex_metadata(ref, self.metadata_store.get(canonical_url, {}))
+            self.metadata_store[canonical_url] = metadata.copy()
+            self._index_metadata(ref, metadata)
 
     def update_metadata(self, ref: int, **metadata) -> None:
         """
@@ -629,15 +709,28 @@ class CitationIndex(Index[URL, int, Renderable]):
         Returns:
             List of citation indices that match all criteria
         """
-        results = []
+        if not criteria:
+            with self._lock:
+                return sorted(self.url_to_index[url] for url in self.metadata_store)
 
-        for canonical_url, metadata in self.metadata_store.items():
-            # Check if all criteria match
-            if all(key in metadata and metadata[key] == value for key, value in criteria.items()):
-                index = self.url_to_index[canonical_url]
+        matches = []
+        unhashable = {}
+        for key, value in criteria.items():
+            try:
+                matches.append(self._metadata_values.get((key, value), set()))
+            except TypeError:
+                # Narrow to entries that have the key, then compare values below
+                matches.append(self._metadata_keys.get(key, set()))
+                unhashable[key] = value
+
+        matches.sort(key=len)
+        candidates = matches[0].intersection(*matches[1:])
+        results = []
+        for index in candidates:
+            metadata = self.get_metadata(index) if unhashable else {}
+            if all(key in metadata and metadata[key] == value for key, value in unhashable.items()):
                 results.append(index)
-
-        return results
+        return sorted(results)
 
     def get_entry(self, ref: int) -> tuple[URL, Renderable | None, dict[str, Any]]:
         """
@@ -680,3 +773,87 @@ class CitationIndex(Index[URL, int, Renderable]):
             value = self.index_to_value.get(index)
             metadata = self.get_metadata(index)
             yield (index, url, value, metadata)
+
+    def snapshot(self) -> bytes:
+        """
+        Serialize the index to a compact JSON document.
+
+        URLs are stored once, in index order, and tags are stored inverted, so
+        snapshots of large indexes load without canonicalizing any URL again.
+        Values that are not strings are stored as their ``str()``.
+
+        Returns:
+            Snapshot bytes for ``CitationIndex.from_snapshot()``
+
+        Example:
+            >>> index = CitationIndex()
+            >>> index.add("https://example.com", tags=["docs"])
+            1
+            >>> restored = CitationIndex.from_snapshot(index.snapshot())
+            >>> restored.find_by_tag("docs")
+            [1]
+        """
+        with self._lock:
+            payload = {
+                "version": SNAPSHOT_VERSION,
+                "index_offset": self.index_offset,
+                "urls": list(self.url_to_index),
+                "values": {
+                    str(index): value
+                    for index, value in self.index_to_value.items()
+                    if value is not None
+                },
+                "metadata": {
+                    str(self.url_to_index[url]): metadata
+                    for url, metadata in self.metadata_store.items()
+                },
+                "tags": {tag: sorted(indices) for tag, indices in self._tag_index.items()},
+                "aliases": self.aliases,
+            }
+            return orjson.dumps(payload, default=str)
+
+    @classmethod
+    def from_snapshot(cls, data: bytes | str) -> CitationIndex:
+        """
+        Rebuild an index from ``snapshot()`` output.
+
+        Args:
+            data: Snapshot bytes
+
+        Returns:
+            New CitationIndex with the same indices, values, metadata, tags
+            and aliases
+
+        Raises:
+            ValueError: If the snapshot was written by an unsupported version
+        """
+        payload = orjson.loads(data)
+        version = payload.get("version")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported citation index snapshot version: {version}")
+
+        index = cls(index_offset=payload["index_offset"])
+        urls: list[str] = payload["urls"]
+        values = payload["values"]
+        for position, canonical_url in enumerate(urls):
+            ref = index.index_offset + position
+            index.url_to_index[canonical_url] = ref
+            index.index_to_url[ref] = URL(canonical_url)
+            index.index_to_value[ref] = values.get(str(ref))
+        index.next_index = index.index_offset + len(urls)
+
+        for ref, metadata in payload["metadata"].items():
+            index.metadata_store[urls[int(ref) - index.index_offset]] = metadata
+            index._index_metadata(int(ref), metadata)
+
+        for tag, refs in payload["tags"].items():
+            index._tag_index[tag] = set(refs)
+            for ref in refs:
+                index.tags_store.setdefault(urls[ref - index.index_offset], set()).add(tag)
+
+        for alias, target in payload["aliases"].items():
+            index.aliases[alias] = target
+            index._alias_sources.setdefault(target, set()).add(alias)
+
+        index.generation = len(index.url_to_index) + len(index.aliases)
+        return index
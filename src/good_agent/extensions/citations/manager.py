@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 from good_agent.content import RenderMode
@@ -25,6 +26,15 @@ from good_agent.extensions.citations.index import CitationIndex
 
 logger = logging.getLogger(__name__)
 
+NORMALIZED_CACHE_SIZE = 1024
+"""Maximum number of normalized and transformed texts kept per manager."""
+
+
+def _remember(cache: OrderedDict, key: Any, value: Any) -> None:
+    cache[key] = value
+    if len(cache) > NORMALIZED_CACHE_SIZE:
+        cache.popitem(last=False)
+
 
 if TYPE_CHECKING:
     from good_agent import Agent
@@ -59,6 +69,11 @@ class CitationManager(AgentComponent):
         # Don't pass citation_index to parent class
         super().__init__()
 
+        # Normalization and render results for the current index, least
+        # recently used first
+        self._normalized: OrderedDict[tuple, tuple[list, list]] = OrderedDict()
+        self._transformed: OrderedDict[tuple, str] = OrderedDict()
+
         # Set the index after parent initialization
         if self._provided_index is not None:
             self.index = self._provided_index
@@ -70,6 +85,24 @@ class CitationManager(AgentComponent):
         self._citation_adapter: CitationAdapter | None = None
         self._debug = debug
 
+    @property
+    def index(self) -> CitationIndex:
+        """Citation index backing this manager"""
+        return self._index
+
+    @index.setter
+    def index(self, index: CitationIndex) -> None:
+        # Cached results are only valid for the index they were computed against
+        self._index = index
+        self._normalized.clear()
+        self._transformed.clear()
+
+    def _snapshot_state(self) -> Any:
+        return self.index.snapshot()
+
+    def _restore_state(self, state: Any) -> None:
+        self.index = CitationIndex.from_snapshot(state)
+
     async def install(self, agent: Agent) -> None:
         """
         Install the citation manager on an agent.
@@ -251,7 +284,16 @@ class CitationManager(AgentComponent):
         except Exception as e:
             logger.error(f"Error in _on_message_create_before: {e}", exc_info=True)
 
-    @on(AgentEvents.MESSAGE_RENDER_BEFORE)
+    def render_cache_key(self) -> tuple[CitationIndex, int]:
+        """Rendered citations only change if the index is swapped out.
+
+        Global indices are append-only, so a message renders the same way for
+        as long as the same index backs it. The index itself is part of the
+        key, rather than its ``id()``, so a recycled id cannot match.
+        """
+        return self.index, self.index.index_offset
+
+    @on(AgentEvents.MESSAGE_RENDER_BEFORE, pure=True)
     def _on_message_render_before(self, ctx: EventContext[MessageRenderParams, None]) -> None:
         """
         Transform citations based on render mode.
@@ -324,18 +366,12 @@ class CitationManager(AgentComponent):
             for part in output:  # type: ignore[attr-defined]
                 if isinstance(part, TextContentPart):
                     original_text = part.text
-
-                    # Transform based on render mode
-                    if mode == RenderMode.LLM:
-                        transformed_text = self._transform_for_llm(original_text, message.citations)
-                    elif mode == RenderMode.DISPLAY:
-                        # Pass message role to determine transformation behavior
-                        message_role = getattr(message, "role", "user")
-                        transformed_text = self._transform_for_user(
-                            original_text, message.citations, message_role
-                        )
-                    else:
-                        transformed_text = original_text
+                    transformed_text = self._transform_cached(
+                        original_text,
+                        message.citations,
+                        mode,  # type: ignore[arg-type]
+                        getattr(message, "role", "user"),
+                    )
 
                     # If transformed, create a new TextContentPart
                     if transformed_text != original_text:
@@ -355,6 +391,31 @@ class CitationManager(AgentComponent):
         except Exception as e:
             logger.error(f"Error in _on_message_render_before: {e}", exc_info=True)
 
+    def _transform_cached(self, content: str, citations: list, mode: RenderMode, role: str) -> str:
+        """
+        Transform content for ``mode``, reusing the result for unchanged input.
+
+        Results are keyed by the index generation after the transform ran, as
+        LLM transforms merge the citations into the index first.
+        """
+        if mode not in (RenderMode.LLM, RenderMode.DISPLAY):
+            return content
+
+        key = (mode, role, content, tuple(citations))
+        cached = self._transformed.get((self.index.generation, key))
+        if cached is not None:
+            self._transformed.move_to_end((self.index.generation, key))
+            return cached
+
+        if mode == RenderMode.LLM:
+            transformed = self._transform_for_llm(content, citations)
+        else:
+            # Pass message role to determine transformation behavior
+            transformed = self._transform_for_user(content, citations, role)
+
+        _remember(self._transformed, (self.index.generation, key), transformed)
+        return transformed
+
     def _extract_citations_from_parts(
         self, content_parts: list, mode: RenderMode, role: str
     ) -> list | None:
@@ -406,6 +467,11 @@ class CitationManager(AgentComponent):
         2. Build deduplicated message.citations list
         3. Normalize content to use consistent local indices
 
+        Phases 1 and 3 share one ``CitationPatterns.INLINE`` scan per part.
+        Results for text-only content are cached by text, provided citations
+        and index generation, so re-processing an unchanged message is a
+        dictionary lookup.
+
         Args:
             content_parts: List of content parts (strings or ContentPart objects)
             citations: Existing citations list if provided
@@ -415,11 +481,6 @@ class CitationManager(AgentComponent):
         Returns:
             Tuple of (processed_content_parts, extracted_citations)
         """
-        # logger.debug(
-        #     f"CitationManager: _process_content_parts called for role={role}, citations={citations is not None}"
-        # )
-        # logger.debug(f"CitationManager: Content preview: {str(content_parts)[:100]}...")
-
         from good_agent.content import TemplateContentPart, TextContentPart, is_template
         from good_agent.core.types import URL
 
@@ -440,20 +501,34 @@ class CitationManager(AgentComponent):
         # If we already have citations and proper format, AND there are no XML URLs to extract,
         # return as-is. Messages with XML may have additional URLs to extract even when citations are provided.
         # Use the specified render mode to check for citation patterns
-        has_cite_format = any("[!CITE_" in safe_render(part, mode) for part in content_parts)
-        has_xml_urls = any('url="' in safe_render(part, mode) for part in content_parts)
+        rendered = [safe_render(part, mode) for part in content_parts]
+        has_cite_format = any("[!CITE_" in text for text in rendered)
+        has_xml_urls = any('url="' in text for text in rendered)
 
         if citations and has_cite_format and not has_xml_urls:
             return content_parts, citations
 
-        processed_parts = []
-
-        # Phase 1: Extract ALL citations from all parts
-        all_found_citations = []
-        content_texts = []  # Track original content for each part
-
+        # Strings are keyed apart from text parts, since they are dedented and
+        # may turn out to be templates when converted below
+        cache_key = None
+        if all(isinstance(part, str | TextContentPart) for part in content_parts):
+            cache_key = (
+                self.index.generation,
+                tuple(
+                    (type(part), part if isinstance(part, str) else part.text)
+                    for part in content_parts
+                ),
+                tuple(citations) if citations else None,
+            )
+            cached = self._normalized.get(cache_key)
+            if cached is not None:
+                self._normalized.move_to_end(cache_key)
+                cached_parts, cached_citations = cached
+                return list(cached_parts), list(cached_citations) if cached_citations else None
+
+        # Convert strings to ContentPart objects
+        parts = []
         for part in content_parts:
-            # Convert strings to ContentPart objects
             if isinstance(part, str):
                 if is_template(part):
                     part = TemplateContentPart(
@@ -462,85 +537,63 @@ class CitationManager(AgentComponent):
                     )
                 else:
                     part = TextContentPart(text=part)
+            parts.append(part)
 
+        # Phase 1: Extract ALL citations from all parts
+        all_found_citations = []
+        content_texts = []  # (content, part, inline tokens, markdown ref mapping) per part
+
+        for part in parts:
             if isinstance(part, TextContentPart):
                 content = part.text
-                part_citations = []
                 markdown_ref_mapping = {}  # original_idx -> URL
 
                 # Extract markdown reference blocks [X]: URL first and remove them
-                if CitationPatterns.MARKDOWN_REF_BLOCK.search(content):
+                if "]:" in content and CitationPatterns.MARKDOWN_REF_BLOCK.search(content):
                     refs = CitationExtractor.extract_markdown_references(content)
                     # Store mapping of original indices to URLs
                     for original_idx, url in refs.items():
                         markdown_ref_mapping[original_idx] = url
-                        part_citations.append(url)
-                    # Remove reference blocks from content completely
-                    # First pass: remove the exact matches
+                        all_found_citations.append(url)
+                    # Remove reference blocks, then collapse the blank lines they leave
                     content = CitationPatterns.MARKDOWN_REF_BLOCK.sub("", content)
-
-                    # Second pass: clean up multiple blank lines and trailing whitespace
-                    content = re.sub(
-                        r"\n\s*\n\s*\n+", "\n\n", content
-                    )  # Multiple blank lines -> double blank
-                    content = content.strip()
+                    content = CitationPatterns.EXCESS_BLANK_LINES.sub("\n\n", content).strip()
 
                     logger.debug(f"Removed {len(refs)} reference blocks from content")
 
                 # Also remove already-processed reference blocks like [!CITE_X!]: [!CITE_Y!]
-                if CitationPatterns.PROCESSED_REF_BLOCK.search(content):
-                    # Count before removing
-                    removed_count = len(CitationPatterns.PROCESSED_REF_BLOCK.findall(content))
-                    content = CitationPatterns.PROCESSED_REF_BLOCK.sub("", content)
-
-                    # Clean up multiple blank lines and trailing whitespace after removal
-                    content = re.sub(
-                        r"\n\s*\n\s*\n+", "\n\n", content
-                    )  # Multiple blank lines -> double blank
-                    content = content.strip()
+                if "!]:" in content and CitationPatterns.PROCESSED_REF_BLOCK.search(content):
+                    content, removed_count = CitationPatterns.PROCESSED_REF_BLOCK.subn("", content)
+                    content = CitationPatterns.EXCESS_BLANK_LINES.sub("\n\n", content).strip()
 
                     logger.debug(
                         f"Removed {removed_count} already-processed reference blocks from content"
                     )
 
-                # Keep track of XML URLs separately to avoid double-processing
-                xml_urls_extracted = []
-                markdown_urls_extracted = []
-
-                # Extract XML url attributes from any message (not just tool messages)
-                # This allows citations in user messages that contain XML-like content
-                if 'url="' in content:
-                    url_matches = list(CitationPatterns.XML_URL_ATTR.finditer(content))
-                    for match in url_matches:
-                        url = URL(match.group(1))
-                        part_citations.append(url)
-                        xml_urls_extracted.append(url)
-
-                # Extract markdown inline links: [text](https://example.com)
-                try:
-                    markdown_link_pattern = re.compile(r"\[([^\]]+)\]\((https?://[^\s)]+)\)")
-                    for m in markdown_link_pattern.finditer(content):
-                        url = URL(m.group(2))
-                        if url not in part_citations:
-                            part_citations.append(url)
-                        markdown_urls_extracted.append(url)
-                except Exception:
-                    pass
-
-                # Extract inline URLs (but not those already extracted from XML)
-                url_pattern = re.compile(r'(?<!["\'>])(https?://[^\s<>"\']+)(?!["\'>])')
-                for match in url_pattern.finditer(content):
-                    url = URL(match.group(1))
-                    # Skip if this URL was already extracted
-                    if (
-                        url not in xml_urls_extracted
-                        and url not in markdown_urls_extracted
-                        and url not in part_citations
-                    ):
-                        part_citations.append(url)
-
-                all_found_citations.extend(part_citations)
-                content_texts.append((content, part, part_citations, markdown_ref_mapping))
+                # XML url/href attributes are only rewritten when the content
+                # carries url="..." attributes; lone href attributes are left alone
+                has_xml_url = 'url="' in content
+                tokens = []
+                xml_urls = []
+                link_urls = []
+                inline_urls = []
+                for match in CitationPatterns.INLINE.finditer(content):
+                    kind = match.lastgroup
+                    if kind == "xml_url":
+                        if not has_xml_url:
+                            continue
+                        xml_urls.append(URL(match.group(kind)))
+                    elif kind == "link_url":
+                        link_urls.append(URL(match.group(kind)))
+                    elif kind == "url":
+                        inline_urls.append(URL(match.group(kind)))
+                    tokens.append(match)
+
+                # XML attributes first, then markdown links, then inline URLs
+                all_found_citations.extend(xml_urls)
+                all_found_citations.extend(link_urls)
+                all_found_citations.extend(inline_urls)
+                content_texts.append((content, part, tokens, markdown_ref_mapping))
             else:
                 # Non-text parts pass through unchanged
                 content_texts.append((None, part, [], {}))  # type: ignore[arg-type]
@@ -551,194 +604,88 @@ class CitationManager(AgentComponent):
         all_referenced_mappings = {}  # original_idx -> URL
 
         # Collect all markdown reference mappings
-        for content_text, _, _, markdown_mapping in content_texts:
+        for _, _, tokens, markdown_mapping in content_texts:
             if markdown_mapping:
                 all_referenced_mappings.update(markdown_mapping)
 
-            if content_text:
-                # Also check for [!CITE_X!] references to global index
-                for match in CitationPatterns.LLM_CITE.finditer(content_text):
-                    idx = int(match.group(1))
+            # Also check for [!CITE_X!] references to global index
+            for match in tokens:
+                if match.lastgroup == "llm":
+                    idx = int(match.group("llm"))
                     # Look up in global index if not in markdown mappings
-                    if idx not in all_referenced_mappings and idx in self.index.as_dict():
-                        url = self.index.as_dict()[idx]
-                        all_referenced_mappings[idx] = url
+                    if idx not in all_referenced_mappings:
+                        url = self.index.get_url(idx)
+                        if url is not None:
+                            all_referenced_mappings[idx] = url
 
         # Build sequential citations list from all found citations
         final_citations = []
+        positions: dict[Any, int] = {}  # URL -> local index (1-based)
+
+        def local_index(url: Any) -> int:
+            if url not in positions:
+                final_citations.append(url)
+                positions[url] = len(final_citations)
+            return positions[url]
 
         # Create a reindex mapping: original_idx -> new_local_idx (1-based)
         reindex_mapping = {}
 
         # First add all URLs from sparse indices in order
         for original_idx in sorted(all_referenced_mappings.keys()):
-            url = all_referenced_mappings[original_idx]
-            if url not in final_citations:
-                final_citations.append(url)
-            # Map original index to new sequential index (1-based)
-            reindex_mapping[original_idx] = final_citations.index(url) + 1
+            reindex_mapping[original_idx] = local_index(all_referenced_mappings[original_idx])
 
         # Add provided citations if any
-        if citations:
-            for citation in citations:
-                if citation not in final_citations:
-                    final_citations.append(citation)
+        for citation in citations or ():
+            local_index(citation)
 
         # Add other found citations (from inline URLs, etc.)
         for citation in all_found_citations:
-            if citation not in final_citations:
-                final_citations.append(citation)
+            local_index(citation)
 
-        # Phase 3: Normalize content to use local indices
-        for content, part, _part_citations, _markdown_mapping in content_texts:
+        # Phase 3: Normalize content to use local indices, splicing replacements
+        # for the tokens found in phase 1 into a single output string
+        processed_parts = []
+        for content, part, tokens, _markdown_mapping in content_texts:
             if content is None:
                 # Non-text part, pass through
                 processed_parts.append(part)
                 continue
 
-            # Now normalize all references to use local indices from final_citations
-            normalized_content = content
-
-            # FIRST: Reindex sparse [!CITE_X!] references using our mapping
-            if CitationPatterns.LLM_CITE.search(normalized_content):
-                for match in reversed(list(CitationPatterns.LLM_CITE.finditer(normalized_content))):
-                    original_idx = int(match.group(1))
-                    logger.info(f"CitationManager: Processing LLM citation [!CITE_{original_idx}!]")
-                    # Use reindex mapping if available
-                    if original_idx in reindex_mapping:
-                        new_idx = reindex_mapping[original_idx]
-                        if new_idx != original_idx:
-                            replacement = f"[!CITE_{new_idx}!]"
-                            logger.info(
-                                f"CitationManager: Reindexing using mapping: [!CITE_{original_idx}!] -> [!CITE_{new_idx}!]"
-                            )
-                            normalized_content = (
-                                normalized_content[: match.start()]
-                                + replacement
-                                + normalized_content[match.end() :]
-                            )
-                    elif original_idx in self.index.as_dict():
-                        # Try global index lookup
-                        url = self.index.as_dict()[original_idx]
-                        logger.info(f"CitationManager: Found global index {original_idx} -> {url}")
-                        if url in final_citations:
-                            local_idx = final_citations.index(url) + 1
-                            if local_idx != original_idx:
-                                replacement = f"[!CITE_{local_idx}!]"
-                                logger.info(
-                                    f"CitationManager: Reindexing using global lookup: [!CITE_{original_idx}!] -> [!CITE_{local_idx}!]"
-                                )
-                                normalized_content = (
-                                    normalized_content[: match.start()]
-                                    + replacement
-                                    + normalized_content[match.end() :]
-                                )
-                            else:
-                                logger.info(
-                                    f"CitationManager: Index {original_idx} already matches local index {local_idx}"
-                                )
-                        else:
-                            logger.warning(
-                                f"CitationManager: URL {url} not found in final_citations"
-                            )
-                    else:
+            pieces = []
+            position = 0
+            for match in tokens:
+                kind = match.lastgroup
+                if kind == "llm":
+                    # Reindex sparse [!CITE_X!] references using our mapping
+                    original_idx = int(match.group(kind))
+                    if original_idx not in reindex_mapping:
                         logger.warning(
                             f"CitationManager: Index {original_idx} not found in reindex_mapping or global index"
                         )
-
-            # SECOND: Handle XML url attributes -> idx attributes
-            # Support XML URLs in any message type (not just tool messages)
-            if 'url="' in normalized_content:
-                url_matches = list(CitationPatterns.XML_URL_ATTR.finditer(normalized_content))
-
-                # First, collect all URLs in order to add to final_citations
-                for match in url_matches:
-                    url = URL(match.group(1))
-                    if url not in final_citations:
-                        final_citations.append(url)
-                        # logger.debug(
-                        #     f"Added URL {url} to citations during normalization"
-                        # )
-
-                # Then process replacements in reverse to maintain string positions
-                for match in reversed(url_matches):
-                    url = URL(match.group(1))
-                    # URL should now be in final_citations
-                    local_idx = final_citations.index(url) + 1
-                    replacement = f'idx="{local_idx}"'
-                    logger.info(
-                        f"CitationManager: Normalizing XML URL to index: {url} -> idx={local_idx}"
-                    )
-                    normalized_content = (
-                        normalized_content[: match.start()]
-                        + replacement
-                        + normalized_content[match.end() :]
-                    )
-
-            # THIRD: Handle inline URLs -> [!CITE_X!]
-            url_pattern = re.compile(r'(?<!["\'>])(https?://[^\s<>"\']+)(?!["\'>])')
-            for match in reversed(list(url_pattern.finditer(normalized_content))):
-                url = URL(match.group(1))
-                if url in final_citations:
-                    local_idx = final_citations.index(url) + 1
-                    replacement = f"[!CITE_{local_idx}!]"
-                    logger.info(
-                        f"CitationManager: Converting inline URL to citation: {url} -> [!CITE_{local_idx}!]"
-                    )
-                    normalized_content = (
-                        normalized_content[: match.start()]
-                        + replacement
-                        + normalized_content[match.end() :]
-                    )
+                        continue
+                    replacement = f"[!CITE_{reindex_mapping[original_idx]}!]"
+                elif kind == "xml_url":
+                    # XML url attributes -> idx attributes
+                    replacement = f'idx="{local_index(URL(match.group(kind)))}"'
+                elif kind == "link_url":
+                    # Markdown links [text](url) -> 'text [!CITE_X!]'
+                    link_idx = local_index(URL(match.group(kind)))
+                    replacement = f"{match.group('link_text')} [!CITE_{link_idx}!]"
+                elif kind == "url":
+                    # Inline URLs -> [!CITE_X!]
+                    replacement = f"[!CITE_{local_index(URL(match.group(kind)))}!]"
                 else:
-                    # URL not found - add it dynamically
-                    final_citations.append(url)
-                    local_idx = len(final_citations)
-                    replacement = f"[!CITE_{local_idx}!]"
-                    logger.info(
-                        f"CitationManager: Adding and converting inline URL to citation: {url} -> [!CITE_{local_idx}!]"
-                    )
-                    normalized_content = (
-                        normalized_content[: match.start()]
-                        + replacement
-                        + normalized_content[match.end() :]
-                    )
-                    # logger.debug(
-                    #     f"Added inline URL {url} to citations during normalization"
-                    # )
-
-            # THIRD-B: Convert markdown links [text](url) -> 'text [!CITE_X!]'
-            markdown_link_pattern = re.compile(r"\[([^\]]+)\]\((https?://[^\s)]+)\)")
-            for match in reversed(list(markdown_link_pattern.finditer(normalized_content))):
-                link_text = match.group(1)
-                url = URL(match.group(2))
-                if url not in final_citations:
-                    final_citations.append(url)
-                local_idx = final_citations.index(url) + 1
-                replacement = f"{link_text} [!CITE_{local_idx}!]"
-                logger.info(
-                    f"CitationManager: Converting markdown link to citation: {url} -> [!CITE_{local_idx}!]"
-                )
-                normalized_content = (
-                    normalized_content[: match.start()]
-                    + replacement
-                    + normalized_content[match.end() :]
-                )
-
-            # FOURTH: Handle [X] markdown references -> [!CITE_X!] with reindexing
-            if CitationPatterns.MARKDOWN.search(normalized_content):
-                for match in reversed(list(CitationPatterns.MARKDOWN.finditer(normalized_content))):
-                    original_idx = int(match.group(1))
-                    # Check if this needs reindexing (sparse reference)
+                    # [X] markdown references -> [!CITE_X!] with reindexing
+                    original_idx = int(match.group(kind))
                     if original_idx in reindex_mapping:
-                        new_idx = reindex_mapping[original_idx]
-                        replacement = f"[!CITE_{new_idx}!]"
+                        replacement = f"[!CITE_{reindex_mapping[original_idx]}!]"
                     elif 1 <= original_idx <= len(final_citations):
                         # Valid sequential index, just normalize format
                         replacement = f"[!CITE_{original_idx}!]"
                     else:
                         # Invalid index - check if it exists in global index before warning
-                        if original_idx not in self.index.as_dict():
+                        if self.index.get_url(original_idx) is None:
                             logger.warning(
                                 "Citation [%s] has no corresponding source",
                                 original_idx,
@@ -746,17 +693,21 @@ class CitationManager(AgentComponent):
                         # Leave as-is for now - may be resolved from global index later
                         continue
 
-                    normalized_content = (
-                        normalized_content[: match.start()]
-                        + replacement
-                        + normalized_content[match.end() :]
-                    )
+                pieces.append(content[position : match.start()])
+                pieces.append(replacement)
+                position = match.end()
 
-            processed_parts.append(TextContentPart(text=normalized_content))
+            if pieces:
+                pieces.append(content[position:])
+                content = "".join(pieces)
+            processed_parts.append(TextContentPart(text=content))
+
+        if cache_key is not None:
+            _remember(self._normalized, cache_key, (processed_parts, final_citations))
 
         return (
-            processed_parts,
-            final_citations if final_citations else None,
+            list(processed_parts),
+            list(final_citations) if final_citations else None,
         )
 
     def _extract_and_normalize_xml_urls(self, content: str) -> tuple[str, list]:
@@ -1154,15 +1105,13 @@ class CitationManager(AgentComponent):
         # Pre-clean reference blocks that shouldn't be sent to the LLM
         # Remove markdown reference blocks and already-processed blocks like
         # "[!CITE_1!]: [!CITE_1!]" that can appear after migrations.
-        import re
-
         cleaned = content
         if CitationPatterns.MARKDOWN_REF_BLOCK.search(cleaned):
             cleaned = CitationPatterns.MARKDOWN_REF_BLOCK.sub("", cleaned)
         if CitationPatterns.PROCESSED_REF_BLOCK.search(cleaned):
             cleaned = CitationPatterns.PROCESSED_REF_BLOCK.sub("", cleaned)
         # Normalize excessive blank lines
-        cleaned = re.sub(r"\n\s*\n\s*\n+", "\n\n", cleaned).strip()
+        cleaned = CitationPatterns.EXCESS_BLANK_LINES.sub("\n\n", cleaned).strip()
 
         # Get mapping from local to global indices
         index_mapping = self.index.merge(citations)
@@ -1224,10 +1173,6 @@ class CitationManager(AgentComponent):
             Content with clickable markdown links or XML with URLs
         """
         # For [!CITE_X!] format, we need to use the global index
-        import re
-
-        from good_agent.extensions.citations.formats import CitationPatterns
-
         result = content
 
         # Remove any reference blocks that shouldn't appear in user display
@@ -1235,7 +1180,7 @@ class CitationManager(AgentComponent):
         if CitationPatterns.MARKDOWN_REF_BLOCK.search(result):
             result = CitationPatterns.MARKDOWN_REF_BLOCK.sub("", result)
             # Clean up blank lines
-            result = re.sub(r"\n\s*\n\s*\n+", "\n\n", result)
+            result = CitationPatterns.EXCESS_BLANK_LINES.sub("\n\n", result)
             result = result.strip()
             logger.debug("Removed markdown reference blocks from user display content")
 
@@ -1244,7 +1189,7 @@ class CitationManager(AgentComponent):
             processed_count = len(CitationPatterns.PROCESSED_REF_BLOCK.findall(result))
             result = CitationPatterns.PROCESSED_REF_BLOCK.sub("", result)
             # Clean up blank lines
-            result = re.sub(r"\n\s*\n\s*\n+", "\n\n", result)
+            result = CitationPatterns.EXCESS_BLANK_LINES.sub("\n\n", result)
             result = result.strip()
             logger.debug(
                 f"Removed {processed_count} processed reference blocks from user display content"
@@ -1270,7 +1215,7 @@ class CitationManager(AgentComponent):
                     )
                     return match.group(0)
 
-            result = re.sub(r'idx="(\d+)"', replace_idx_with_url, result)
+            result = CitationPatterns.XML_IDX_ATTR.sub(replace_idx_with_url, result)
 
         # Transform [!CITE_X!] using local citations first, then global index
         if CitationPatterns.LLM_CITE.search(result):
@@ -1286,9 +1231,8 @@ class CitationManager(AgentComponent):
                     )
                 else:
                     # Fall back to global index
-                    index_dict = self.index.as_dict()
-                    if index in index_dict:
-                        url = index_dict[index]
+                    url = self.index.get_url(index)
+                    if url is not None:
                         logger.info(
                             f"CitationManager: Converting [!CITE_{index}!] to markdown link using global index: {url}"
                         )
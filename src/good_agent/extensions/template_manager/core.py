@@ -483,7 +483,7 @@ class TemplateManager(AgentComponent):
 
         try:
             # Use a sandboxed environment for parsing (safe by default)
-            env = templating.create_environment(use_sandbox=True)
+            env = templating.default_environment(use_sandbox=True)
             ast = env.parse(template_str)
             variables = meta.find_undeclared_variables(ast)
             return list(variables)
@@ -594,7 +594,7 @@ class TemplateManager(AgentComponent):
         full_context = self._build_context(context)
 
         # Render using our environment
-        template = self._env.from_string(template_str)
+        template = templating.compile_template(self._env, template_str)
         return template.render(full_context)
 
     def _build_context(self, base_context: dict[str, Any]) -> dict[str, Any]:
@@ -516,7 +516,7 @@ class FileTemplateManager:
         Note: Templates referenced via include/extends must be pre-loaded
         using preload_templates() or they must exist in the registry.
         """
-        template = self.env.from_string(template_str)
+        template = templating.compile_template(self.env, template_str)
         rendered: str = template.render(context or {})
         return rendered
 
@@ -3,10 +3,13 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from good_agent.mcp.adapter import MCPToolAdapter
     from good_agent.mcp.client import MCPClientManager
+    from good_agent.mcp.pool import MCPSessionPool, get_mcp_session_pool
 
 __all__ = [
     "MCPClientManager",
+    "MCPSessionPool",
     "MCPToolAdapter",
+    "get_mcp_session_pool",
 ]
 
 
@@ -20,4 +23,8 @@ def __getattr__(name: str):
         from good_agent.mcp.adapter import MCPToolAdapter
 
         return MCPToolAdapter
+    elif name in ("MCPSessionPool", "get_mcp_session_pool"):
+        from good_agent.mcp import pool
+
+        return getattr(pool, name)
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,10 @@
 import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
 from typing import Any, Generic, TypeVar
 
+import orjson
 from pydantic import BaseModel, Field, create_model
 
 from good_agent.tools import Tool, ToolResponse
@@ -10,6 +13,16 @@ logger = logging.getLogger(__name__)
 
 T_Response = TypeVar("T_Response")
 
+INPUT_MODEL_CACHE_SIZE = 1024
+"""Maximum number of generated input models kept for reuse."""
+
+# Generated input models keyed by (tool name, schema hash), least recently used first
+_input_models: OrderedDict[tuple[str, str], type[BaseModel]] = OrderedDict()
+
+
+def _schema_hash(schema: dict[str, Any]) -> str:
+    return hashlib.sha256(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
 
 class MCPToolSpec(BaseModel):
     """Specification for an MCP tool."""
@@ -66,16 +79,42 @@ class MCPToolAdapter(Tool[..., T_Response], Generic[T_Response]):
             description=tool_spec.description or f"MCP tool: {tool_spec.name}",
         )
 
+    @property
+    def pipelined(self) -> bool:
+        """Whether the server opted in to overlapping calls without ``concurrent_tool_calls``."""
+        if getattr(self.mcp_client, "pipeline", False) is not True:
+            return False
+        max_in_flight = getattr(self.mcp_client, "max_in_flight", 1)
+        return isinstance(max_in_flight, int) and max_in_flight > 1
+
     def _create_input_model(self, schema: dict[str, Any]) -> type[BaseModel]:
         """
         Create a Pydantic model from an MCP input schema.
 
+        Models are memoized by tool name and schema hash, so adapters rebuilt
+        for the same tool (another namespace, a refreshed listing, a cached
+        discovery) reuse the generated class.
+
         Args:
             schema: JSON schema for the tool's input
 
         Returns:
             A Pydantic model class for validation
         """
+        key = (self.spec.name, _schema_hash(schema))
+        model = _input_models.get(key)
+        if model is not None:
+            _input_models.move_to_end(key)
+            return model
+
+        model = self._build_input_model(schema)
+        _input_models[key] = model
+        if len(_input_models) > INPUT_MODEL_CACHE_SIZE:
+            _input_models.popitem(last=False)
+        return model
+
+    def _build_input_model(self, schema: dict[str, Any]) -> type[BaseModel]:
+        """Build the input model for ``schema`` without consulting the cache."""
         # Extract properties and required fields from JSON schema
         properties = schema.get("properties", {})
         required = schema.get("required", [])
@@ -1,5 +1,7 @@
 import asyncio
 import logging
+from collections.abc import Mapping
+from contextlib import AsyncExitStack
 from typing import Any, TypedDict
 from urllib.parse import urlparse
 
@@ -9,7 +11,13 @@ from mcp.client.stdio import stdio_client
 from pydantic import BaseModel, Field
 
 from good_agent.core.components.component import AgentComponent
-from good_agent.mcp.adapter import MCPToolAdapter, MCPToolSpec
+from good_agent.mcp.adapter import MCPToolAdapter
+from good_agent.mcp.pool import (
+    LatencyHistogram,
+    MessageHandler,
+    PooledSession,
+    get_mcp_session_pool,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +30,9 @@ class MCPServerConfig(TypedDict, total=False):
     timeout: float  # Connection timeout
     auto_reconnect: bool  # Auto-reconnect on disconnect
     namespace: str | None  # Optional namespace for tools
+    # Session-wide: the first config to open the pooled session sets these
+    max_in_flight: int  # Concurrent tool calls allowed on the shared session
+    pipeline: bool  # Overlap consecutive tool calls without concurrent_tool_calls
 
 
 class MCPConnection(BaseModel):
@@ -36,6 +47,7 @@ class MCPConnection(BaseModel):
     resources: dict[str, Any] = Field(default_factory=dict)
     is_connected: bool = False
     error: str | None = None
+    pooled: PooledSession | None = None
 
 
 class MCPClientManager(AgentComponent):
@@ -96,6 +108,9 @@ class MCPClientManager(AgentComponent):
         """
         Connect to a single MCP server.
 
+        The session comes from the process-wide pool, so agents configured with
+        the same server share one connection and its discovered tools.
+
         Args:
             config: Server configuration
 
@@ -120,16 +135,20 @@ class MCPClientManager(AgentComponent):
             )
 
             try:
-                # Determine connection type based on URL
-                session = await self._create_session(config)
-                connection.session = session
-
-                # Initialize the session
-                await session.initialize()
+                pooled = await get_mcp_session_pool().acquire(config, self._create_session)
+                connection.pooled = pooled
+                connection.session = pooled.session
+                connection.tools = dict(
+                    pooled.adapters(config.get("namespace"), config.get("timeout", 30.0))
+                )
+                connection.resources = pooled.resources
+                pooled.add_listener(self._on_listings_changed)
 
-                # Discover tools and resources
-                await self._discover_tools(connection)
-                await self._discover_resources(connection)
+                # Register with agent's tool manager if attached
+                agent = self._agent
+                if agent is not None and hasattr(agent, "tools"):
+                    for tool_name, adapter in connection.tools.items():
+                        agent.tools[tool_name] = adapter
 
                 connection.is_connected = True
                 logger.info(
@@ -144,12 +163,23 @@ class MCPClientManager(AgentComponent):
             self.connections[server_id] = connection
             return connection
 
-    async def _create_session(self, config: MCPServerConfig) -> ClientSession:
+    async def _create_session(
+        self,
+        config: Mapping[str, Any],
+        stack: AsyncExitStack,
+        message_handler: MessageHandler | None = None,
+    ) -> ClientSession:
         """
         Create an MCP client session based on the configuration.
 
+        The transport and session are entered into ``stack`` so they stay open
+        until the pool closes the session.
+
         Args:
             config: Server configuration
+            stack: Exit stack that owns the transport and session
+            message_handler: Receives server notifications such as
+                ``tools/list_changed``
 
         Returns:
             ClientSession instance
@@ -161,8 +191,7 @@ class MCPClientManager(AgentComponent):
 
         if parsed.scheme in ("http", "https"):
             # SSE-based connection for HTTP(S) servers
-            async with sse_client(url) as (read, write):
-                return ClientSession(read, write)
+            read, write = await stack.enter_async_context(sse_client(url))
 
         elif parsed.scheme == "stdio" or not parsed.scheme:
             # Stdio-based connection for local commands
@@ -178,95 +207,22 @@ class MCPClientManager(AgentComponent):
                 env=env_value if isinstance(env_value, dict) else None,  # type: ignore[arg-type]
             )
 
-            async with stdio_client(server_params) as (read, write):
-                return ClientSession(read, write)
+            read, write = await stack.enter_async_context(stdio_client(server_params))
 
         else:
             raise ValueError(f"Unsupported MCP server URL scheme: {parsed.scheme}")
 
-    async def _discover_tools(self, connection: MCPConnection):
-        """
-        Discover available tools from an MCP server.
-
-        Args:
-            connection: The MCP connection
-        """
-        if not connection.session:
-            return
-
-        try:
-            # List available tools
-            tools_response = await connection.session.list_tools()
-
-            for tool_info in tools_response.tools:
-                # Create tool spec from MCP tool info
-                tool_spec = MCPToolSpec(
-                    name=tool_info.name,
-                    description=tool_info.description,
-                    input_schema=tool_info.inputSchema
-                    if hasattr(tool_info, "inputSchema")
-                    else None,
-                )
-
-                # Create adapter with namespace if configured
-                namespace = connection.config.get("namespace")
-                tool_name = f"{namespace}:{tool_info.name}" if namespace else tool_info.name
-
-                # Create the adapter
-                adapter: MCPToolAdapter[Any] = MCPToolAdapter(
-                    mcp_client=connection.session,
-                    tool_spec=tool_spec,
-                    name=tool_name,
-                    timeout=connection.config.get("timeout", 30.0),
-                )
-
-                connection.tools[tool_name] = adapter
-
-                # Register with agent's tool manager if attached
-                if self.agent and hasattr(self.agent, "tools"):
-                    self.agent.tools[tool_name] = adapter
-
-            logger.debug(f"Discovered {len(connection.tools)} tools from {connection.server_id}")
-
-        except Exception as e:
-            logger.error(f"Failed to discover tools from {connection.server_id}: {e}")
-
-    async def _discover_resources(self, connection: MCPConnection):
-        """
-        Discover available resources from an MCP server.
-
-        Args:
-            connection: The MCP connection
-        """
-        if not connection.session:
-            return
-
-        try:
-            # List available resources
-            resources_response = await connection.session.list_resources()
-
-            for resource in resources_response.resources:
-                resource_id = str(resource.uri)  # type: ignore[index]
-                connection.resources[resource_id] = {
-                    "uri": resource.uri,
-                    "name": resource.name,
-                    "description": resource.description
-                    if hasattr(resource, "description")
-                    else None,
-                    "mimeType": resource.mimeType if hasattr(resource, "mimeType") else None,
-                }
-
-            logger.debug(
-                f"Discovered {len(connection.resources)} resources from {connection.server_id}"
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to discover resources from {connection.server_id}: {e}")
+        return await stack.enter_async_context(
+            ClientSession(read, write, message_handler=message_handler)
+        )
 
     async def disconnect(self, server_id: str):
         """
         Disconnect from an MCP server.
 
+        The pooled session stays open for other agents and is closed once it
+        has been idle for the pool's ``idle_timeout``.
+
         Args:
             server_id: The server identifier
         """
@@ -278,18 +234,20 @@ class MCPClientManager(AgentComponent):
             connection = self.connections[server_id]
 
             try:
-                if connection.session:
-                    # Close the session
-                    await connection.session.__aexit__(None, None, None)
+                if connection.pooled is not None:
+                    connection.pooled.remove_listener(self._on_listings_changed)
+                    get_mcp_session_pool().release(connection.pooled)
+                    connection.pooled = None
 
                 connection.is_connected = False
                 connection.session = None
 
                 # Remove tools from agent's tool manager
-                if self.agent and hasattr(self.agent, "tools"):
+                agent = self._agent
+                if agent is not None and hasattr(agent, "tools"):
                     for tool_name in connection.tools:
-                        if tool_name in self.agent.tools:
-                            del self.agent.tools[tool_name]
+                        if tool_name in agent.tools:
+                            del agent.tools[tool_name]
 
                 logger.info(f"Disconnected from MCP server: {server_id}")
 
@@ -299,6 +257,27 @@ class MCPClientManager(AgentComponent):
             finally:
                 del self.connections[server_id]
 
+    def _on_listings_changed(self, pooled: PooledSession) -> None:
+        """Swap in new tool adapters after a pooled session refreshed its listings."""
+        agent = self._agent
+        for connection in self.connections.values():
+            if connection.pooled is not pooled:
+                continue
+
+            tools = dict(
+                pooled.adapters(
+                    connection.config.get("namespace"), connection.config.get("timeout", 30.0)
+                )
+            )
+            if agent is not None and hasattr(agent, "tools"):
+                for tool_name in connection.tools.keys() - tools.keys():
+                    if tool_name in agent.tools:
+                        del agent.tools[tool_name]
+                for tool_name, adapter in tools.items():
+                    agent.tools[tool_name] = adapter
+            connection.tools = tools
+            logger.info(f"Refreshed tools from MCP server: {connection.server_id}")
+
     async def disconnect_all(self):
         """Disconnect from all MCP servers."""
         server_ids = list(self.connections.keys())
@@ -318,6 +297,22 @@ class MCPClientManager(AgentComponent):
                 all_tools.update(connection.tools)
         return all_tools
 
+    def get_latency(self) -> dict[str, LatencyHistogram]:
+        """
+        Get tool call latency histograms for connected servers.
+
+        Histograms belong to the pooled session, so they include calls made
+        by every agent sharing the server.
+
+        Returns:
+            Dictionary of server ID to latency histogram
+        """
+        return {
+            server_id: connection.pooled.latency
+            for server_id, connection in self.connections.items()
+            if connection.pooled is not None
+        }
+
     def get_resources(self) -> dict[str, Any]:
         """
         Get all available resources from all connected servers.
@@ -0,0 +1,112 @@
+"""On-disk cache of MCP tool and resource discovery results."""
+
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DISCOVERY_TTL = 3600.0
+"""Seconds a discovery result is reused before the server is asked again."""
+
+
+def default_cache_dir() -> Path:
+    """Return ``$GOOD_AGENT_MCP_CACHE_DIR`` or ``~/.good-agent/cache/mcp``."""
+    env_dir = os.getenv("GOOD_AGENT_MCP_CACHE_DIR")
+    return Path(env_dir or "~/.good-agent/cache/mcp").expanduser()
+
+
+@dataclass(slots=True)
+class DiscoveryRecord:
+    """Tool and resource listings returned by one server."""
+
+    tools: list[dict[str, Any]] = field(default_factory=list)
+    """``MCPToolSpec`` dumps, in server order"""
+    resources: dict[str, dict[str, Any]] = field(default_factory=dict)
+    """Resource info keyed by URI"""
+    fetched_at: float = field(default_factory=time.time)
+    """Unix time the listings were fetched from the server"""
+
+    def is_expired(self, ttl: float) -> bool:
+        return time.time() - self.fetched_at > ttl
+
+
+class MCPDiscoveryCache:
+    """
+    Persists discovery results across processes.
+
+    Records are keyed by the server's connection settings together with the
+    name and version it reports during initialization, so upgrading a server
+    misses the cache. The key is hashed, so credentials in the connection
+    settings are not written to disk. Unreadable or expired records are
+    treated as misses.
+    """
+
+    def __init__(self, directory: Path | str | None = None, ttl: float = DEFAULT_DISCOVERY_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory; defaults to ``default_cache_dir()``
+            ttl: Seconds a record stays fresh
+        """
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.ttl = ttl
+
+    @staticmethod
+    def key(session_key: str, server_name: str, server_version: str) -> str:
+        """Return the cache key for a server identity."""
+        identity = f"{session_key}\0{server_name}\0{server_version}"
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str) -> DiscoveryRecord | None:
+        """Return the fresh record for ``key``, or None."""
+        try:
+            data = orjson.loads(self._path(key).read_bytes())
+            record = DiscoveryRecord(
+                tools=data["tools"], resources=data["resources"], fetched_at=data["fetched_at"]
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable MCP discovery cache entry {key}: {e}")
+            return None
+        return None if record.is_expired(self.ttl) else record
+
+    def store(self, key: str, record: DiscoveryRecord) -> None:
+        """Write ``record`` for ``key``; failures are logged and ignored."""
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            payload = orjson.dumps(
+                {
+                    "tools": record.tools,
+                    "resources": record.resources,
+                    "fetched_at": record.fetched_at,
+                },
+                default=str,
+            )
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write MCP discovery cache entry {key}: {e}")
+
+    def invalidate(self, key: str) -> None:
+        """Remove the record for ``key`` if present."""
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Could not remove MCP discovery cache entry {key}: {e}")
@@ -0,0 +1,565 @@
+"""Process-wide pool of MCP client sessions shared between agents."""
+
+import asyncio
+import json
+import logging
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import Any
+
+from mcp import ClientSession
+from mcp.types import ResourceListChangedNotification, ToolListChangedNotification
+
+from good_agent.mcp.adapter import MCPToolAdapter, MCPToolSpec
+from good_agent.mcp.discovery import DEFAULT_DISCOVERY_TTL, DiscoveryRecord, MCPDiscoveryCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT = 300.0
+"""Seconds an unreferenced session stays open before it is closed."""
+
+DEFAULT_MAX_IN_FLIGHT = 8
+"""Concurrent ``call_tool`` requests allowed per server unless configured."""
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+"""Upper bounds of the latency histogram buckets, in milliseconds."""
+
+MessageHandler = Callable[[Any], Awaitable[None]]
+"""Receives server notifications for a session."""
+
+SessionOpener = Callable[
+    [Mapping[str, Any], AsyncExitStack, MessageHandler], Awaitable[ClientSession]
+]
+"""Opens a session for a server config, entering its transport into the exit stack."""
+
+# Config keys that select the server process or endpoint. ``namespace`` and
+# ``timeout`` only affect the tool adapters, so agents that differ only in
+# those still share one session. ``max_in_flight`` and ``pipeline`` are fixed
+# by the config that opens the session; later configs are warned, not keyed.
+_TRANSPORT_KEYS = ("url", "env", "auth")
+
+
+def session_key(config: Mapping[str, Any]) -> str:
+    """Return the pool key for a server configuration."""
+    transport = {key: config.get(key) for key in _TRANSPORT_KEYS if config.get(key) is not None}
+    return json.dumps(transport, sort_keys=True, default=str)
+
+
+def _server_identity(result: Any) -> tuple[str, str] | None:
+    """Return ``(name, version)`` from an initialize result, if the server sent them."""
+    info = getattr(result, "serverInfo", None) or getattr(result, "server_info", None)
+    name = getattr(info, "name", None)
+    version = getattr(info, "version", None)
+    if isinstance(name, str) and isinstance(version, str):
+        return name, version
+    return None
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Tool call latencies for one server, counted in fixed millisecond buckets"""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    """Calls per bucket; the last bucket counts calls slower than every bound"""
+    count: int = 0
+    """Completed calls, including failed ones"""
+    errors: int = 0
+    """Calls that raised"""
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, seconds: float, *, error: bool = False) -> None:
+        ms = seconds * 1000
+        index = 0
+        while index < len(LATENCY_BUCKETS_MS) and ms > LATENCY_BUCKETS_MS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.errors += error
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Return the bucket bound at or below which ``q`` (0-1) of the calls finished."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target and bucket_count:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return min(float(LATENCY_BUCKETS_MS[index]), self.max_ms)
+                break
+        return self.max_ms
+
+
+class PooledSession:
+    """
+    One MCP server session shared by every agent attached to it.
+
+    The transport and ``ClientSession`` are entered and exited by a dedicated
+    owner task, because stdio and SSE transports run anyio task groups that
+    must be closed by the task that opened them. Tool and resource discovery
+    runs once when the session opens, or is read from the discovery cache when
+    the same server version was listed recently; attaching agents read the
+    results from memory. The listings are fetched again when the server sends
+    ``tools/list_changed`` or ``resources/list_changed``, or when they are
+    older than the pool's ``discovery_ttl``.
+
+    Tool adapters call through ``call_tool``. ``ClientSession`` tags each
+    request with its own id, so concurrent calls from any number of agents are
+    pipelined over the one connection; at most ``max_in_flight`` (the
+    ``max_in_flight`` server config, default ``DEFAULT_MAX_IN_FLIGHT``) are
+    outstanding at a time and the rest wait their turn. Every call is timed
+    into ``latency``. With the ``pipeline`` server config an agent overlaps
+    consecutive calls to this server even without ``concurrent_tool_calls``.
+
+    ``max_in_flight`` and ``pipeline`` are session-wide and come from the config
+    that opened the session; agents attaching later with different values share
+    those settings, and ``MCPSessionPool.acquire`` logs a warning.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        config: Mapping[str, Any],
+        discovery_cache: MCPDiscoveryCache | None = None,
+    ):
+        self.key = key
+        self.config = dict(config)
+        self.session: ClientSession | None = None
+        self.tool_specs: list[MCPToolSpec] = []
+        self.resources: dict[str, Any] = {}
+        self.discovered_at = 0.0
+        self.refcount = 0
+        self._discovery_cache = discovery_cache
+        self._discovery_key: str | None = None
+        self._listeners: list[Callable[[PooledSession], None]] = []
+        self._ready: asyncio.Future[None] | None = None
+        self._closing = asyncio.Event()
+        self._owner: asyncio.Task[None] | None = None
+        self._eviction: asyncio.TimerHandle | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+        self.max_in_flight = max(int(self.config.get("max_in_flight") or DEFAULT_MAX_IN_FLIGHT), 1)
+        self.pipeline = bool(self.config.get("pipeline", False))
+        self.latency = LatencyHistogram()
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+
+    @property
+    def is_connected(self) -> bool:
+        return self.session is not None and not self._closing.is_set()
+
+    def start(self, opener: SessionOpener) -> None:
+        """Open the session in a background owner task."""
+        loop = asyncio.get_running_loop()
+        self._ready = loop.create_future()
+        self._owner = loop.create_task(self._run(opener), name=f"mcp-session:{self.key}")
+
+    async def wait_ready(self) -> None:
+        """Wait until the session is open; raises if opening failed."""
+        assert self._ready is not None, "PooledSession.start() was not called"
+        # Shield so a cancelled waiter does not cancel the shared future
+        await asyncio.shield(self._ready)
+
+    async def _run(self, opener: SessionOpener) -> None:
+        assert self._ready is not None
+        try:
+            async with AsyncExitStack() as stack:
+                session = await opener(self.config, stack, self._handle_message)
+                identity = _server_identity(await session.initialize())
+                self.session = session
+                if identity is not None and self._discovery_cache is not None:
+                    self._discovery_key = MCPDiscoveryCache.key(self.key, *identity)
+                await self._load_discovery()
+                self._ready.set_result(None)
+                await self._closing.wait()
+        except asyncio.CancelledError:
+            if not self._ready.done():
+                self._ready.cancel()
+            raise
+        except Exception as e:
+            if not self._ready.done():
+                self._ready.set_exception(e)
+            else:
+                logger.error(f"MCP session {self.key} closed with error: {e}")
+        finally:
+            self.session = None
+            self._closing.set()
+            if self._refresh_task is not None:
+                self._refresh_task.cancel()
+
+    async def _load_discovery(self) -> None:
+        record = None
+        if self._discovery_key is not None and self._discovery_cache is not None:
+            record = self._discovery_cache.load(self._discovery_key)
+        if record is None:
+            await self._fetch_discovery()
+            return
+
+        self.tool_specs = [MCPToolSpec.model_validate(tool) for tool in record.tools]
+        self.resources.update(record.resources)
+        self.discovered_at = record.fetched_at
+        logger.debug(f"Loaded cached discovery for {self.key}: {len(self.tool_specs)} tools")
+
+    async def _fetch_discovery(self) -> None:
+        tools_listed = await self._discover_tools()
+        resources_listed = await self._discover_resources()
+        self.discovered_at = time.time()
+
+        # Only complete listings are worth persisting
+        if (
+            tools_listed
+            and resources_listed
+            and self._discovery_key is not None
+            and self._discovery_cache is not None
+        ):
+            self._discovery_cache.store(
+                self._discovery_key,
+                DiscoveryRecord(
+                    tools=[spec.model_dump(mode="json") for spec in self.tool_specs],
+                    resources=dict(self.resources),
+                    fetched_at=self.discovered_at,
+                ),
+            )
+
+    async def _discover_tools(self) -> bool:
+        assert self.session is not None
+        try:
+            tools_response = await self.session.list_tools()
+            self.tool_specs = [
+                MCPToolSpec(
+                    name=tool_info.name,
+                    description=tool_info.description,
+                    input_schema=tool_info.inputSchema
+                    if hasattr(tool_info, "inputSchema")
+                    else None,
+                )
+                for tool_info in tools_response.tools
+            ]
+            return True
+        except Exception as e:
+            logger.error(f"Failed to discover tools from {self.key}: {e}")
+            return False
+
+    async def _discover_resources(self) -> bool:
+        assert self.session is not None
+        try:
+            resources_response = await self.session.list_resources()
+            resources = {}
+            for resource in resources_response.resources:
+                resources[str(resource.uri)] = {  # type: ignore[index]
+                    "uri": resource.uri,
+                    "name": resource.name,
+                    "description": resource.description
+                    if hasattr(resource, "description")
+                    else None,
+                    "mimeType": resource.mimeType if hasattr(resource, "mimeType") else None,
+                }
+            # Update in place; attached connections hold this dictionary
+            self.resources.clear()
+            self.resources.update(resources)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to discover resources from {self.key}: {e}")
+            return False
+
+    def discovery_expired(self, ttl: float) -> bool:
+        return time.time() - self.discovered_at > ttl
+
+    async def refresh(self, max_age: float | None = None) -> None:
+        """
+        Fetch tool and resource listings from the server again.
+
+        Listeners are called after the listings change.
+
+        Args:
+            max_age: Skip the refresh if the listings are younger than this
+        """
+        async with self._refresh_lock:
+            if self.session is None:
+                return
+            if max_age is not None and not self.discovery_expired(max_age):
+                return
+            await self._fetch_discovery()
+        for listener in list(self._listeners):
+            try:
+                listener(self)
+            except Exception as e:
+                logger.error(f"MCP tools-changed listener failed for {self.key}: {e}")
+
+    async def _handle_message(self, message: Any) -> None:
+        # mcp 1.x wraps notifications in a ServerNotification root model
+        notification = getattr(message, "root", message)
+        if not isinstance(
+            notification, (ToolListChangedNotification, ResourceListChangedNotification)
+        ):
+            return
+        if self._discovery_key is not None and self._discovery_cache is not None:
+            self._discovery_cache.invalidate(self._discovery_key)
+        # Refresh in a task: listing from inside the receive loop would deadlock
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self.refresh())
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> Any:
+        """
+        Call a tool on the server, waiting for an in-flight slot first.
+
+        Cancelling the caller cancels the outstanding request.
+
+        Args:
+            name: Server-side tool name
+            arguments: Tool arguments
+
+        Returns:
+            The server's tool result
+
+        Raises:
+            ConnectionError: If the session has been closed
+        """
+        async with self._in_flight:
+            session = self.session
+            if session is None or self._closing.is_set():
+                raise ConnectionError(f"MCP session {self.key} is closed")
+            start = time.perf_counter()
+            try:
+                result = await session.call_tool(name, arguments)
+            except Exception:
+                self.latency.record(time.perf_counter() - start, error=True)
+                raise
+            self.latency.record(time.perf_counter() - start)
+            return result
+
+    def add_listener(self, listener: Callable[[PooledSession], None]) -> None:
+        """Call ``listener`` with this session after its listings are refreshed."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[PooledSession], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def adapters(self, namespace: str | None, timeout: float) -> dict[str, MCPToolAdapter]:
+        """
+        Build tool adapters for the discovered tools.
+
+        Each call returns new adapters, so every attached agent records its own
+        tool responses. The tool specs and their generated input models are
+        shared.
+
+        Args:
+            namespace: Optional prefix for tool names
+            timeout: Tool execution timeout in seconds
+
+        Returns:
+            Dictionary of tool name to adapter
+        """
+        adapters: dict[str, MCPToolAdapter] = {}
+        for spec in self.tool_specs:
+            tool_name = f"{namespace}:{spec.name}" if namespace else spec.name
+            adapters[tool_name] = MCPToolAdapter(
+                mcp_client=self,
+                tool_spec=spec,
+                name=tool_name,
+                timeout=timeout,
+            )
+        return adapters
+
+    def schedule_eviction(self, delay: float, evict: Callable[[PooledSession], None]) -> None:
+        self.cancel_eviction()
+        self._eviction = asyncio.get_running_loop().call_later(delay, evict, self)
+
+    def cancel_eviction(self) -> None:
+        if self._eviction is not None:
+            self._eviction.cancel()
+            self._eviction = None
+
+    async def aclose(self) -> None:
+        """Close the session and wait for its transport to shut down."""
+        self.cancel_eviction()
+        self._closing.set()
+        if self._owner is not None and self._owner is not asyncio.current_task():
+            await asyncio.gather(self._owner, return_exceptions=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"PooledSession(key={self.key}, refcount={self.refcount}, "
+            f"connected={self.is_connected})"
+        )
+
+
+class MCPSessionPool:
+    """
+    Reference-counted MCP sessions keyed by server configuration.
+
+    The first agent to acquire a server opens the session and runs discovery;
+    later agents, forks and ``AgentAsTool`` sessions attach to the open session
+    with a dictionary lookup. A session is closed ``idle_timeout`` seconds
+    after its last reference is released, unless it is acquired again first.
+    Sessions belong to the event loop that opened them, so each loop has its
+    own set of entries.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        discovery_cache: MCPDiscoveryCache | None = None,
+        discovery_ttl: float = DEFAULT_DISCOVERY_TTL,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            idle_timeout: Seconds an unreferenced session stays open
+            discovery_cache: Optional on-disk cache of discovery results
+            discovery_ttl: Seconds before an open session's listings are
+                fetched again
+        """
+        self.idle_timeout = idle_timeout
+        self.discovery_cache = discovery_cache
+        self.discovery_ttl = discovery_ttl
+        self._sessions: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, PooledSession]
+        ] = weakref.WeakKeyDictionary()
+
+    def _loop_sessions(self) -> dict[str, PooledSession]:
+        loop = asyncio.get_running_loop()
+        sessions = self._sessions.get(loop)
+        if sessions is None:
+            sessions = self._sessions[loop] = {}
+        return sessions
+
+    async def acquire(self, config: Mapping[str, Any], opener: SessionOpener) -> PooledSession:
+        """
+        Return an open session for ``config``, opening it if needed.
+
+        Args:
+            config: Server configuration
+            opener: Called to open the session when none is pooled
+
+        Returns:
+            The pooled session, with one more reference held by the caller
+
+        Raises:
+            Exception: Whatever ``opener`` or session initialization raised
+        """
+        sessions = self._loop_sessions()
+        key = session_key(config)
+        entry = sessions.get(key)
+        if entry is not None and entry._closing.is_set():
+            sessions.pop(key, None)
+            entry = None
+        if entry is None:
+            entry = PooledSession(key, config, self.discovery_cache)
+            sessions[key] = entry
+            entry.start(opener)
+        else:
+            self._check_settings(entry, config)
+
+        # Take the reference before waiting so the entry cannot be evicted
+        entry.refcount += 1
+        entry.cancel_eviction()
+        try:
+            await entry.wait_ready()
+        except BaseException:
+            entry.refcount -= 1
+            if sessions.get(key) is entry and entry._closing.is_set():
+                del sessions[key]
+            raise
+        if entry.discovery_expired(self.discovery_ttl):
+            await entry.refresh(max_age=self.discovery_ttl)
+        return entry
+
+    @staticmethod
+    def _check_settings(entry: PooledSession, config: Mapping[str, Any]) -> None:
+        """Warn when ``config`` asks for call settings the open session does not use."""
+        requested = {
+            "max_in_flight": config.get("max_in_flight"),
+            "pipeline": config.get("pipeline"),
+        }
+        active = {"max_in_flight": entry.max_in_flight, "pipeline": entry.pipeline}
+        conflicts = [
+            f"{name}={requested[name]!r} (session uses {active[name]!r})"
+            for name in requested
+            if requested[name] is not None and requested[name] != active[name]
+        ]
+        if conflicts:
+            logger.warning(
+                f"MCP session {entry.key} is already open with other settings; "
+                f"ignoring {', '.join(conflicts)}"
+            )
+
+    def release(self, entry: PooledSession) -> None:
+        """Drop one reference; idle sessions are closed after ``idle_timeout``."""
+        if entry.refcount <= 0:
+            logger.warning(f"Released MCP session {entry.key} more times than acquired")
+            return
+        entry.refcount -= 1
+        if entry.refcount == 0:
+            if self.idle_timeout <= 0:
+                self._evict(entry)
+            else:
+                entry.schedule_eviction(self.idle_timeout, self._evict)
+
+    def _evict(self, entry: PooledSession) -> None:
+        entry._eviction = None
+        if entry.refcount > 0:
+            return
+        for sessions in self._sessions.values():
+            if sessions.get(entry.key) is entry:
+                del sessions[entry.key]
+                break
+        entry._closing.set()
+        logger.debug(f"Closed idle MCP session: {entry.key}")
+
+    def get(self, config: Mapping[str, Any]) -> PooledSession | None:
+        """Return the open session for ``config`` on the running loop, if any."""
+        entry = self._loop_sessions().get(session_key(config))
+        return entry if entry is not None and entry.is_connected else None
+
+    async def aclose(self) -> None:
+        """Close every session opened on the running event loop."""
+        sessions = self._loop_sessions()
+        entries = list(sessions.values())
+        sessions.clear()
+        for entry in entries:
+            await entry.aclose()
+
+    def __len__(self) -> int:
+        return len(self._loop_sessions())
+
+
+# Global pool instance
+_global_pool: MCPSessionPool | None = None
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """
+    Get the process-wide MCP session pool.
+
+    Returns:
+        The global session pool
+    """
+    global _global_pool
+    if _global_pool is None:
+        _global_pool = MCPSessionPool(discovery_cache=MCPDiscoveryCache())
+    return _global_pool
+
+
+async def clear_mcp_session_pool() -> None:
+    """
+    Close pooled sessions on the running loop and reset the global pool.
+
+    This is primarily useful for testing to ensure clean state between tests.
+    """
+    global _global_pool
+    if _global_pool is not None:
+        await _global_pool.aclose()
+        _global_pool = None
@@ -784,6 +784,23 @@ class Message(PrivateAttrBase, GoodBase, ABC):
         """Set the parent agent reference."""
         self._agent_ref = weakref.ref(agent)
 
+    def _for_agent(self, agent: Agent) -> Self:
+        """Return this message bound to ``agent``.
+
+        A message keeps a single owning agent, so sharing history between agents
+        (forks, pooled agents) goes through a shallow copy instead of re-pointing
+        the original. The copy keeps the ID and shares the immutable content; only
+        the agent binding and per-agent render state are its own.
+        """
+        if self._agent_ref is not None and self._agent_ref() is agent:
+            return self
+        bound = self.model_copy()
+        bound._rendered_cache = {}
+        bound._rendered_content = None
+        bound._context = dict(self._context or {})
+        bound._agent_ref = weakref.ref(agent)
+        return bound
+
     def copy_with(self, content: Any | None = None, **kwargs) -> Self:
         """Create a copy of this message with updated fields.
 
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from good_agent.messages.base import Message, MessageContent
-from good_agent.messages.message_list import MessageList
+from good_agent.messages.message_list import MessageList, _RoleView
 
 if TYPE_CHECKING:
     from good_agent.agent import Agent
@@ -14,16 +14,20 @@ if TYPE_CHECKING:
 T_Message = TypeVar("T_Message", bound=Message)
 
 
-class FilteredMessageList(MessageList[T_Message], Generic[T_Message]):
+class FilteredMessageList(_RoleView[T_Message], Generic[T_Message]):
     """Filtered view of messages by role with simplified append semantics.
 
     Provides role-specific message lists (agent.user, agent.assistant, etc.)
     with convenient append methods that automatically set the role.
 
+    Without ``messages`` the list is a live view: reads go to the agent's role
+    index, so ``len()``, indexing and truthiness are O(1), nothing is copied,
+    and the view always reflects the current conversation.
+
     Args:
         agent: Parent agent
         role: Message role to filter by
-        messages: Optional initial messages (usually from filtering)
+        messages: Optional fixed messages to hold instead of the live view
 
     Example:
         >>> agent.user.append("Hello")  # Creates UserMessage automatically
@@ -31,10 +35,12 @@ class FilteredMessageList(MessageList[T_Message], Generic[T_Message]):
     """
 
     def __init__(self, agent: Agent, role: str, messages: Iterable[T_Message] | None = None):
-        # Initialize with provided messages
-        super().__init__(messages)
+        super().__init__(None, role, messages)
         self._agent = agent
-        self._role = role
+
+    def _parent(self) -> MessageList[Any]:
+        """The agent's current message list."""
+        return self._agent.messages
 
     def append(self, *content_parts: MessageContent, **kwargs) -> None:
         """Append message with automatic role assignment.
@@ -60,11 +66,8 @@ class FilteredMessageList(MessageList[T_Message], Generic[T_Message]):
         """
         from good_agent.content import RenderMode
 
-        # Filter agent's messages by role and return first message's content
-        for msg in self._agent.messages:
-            if msg.role == self._role:
-                return msg.render(RenderMode.DISPLAY)
-        return None
+        messages = self._source()
+        return messages[0].render(RenderMode.DISPLAY) if messages else None
 
     def set(self, *content_parts: MessageContent, **kwargs) -> None:
         """Set the system message (only available for system role).
@@ -111,13 +114,5 @@ class FilteredMessageList(MessageList[T_Message], Generic[T_Message]):
         # Add the new message
         self._agent.messages.append(message)  # type: ignore[arg-type]
 
-    def __bool__(self) -> bool:
-        """Check if any messages exist for this role.
-
-        Returns:
-            True if messages exist, False otherwise
-        """
-        return any(msg.role == self._role for msg in self._agent.messages)
-
 
 __all__ = ["FilteredMessageList"]
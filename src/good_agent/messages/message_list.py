@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import weakref
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
     Any,
     Generic,
     Literal,
+    Self,
     SupportsIndex,
     TypeVar,
     cast,
@@ -26,10 +28,44 @@ from good_agent.messages.roles import (
 if TYPE_CHECKING:
     from good_agent.agent import Agent
     from good_agent.messages.versioning import MessageRegistry, VersionManager
+    from good_agent.tools import ToolCall
 
 T_Message = TypeVar("T_Message", bound=Message)
 
 
+@dataclass(slots=True)
+class _TokenTally:
+    """Running per-role token counts for one model, settled lazily on read."""
+
+    by_role: dict[str, int]
+    length: int
+    added: list[Message] = field(default_factory=list)
+    removed: list[Message] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _ToolCallIndex:
+    """Tool calls issued in a message list, extended as messages are appended."""
+
+    edits: int
+    length: int = 0
+    calls: dict[str, tuple[int, ToolCall]] = field(default_factory=dict)
+    """tool_call_id -> (message index, ToolCall) for every call issued"""
+    pending: dict[str, tuple[int, ToolCall]] = field(default_factory=dict)
+    """The subset of ``calls`` without a tool response, in call order"""
+    resolved: set[str] = field(default_factory=set)
+    """tool_call_ids answered by a tool message"""
+
+
+@dataclass(slots=True)
+class _RoleIndex:
+    """Messages partitioned by role, extended as messages are appended."""
+
+    edits: int
+    length: int = 0
+    messages: dict[str, list[Message]] = field(default_factory=dict)
+
+
 class MessageList(list[T_Message], Generic[T_Message]):
     """Enhanced message list with version tracking and agent integration.
 
@@ -54,10 +90,20 @@ class MessageList(list[T_Message], Generic[T_Message]):
         self._registry: MessageRegistry | None = None
         self._version_manager: VersionManager | None = None
         self._agent_ref: weakref.ReferenceType[Agent] | None = None
+        self._token_tallies: dict[tuple[str, bool], _TokenTally] = {}
+        # Bumped on every change other than appending, so observers that
+        # cache per-prefix state (e.g. sequence validation) know to start over
+        self._edits = 0
+        self._tool_calls: _ToolCallIndex | None = None
+        self._roles: _RoleIndex | None = None
 
     def _set_agent(self, agent: Agent):
         self._agent_ref = weakref.ref(agent)
 
+    def _source(self) -> list[T_Message]:
+        """The list holding this list's messages; role views read another list."""
+        return self
+
     def _init_versioning(
         self, registry: MessageRegistry, version_manager: VersionManager, agent: Agent
     ):
@@ -81,12 +127,111 @@ class MessageList(list[T_Message], Generic[T_Message]):
                 message_ids.append(message.id)
             self._version_manager.add_version(message_ids)
 
+    def _record_token_change(
+        self, removed: Iterable[Message] = (), added: Iterable[Message] = ()
+    ) -> None:
+        """Queue membership changes for every running token tally."""
+        if not self._token_tallies:
+            return
+        removed = list(removed)
+        added = list(added)
+        for tally in self._token_tallies.values():
+            tally.removed.extend(removed)
+            tally.added.extend(added)
+            tally.length += len(added) - len(removed)
+
+    def token_counts(self, model: str, include_tools: bool = True) -> dict[str, int]:
+        """Token counts per role, kept as a running tally per model.
+
+        The first call for a model counts every message; later calls only count
+        messages added since, so reading the tally is O(1) between changes.
+
+        Args:
+            model: Model name for tokenizer selection
+            include_tools: Whether to include tool call tokens
+
+        Returns:
+            Mapping of role to token count
+        """
+        from good_agent.utilities.tokens import get_message_token_counts
+
+        key = (model, include_tools)
+        tally = self._token_tallies.get(key)
+        if tally is None or tally.length != len(self):
+            # First read, or the list was changed in a way the tally cannot follow
+            tally = _TokenTally(by_role={}, length=len(self), added=list(self))
+            self._token_tallies[key] = tally
+
+        if tally.removed:
+            for message, count in zip(
+                tally.removed,
+                get_message_token_counts(tally.removed, model, include_tools),
+                strict=True,
+            ):
+                tally.by_role[message.role] = tally.by_role.get(message.role, 0) - count
+            tally.removed.clear()
+
+        if tally.added:
+            for message, count in zip(
+                tally.added,
+                get_message_token_counts(tally.added, model, include_tools),
+                strict=True,
+            ):
+                tally.by_role[message.role] = tally.by_role.get(message.role, 0) + count
+            tally.added.clear()
+
+        return dict(tally.by_role)
+
+    def _tool_call_index(self) -> _ToolCallIndex:
+        """Index of issued and pending tool calls, brought up to date on read.
+
+        Messages appended since the last read are folded in; any other edit
+        (replacement, removal, version revert) rebuilds the index.
+        """
+        messages = self._source()
+        index = self._tool_calls
+        if index is None or index.edits != self._edits or index.length > len(messages):
+            index = self._tool_calls = _ToolCallIndex(edits=self._edits)
+
+        for position in range(index.length, len(messages)):
+            message = list.__getitem__(messages, position)
+            if isinstance(message, ToolMessage) and message.tool_call_id:
+                index.resolved.add(message.tool_call_id)
+                index.pending.pop(message.tool_call_id, None)
+            elif isinstance(message, AssistantMessage) and message.tool_calls:
+                for tool_call in message.tool_calls:
+                    index.calls[tool_call.id] = (position, tool_call)
+                    if tool_call.id not in index.resolved:
+                        index.pending[tool_call.id] = (position, tool_call)
+        index.length = len(messages)
+        return index
+
+    def _role_index(self) -> dict[str, list[Message]]:
+        """Messages grouped by role, in order, brought up to date on read.
+
+        Appended messages are folded in; any other edit rebuilds the groups.
+        The returned lists are owned by the index and must not be mutated.
+        """
+        messages = self._source()
+        index = self._roles
+        if index is None or index.edits != self._edits or index.length > len(messages):
+            index = self._roles = _RoleIndex(edits=self._edits)
+
+        groups = index.messages
+        for position in range(index.length, len(messages)):
+            message = list.__getitem__(messages, position)
+            groups.setdefault(message.role, []).append(message)
+        index.length = len(messages)
+        return groups
+
     def _sync_from_version(self):
         """Sync list contents from current version (internal method)."""
         if not self._version_manager or not self._registry:
             return
 
-        # Clear current list
+        # Clear current list; token tallies are rebuilt on the next read
+        self._token_tallies.clear()
+        self._edits += 1
         super().clear()
 
         # Rebuild from version
@@ -110,15 +255,14 @@ class MessageList(list[T_Message], Generic[T_Message]):
         """
         # Standard list append
         super().append(message)
+        self._record_token_change(added=(message,))
 
         # If versioning is enabled, update version
         if self._version_manager and self._registry and self._agent_ref:
             agent = self._agent_ref()
             if agent:
                 self._registry.register(message, agent)  # type: ignore[arg-type]
-                new_version = self._version_manager.current_version
-                new_version.append(message.id)
-                self._version_manager.add_version(new_version)
+                self._version_manager.append_message_ids([message.id])
 
     @overload
     def __setitem__(self, index: SupportsIndex, message: T_Message) -> None: ...
@@ -136,7 +280,11 @@ class MessageList(list[T_Message], Generic[T_Message]):
         # For slices, we need special handling
         if isinstance(index, slice):
             # Standard list setitem for slices
+            message = list(message)
+            replaced = list.__getitem__(self, index)
             super().__setitem__(index, message)
+            self._record_token_change(removed=replaced, added=message)
+            self._edits += 1
 
             # If versioning is enabled, create new version with all current IDs
             if self._version_manager and self._registry and self._agent_ref:
@@ -153,7 +301,10 @@ class MessageList(list[T_Message], Generic[T_Message]):
         else:
             # Single item replacement
             # Standard list setitem
+            replaced = list.__getitem__(self, index)
             super().__setitem__(index, message)
+            self._record_token_change(removed=(replaced,), added=(message,))
+            self._edits += 1
 
             # If versioning is enabled, create new version
             if self._version_manager and self._registry and self._agent_ref:
@@ -182,20 +333,25 @@ class MessageList(list[T_Message], Generic[T_Message]):
 
         # Standard list extend
         super().extend(message_list)
+        self._record_token_change(added=message_list)
 
         # If versioning is enabled, create single new version
         if self._version_manager and self._registry and self._agent_ref:
             agent = self._agent_ref()
             if agent:
-                new_version = list(self._version_manager.current_version)
                 for message in message_list:
                     self._registry.register(message, agent)  # type: ignore[arg-type]
-                    new_version.append(message.id)
-                self._version_manager.add_version(new_version)
+                self._version_manager.append_message_ids([message.id for message in message_list])
 
     def clear(self) -> None:
         """Clear all messages and create empty version."""
         super().clear()
+        for tally in self._token_tallies.values():
+            tally.by_role.clear()
+            tally.added.clear()
+            tally.removed.clear()
+            tally.length = 0
+        self._edits += 1
 
         # If versioning is enabled, create empty version
         if self._version_manager:
@@ -209,6 +365,8 @@ class MessageList(list[T_Message], Generic[T_Message]):
         """
         # Insert at beginning
         super().insert(0, message)
+        self._record_token_change(added=(message,))
+        self._edits += 1
 
         # If versioning is enabled, create new version
         if self._version_manager and self._registry and self._agent_ref:
@@ -222,6 +380,34 @@ class MessageList(list[T_Message], Generic[T_Message]):
                 new_ids = [message.id] + current_ids
                 self._version_manager.add_version(new_ids)
 
+    def insert(self, index: SupportsIndex, message: T_Message) -> None:
+        super().insert(index, message)
+        self._record_token_change(added=(message,))
+        self._edits += 1
+
+    def pop(self, index: SupportsIndex = -1) -> T_Message:
+        message = super().pop(index)
+        self._record_token_change(removed=(message,))
+        self._edits += 1
+        return message
+
+    def remove(self, message: T_Message) -> None:
+        super().remove(message)
+        self._record_token_change(removed=(message,))
+        self._edits += 1
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        removed = list.__getitem__(self, index)
+        super().__delitem__(index)
+        self._record_token_change(removed=removed if isinstance(index, slice) else (removed,))
+        self._edits += 1
+
+    def __iadd__(self, messages: Iterable[T_Message]) -> Self:  # type: ignore[override]
+        added = list(messages)
+        super().__iadd__(added)
+        self._record_token_change(added=added)
+        return self
+
     def replace_at(self, index: int, message: T_Message) -> None:
         """Replace message at index with versioning support.
 
@@ -272,15 +458,11 @@ class MessageList(list[T_Message], Generic[T_Message]):
         result = self
 
         if role is not None:
-            # Type-specific filtering based on role
-            filtered: list[Message] = []
-            for m in result:
-                if m.role == role:
-                    filtered.append(m)
-            result = MessageList(filtered)  # type: ignore[arg-type]
+            # A live view over the role index rather than a copy
+            result = _RoleView(self, role)
 
         for key, value in kwargs.items():
-            filtered = []
+            filtered: list[Message] = []
             for m in result:
                 if getattr(m, key, None) == value:
                     filtered.append(m)
@@ -291,26 +473,22 @@ class MessageList(list[T_Message], Generic[T_Message]):
     @property
     def user(self) -> MessageList[UserMessage]:
         """Get all user messages."""
-        filtered = [m for m in self if isinstance(m, UserMessage)]
-        return MessageList[UserMessage](filtered)
+        return _RoleView[UserMessage](self, "user")
 
     @property
     def assistant(self) -> MessageList[AssistantMessage]:
         """Get all assistant messages."""
-        filtered = [m for m in self if isinstance(m, AssistantMessage)]
-        return MessageList[AssistantMessage](filtered)
+        return _RoleView[AssistantMessage](self, "assistant")
 
     @property
     def system(self) -> MessageList[SystemMessage]:
         """Get all system messages."""
-        filtered = [m for m in self if isinstance(m, SystemMessage)]
-        return MessageList[SystemMessage](filtered)
+        return _RoleView[SystemMessage](self, "system")
 
     @property
     def tool(self) -> MessageList[ToolMessage]:
         """Get all tool messages."""
-        filtered = [m for m in self if isinstance(m, ToolMessage)]
-        return MessageList[ToolMessage](filtered)
+        return _RoleView[ToolMessage](self, "tool")
 
     @overload
     def __getitem__(self, key: SupportsIndex, /) -> T_Message: ...
@@ -331,4 +509,105 @@ class MessageList(list[T_Message], Generic[T_Message]):
         return result
 
 
+class _RoleView(MessageList[T_Message], Generic[T_Message]):
+    """Live view of one role's messages in a parent ``MessageList``.
+
+    Reads go to the parent's role index, so nothing is copied and the view
+    always reflects the parent's current contents. The view's own list storage
+    stays empty; change the parent to change what the view shows.
+
+    Args:
+        parent: List whose messages are viewed
+        role: Message role to view
+        messages: Optional fixed messages to hold instead of the live view
+    """
+
+    def __init__(
+        self,
+        parent: MessageList[Any] | None,
+        role: str,
+        messages: Iterable[T_Message] | None = None,
+    ):
+        self._live = messages is None
+        self._parent_list = parent
+        self._role = role
+        super().__init__(messages)
+
+    def _parent(self) -> MessageList[Any]:
+        """The list being viewed."""
+        assert self._parent_list is not None
+        return self._parent_list
+
+    def _source(self) -> list[T_Message]:
+        """The parent's messages for this role, or this list when not live."""
+        if self._live:
+            return cast(list[T_Message], self._parent()._role_index().get(self._role, []))
+        return self
+
+    @property
+    def _edits(self) -> int:  # type: ignore[override]
+        # Index caches on a live view are invalidated by edits to the parent
+        return self._parent()._edits if self._live else self._own_edits
+
+    @_edits.setter
+    def _edits(self, value: int) -> None:
+        self._own_edits = value
+
+    def _role_index(self) -> dict[str, list[Message]]:
+        if not self._live:
+            return super()._role_index()
+        messages = self._source()
+        return {self._role: cast(list[Message], messages)} if messages else {}
+
+    def token_counts(self, model: str, include_tools: bool = True) -> dict[str, int]:
+        """Token counts per role, read from the parent's running tally when live."""
+        if not self._live:
+            return super().token_counts(model, include_tools)
+        counts = self._parent().token_counts(model, include_tools)
+        return {self._role: counts[self._role]} if self._role in counts else {}
+
+    def __len__(self) -> int:
+        return list.__len__(self._source())
+
+    def __iter__(self) -> Iterator[T_Message]:
+        return list.__iter__(self._source())
+
+    def __reversed__(self) -> Iterator[T_Message]:
+        return list.__reversed__(self._source())
+
+    def __contains__(self, message: object) -> bool:
+        return list.__contains__(self._source(), message)
+
+    @overload
+    def __getitem__(self, key: SupportsIndex, /) -> T_Message: ...
+
+    @overload
+    def __getitem__(self, key: slice, /) -> list[T_Message]: ...
+
+    def __getitem__(self, key: SupportsIndex | slice, /) -> T_Message | list[T_Message]:
+        return list.__getitem__(self._source(), key)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _RoleView):
+            other = other._source()
+        return list.__eq__(self._source(), other)  # type: ignore[arg-type]
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return list.__repr__(self._source())
+
+    def __bool__(self) -> bool:
+        return bool(list.__len__(self._source()))
+
+    def index(self, message: Any, *args: Any) -> int:
+        return list.index(self._source(), message, *args)
+
+    def count(self, message: Any) -> int:
+        return list.count(self._source(), message)
+
+
 __all__ = ["MessageList", "T_Message"]
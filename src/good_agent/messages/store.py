@@ -1,5 +1,9 @@
 import asyncio
+import sqlite3
+import threading
 import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from ulid import ULID
@@ -16,6 +20,45 @@ class MessageNotFoundError(Exception):
     pass
 
 
+def _dump_message(message: Message) -> bytes:
+    """Serialize a message to JSON bytes for Redis or a spill tier."""
+    try:
+        import orjson
+
+        json_dumps = orjson.dumps
+    except ImportError:
+        import json
+
+        def json_dumps(x):  # type: ignore[misc]
+            return json.dumps(x).encode()
+
+    # Use new serialization method if available
+    if hasattr(message, "serialize_for_storage"):
+        message_data = message.serialize_for_storage()
+    else:
+        # Fallback to standard model_dump
+        message_data = message.model_dump()
+    return json_dumps(message_data)
+
+
+def _load_message(data: bytes | str) -> Message:
+    """Deserialize a message written by :func:`_dump_message`."""
+    try:
+        import orjson
+
+        json_loads = orjson.loads
+    except ImportError:
+        import json
+
+        json_loads = json.loads
+
+    # Handle both bytes and string data
+    if isinstance(data, bytes):
+        data = data.decode()
+    # MessageFactory.from_dict handles both old and new formats
+    return MessageFactory.from_dict(json_loads(data))
+
+
 @runtime_checkable
 class MessageStore(Protocol):
     """Protocol for message storage implementations"""
@@ -45,35 +88,239 @@ class MessageStore(Protocol):
         ...
 
 
+@runtime_checkable
+class MessageSpillTier(Protocol):
+    """Protocol for local storage that receives messages evicted from memory"""
+
+    def write(self, message_id: str, data: bytes) -> None:
+        """Persist serialized message data"""
+        ...
+
+    def read(self, message_id: str) -> bytes | None:
+        """Return serialized message data, or None if absent"""
+        ...
+
+    def contains(self, message_id: str) -> bool:
+        """Check if message data is present"""
+        ...
+
+    def clear(self) -> None:
+        """Remove all message data"""
+        ...
+
+
+class SQLiteSpillTier:
+    """
+    Spill tier backed by a single SQLite table.
+
+    Defaults to a private in-memory database; pass a file path to keep evicted
+    messages on disk. Safe to call from multiple threads.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Initialize the spill tier.
+
+        Args:
+            path: SQLite database path (default: in-memory database)
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS messages (id TEXT PRIMARY KEY, data BLOB NOT NULL)"
+        )
+
+    def write(self, message_id: str, data: bytes) -> None:
+        """Persist serialized message data, replacing any previous copy"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO messages (id, data) VALUES (?, ?)", (message_id, data)
+            )
+
+    def read(self, message_id: str) -> bytes | None:
+        """Return serialized message data, or None if absent"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM messages WHERE id = ?", (message_id,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def contains(self, message_id: str) -> bool:
+        """Check if message data is present"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM messages WHERE id = ?", (message_id,)
+            ).fetchone()
+        return row is not None
+
+    def clear(self) -> None:
+        """Remove all message data"""
+        with self._lock:
+            self._conn.execute("DELETE FROM messages")
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        """Return number of spilled messages"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+
+
+@dataclass(slots=True)
+class MessageStoreStats:
+    """Counters describing how an :class:`InMemoryMessageStore` is being used"""
+
+    hits: int = 0
+    """Lookups served from the LRU hot tier"""
+    weak_hits: int = 0
+    """Lookups served by a message evicted from the hot tier but still referenced elsewhere"""
+    faults: int = 0
+    """Lookups served by loading a message back from the spill tier or Redis"""
+    misses: int = 0
+    """Lookups that found nothing in any tier"""
+    evictions: int = 0
+    """Messages dropped from the hot tier to respect its bounds"""
+    spills: int = 0
+    """Evicted messages written to the spill tier"""
+
+
 class InMemoryMessageStore:
     """
-    In-memory message store with optional Redis backing.
+    Tiered message store with optional Redis backing.
 
-    Provides fast access to messages with optional persistence layer.
+    Messages live in a bounded LRU hot tier. Messages evicted from it stay
+    reachable for as long as anything else (typically an agent's message list)
+    still references them, and are then released. An optional spill tier keeps
+    evicted messages so lookups can fault them back in; Redis remains available
+    as a shared backing store for async operations.
     Task-safe operations using asyncio locks.
     """
 
-    def __init__(self, redis_client: Any = None, ttl: int = 3600):
+    def __init__(
+        self,
+        redis_client: Any = None,
+        ttl: int = 3600,
+        *,
+        max_messages: int | None = 10_000,
+        max_bytes: int | None = None,
+        spill: MessageSpillTier | None = None,
+    ):
         """
         Initialize the message store.
 
         Args:
             redis_client: Optional Redis client for backing store
             ttl: Time-to-live for Redis entries in seconds (default: 1 hour)
+            max_messages: Maximum messages held in the hot tier (None for no limit)
+            max_bytes: Maximum serialized size of the hot tier (None for no limit).
+                Sizing serializes each message once when it is stored.
+            spill: Optional tier that receives messages evicted from the hot tier
         """
-        self._memory_cache: dict[str, Message] = {}
+        self._memory_cache: OrderedDict[str, Message] = OrderedDict()
+        self._live: weakref.WeakValueDictionary[str, Message] = weakref.WeakValueDictionary()
+        self._sizes: dict[str, int] = {}
+        self._hot_bytes = 0
+        self._max_messages = max_messages
+        self._max_bytes = max_bytes
+        self._spill = spill
+        self._stats = MessageStoreStats()
         self._redis_client = redis_client
         self._ttl = ttl
         self._lock = asyncio.Lock()
+        # Guards tier bookkeeping, which sync callers may touch from any thread
+        self._tiers_lock = threading.RLock()
+
+    @property
+    def stats(self) -> MessageStoreStats:
+        """Live hit, miss and eviction counters"""
+        return self._stats
+
+    @property
+    def hot_size(self) -> int:
+        """Number of messages currently held in the hot tier"""
+        return len(self._memory_cache)
 
-        # Weak reference set to track all message stores for cleanup
-        self._weak_refs: set[weakref.ref] = set()
+    @property
+    def hot_bytes(self) -> int:
+        """Serialized size of the hot tier (only tracked when max_bytes is set)"""
+        return self._hot_bytes
+
+    def _admit(self, key: str, message: Message) -> None:
+        """Insert or refresh a message at the most recently used end of the hot tier."""
+        size = len(_dump_message(message)) if self._max_bytes is not None else 0
+        with self._tiers_lock:
+            if key in self._memory_cache:
+                self._memory_cache.move_to_end(key)
+                self._hot_bytes -= self._sizes.get(key, 0)
+            self._memory_cache[key] = message
+            self._live[key] = message
+            if self._max_bytes is not None:
+                self._sizes[key] = size
+                self._hot_bytes += size
+            self._evict()
+
+    def _over_limit(self) -> bool:
+        if self._max_messages is not None and len(self._memory_cache) > self._max_messages:
+            return True
+        # Always keep the newest message, even if it alone exceeds the byte limit
+        return (
+            self._max_bytes is not None
+            and self._hot_bytes > self._max_bytes
+            and len(self._memory_cache) > 1
+        )
+
+    def _evict(self) -> None:
+        """Drop least recently used messages until within bounds. Caller holds the lock."""
+        while self._memory_cache and self._over_limit():
+            key, message = self._memory_cache.popitem(last=False)
+            self._hot_bytes -= self._sizes.pop(key, 0)
+            self._stats.evictions += 1
+            if self._spill is not None:
+                self._spill.write(key, _dump_message(message))
+                self._stats.spills += 1
+
+    def _lookup(self, key: str) -> Message | None:
+        """Find a message in the local tiers, promoting it into the hot tier."""
+        with self._tiers_lock:
+            message = self._memory_cache.get(key)
+            if message is not None:
+                self._memory_cache.move_to_end(key)
+                self._stats.hits += 1
+                return message
+
+            message = self._live.get(key)
+            if message is not None:
+                self._stats.weak_hits += 1
+                self._admit(key, message)
+                return message
+
+        if self._spill is not None:
+            data = self._spill.read(key)
+            if data is not None:
+                message = _load_message(data)
+                with self._tiers_lock:
+                    # Another caller may have faulted it in first; keep one instance
+                    existing = self._live.get(key)
+                    if existing is not None:
+                        message = existing
+                    self._stats.faults += 1
+                    self._admit(key, message)
+                return message
+
+        return None
+
+    def _is_resident(self, key: str) -> bool:
+        return key in self._memory_cache or key in self._live
 
     def get(self, message_id: ULID) -> Message:
         """
         Get a message by ID (synchronous).
 
-        First checks memory cache, falls back to Redis if available.
+        Checks the memory tiers, then the spill tier. Redis requires aget().
 
         Args:
             message_id: The unique message identifier
@@ -84,15 +331,17 @@ class InMemoryMessageStore:
         Raises:
             MessageNotFoundError: If message is not found
         """
-        # Check memory cache first
         message_id_str = str(message_id)
-        if message_id_str in self._memory_cache:
-            return self._memory_cache[message_id_str]
+        message = self._lookup(message_id_str)
+        if message is not None:
+            return message
+
+        self._stats.misses += 1
 
         # If we have Redis, try to fetch from there
         if self._redis_client:
             # For sync operation, we can't use async Redis
-            # This is a limitation - sync get only works with memory
+            # This is a limitation - sync get only works with local tiers
             raise MessageNotFoundError(
                 f"Message {message_id} not found in memory cache. Use aget() for Redis fallback."
             )
@@ -103,7 +352,7 @@ class InMemoryMessageStore:
         """
         Get a message by ID (asynchronous).
 
-        First checks memory cache, then Redis if available.
+        Checks the memory tiers, then the spill tier, then Redis if available.
 
         Args:
             message_id: The unique message identifier
@@ -115,38 +364,23 @@ class InMemoryMessageStore:
             MessageNotFoundError: If message is not found
         """
         async with self._lock:
-            # Check memory cache first
             message_id_str = str(message_id)
-            if message_id_str in self._memory_cache:
-                return self._memory_cache[message_id_str]
+            message = self._lookup(message_id_str)
+            if message is not None:
+                return message
 
             # Try Redis if available
             if self._redis_client:
                 try:
-                    try:
-                        import orjson
-
-                        json_loads = orjson.loads
-                    except ImportError:
-                        import json
-
-                        json_loads = json.loads
-
                     redis_key = f"agent:message:{message_id_str}"
                     cached_data = await self._redis_client.get(redis_key)
 
                     if cached_data:
-                        # Handle both bytes and string data
-                        if isinstance(cached_data, bytes):
-                            cached_data = cached_data.decode()
-
-                        # Deserialize message from Redis
-                        message_data = json_loads(cached_data)
-                        # MessageFactory.from_dict now handles both old and new formats
-                        message = MessageFactory.from_dict(message_data)
+                        message = _load_message(cached_data)
 
                         # Store in memory cache for faster future access
-                        self._memory_cache[message_id_str] = message
+                        self._stats.faults += 1
+                        self._admit(message_id_str, message)
                         return message
 
                 except Exception:
@@ -154,25 +388,26 @@ class InMemoryMessageStore:
                     # In production, would use proper logging
                     pass
 
+            self._stats.misses += 1
             raise MessageNotFoundError(f"Message {message_id} not found")
 
     def put(self, message: Message) -> None:
         """
         Store a message (synchronous).
 
-        Stores in memory cache immediately.
+        Stores in the hot tier immediately, evicting older messages if needed.
 
         Args:
             message: The message to store
         """
         # Messages always have IDs due to default_factory
-        self._memory_cache[str(message.id)] = message
+        self._admit(str(message.id), message)
 
     async def aput(self, message: Message) -> None:
         """
         Store a message (asynchronous).
 
-        Stores in memory cache and Redis if available.
+        Stores in the hot tier and Redis if available.
 
         Args:
             message: The message to store
@@ -180,29 +415,13 @@ class InMemoryMessageStore:
         # Messages always have IDs due to default_factory
         async with self._lock:
             # Store in memory cache
-            self._memory_cache[str(message.id)] = message
+            self._admit(str(message.id), message)
 
             # Store in Redis if available
             if self._redis_client:
                 try:
-                    try:
-                        import orjson
-
-                        json_dumps = orjson.dumps
-                    except ImportError:
-                        import json
-
-                        def json_dumps(x):  # type: ignore[misc]
-                            return json.dumps(x).encode()
-
                     redis_key = f"agent:message:{message.id}"
-                    # Use new serialization method if available
-                    if hasattr(message, "serialize_for_storage"):
-                        message_data = message.serialize_for_storage()
-                    else:
-                        # Fallback to standard model_dump
-                        message_data = message.model_dump()
-                    cached_data = json_dumps(message_data)
+                    cached_data = _dump_message(message)
 
                     # Store with TTL
                     await self._redis_client.setex(redis_key, self._ttl, cached_data)
@@ -216,21 +435,24 @@ class InMemoryMessageStore:
         """
         Check if a message exists (synchronous).
 
-        Only checks memory cache for sync operation.
+        Checks the memory and spill tiers; Redis requires aexists().
 
         Args:
             message_id: The message identifier
 
         Returns:
-            True if message exists in memory cache
+            True if message exists locally
         """
-        return str(message_id) in self._memory_cache
+        message_id_str = str(message_id)
+        if self._is_resident(message_id_str):
+            return True
+        return self._spill is not None and self._spill.contains(message_id_str)
 
     async def aexists(self, message_id: ULID) -> bool:
         """
         Check if a message exists (asynchronous).
 
-        Checks both memory cache and Redis.
+        Checks the local tiers and Redis.
 
         Args:
             message_id: The message identifier
@@ -239,15 +461,14 @@ class InMemoryMessageStore:
             True if message exists
         """
         async with self._lock:
-            # Check memory first
-            message_id_str = str(message_id)
-            if message_id_str in self._memory_cache:
+            # Check local tiers first
+            if self.exists(message_id):
                 return True
 
             # Check Redis if available
             if self._redis_client:
                 try:
-                    redis_key = f"agent:message:{message_id_str}"
+                    redis_key = f"agent:message:{message_id}"
                     exists_count = await self._redis_client.exists(redis_key)
                     return bool(exists_count > 0)
                 except Exception:
@@ -256,14 +477,23 @@ class InMemoryMessageStore:
 
             return False
 
+    def _clear_local(self) -> None:
+        with self._tiers_lock:
+            self._memory_cache.clear()
+            self._live.clear()
+            self._sizes.clear()
+            self._hot_bytes = 0
+        if self._spill is not None:
+            self._spill.clear()
+
     def clear(self) -> None:
-        """Clear all messages from memory cache"""
-        self._memory_cache.clear()
+        """Clear all messages from the memory and spill tiers"""
+        self._clear_local()
 
     async def aclear(self) -> None:
-        """Clear all messages from memory cache and Redis"""
+        """Clear all messages from the memory and spill tiers and Redis"""
         async with self._lock:
-            self._memory_cache.clear()
+            self._clear_local()
 
             if self._redis_client:
                 try:
@@ -276,12 +506,12 @@ class InMemoryMessageStore:
                     pass
 
     def __len__(self) -> int:
-        """Return number of messages in memory cache"""
-        return len(self._memory_cache)
+        """Return number of messages resident in memory (hot or still referenced)"""
+        return len(self._live)
 
     def __contains__(self, message_id: ULID) -> bool:
-        """Check if message exists in memory cache"""
-        return str(message_id) in self._memory_cache
+        """Check if message is resident in memory"""
+        return self._is_resident(str(message_id))
 
 
 # Global message store instance
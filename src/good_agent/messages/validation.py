@@ -1,5 +1,7 @@
 import logging
+import weakref
 from collections.abc import Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING
 
@@ -31,6 +33,161 @@ class ValidationError(Exception):
     pass
 
 
+@dataclass(slots=True)
+class _SequenceState:
+    """Incremental scanner state for the tool, role and system message checks.
+
+    Issues found so far are kept alongside what is needed to continue the scan
+    (open tool calls, the last non-tool role, system message positions), so
+    appended messages can be checked without revisiting the prefix. Issues that
+    depend on the end of the sequence are derived on demand.
+    """
+
+    source: weakref.ReferenceType[MessageList] | None = None
+    edits: int = 0
+    length: int = 0
+
+    # Tool sequencing
+    tool_sequence_issues: list[str] = field(default_factory=list)
+    pending_tool_calls: dict[str, tuple[int, str]] = field(default_factory=dict)
+    call_sites: dict[str, int] = field(default_factory=dict)
+    """tool_call_id -> index of the latest assistant message that issued it"""
+    responses_expected: int = 0
+    """Tool responses still expected right after the last assistant tool call"""
+
+    # Role alternation
+    role_alternation_issues: list[str] = field(default_factory=list)
+    leading_system: bool = True
+    last_non_tool_role: str | None = None
+    last_non_tool_idx: int | None = None
+    last_non_tool_has_tool_calls: bool = False
+
+    # System message placement
+    last_system_idx: int | None = None
+    first_non_system_idx: int | None = None
+
+    def advance(self, messages: Sequence[Message]) -> None:
+        """Scan the messages past ``length`` and update the state."""
+        for i in range(self.length, len(messages)):
+            msg = messages[i]
+            self._check_tool_sequencing(i, msg)
+            self._check_role_alternation(i, msg)
+            if isinstance(msg, SystemMessage):
+                self.last_system_idx = i
+            elif self.first_non_system_idx is None:
+                self.first_non_system_idx = i
+        self.length = len(messages)
+
+    def _check_tool_sequencing(self, i: int, msg: Message) -> None:
+        issues = self.tool_sequence_issues
+        pending = self.pending_tool_calls
+
+        if self.responses_expected:
+            if isinstance(msg, ToolMessage):
+                self.responses_expected -= 1
+                # Verify the tool response references a pending tool call
+                if msg.tool_call_id in pending:
+                    del pending[msg.tool_call_id]
+                else:
+                    issues.append(
+                        f"Tool response at index {i} references "
+                        f"unknown tool_call_id '{msg.tool_call_id}'"
+                    )
+                return
+
+            issues.append(f"Expected tool response at index {i}, but found {msg.role} message")
+            self.responses_expected = 0
+
+        # Track assistant messages with tool calls
+        if isinstance(msg, AssistantMessage) and msg.tool_calls:
+            for tool_call in msg.tool_calls:
+                if tool_call.id in pending:
+                    issues.append(f"Duplicate tool_call_id '{tool_call.id}' at index {i}")
+                pending[tool_call.id] = (i, tool_call.function.name)
+                self.call_sites[tool_call.id] = i
+            # The next messages should be tool responses
+            self.responses_expected = len(msg.tool_calls)
+
+        # Check for tool messages without preceding tool calls
+        elif isinstance(msg, ToolMessage):
+            if msg.tool_call_id not in pending:
+                prev_i = self.call_sites.get(msg.tool_call_id)
+                if prev_i is not None:
+                    issues.append(
+                        f"Tool response at index {i} appears out of sequence "
+                        f"(should immediately follow assistant message at index {prev_i})"
+                    )
+                else:
+                    issues.append(f"Tool response at index {i} has no corresponding tool call")
+
+        # Non-tool message with pending tool calls
+        elif pending:
+            # Some models might be OK with this, but most aren't
+            issues.append(
+                f"Unresolved tool calls {list(pending)} before {msg.role} message at index {i}"
+            )
+
+    def _check_role_alternation(self, i: int, msg: Message) -> None:
+        # Skip system messages at the beginning
+        if self.leading_system:
+            if isinstance(msg, SystemMessage):
+                return
+            self.leading_system = False
+
+        # Tool messages follow assistant messages; skip them for alternation checks
+        current_role = msg.role
+        if current_role == "tool":
+            return
+
+        has_tool_calls = bool(isinstance(msg, AssistantMessage) and msg.tool_calls)
+        last_idx = self.last_non_tool_idx
+        if self.last_non_tool_role == current_role and current_role != "system":
+            if last_idx is not None:
+                # Consecutive assistant messages are fine around tool calls: when
+                # tool messages sit between them (only tool messages can, as
+                # they are skipped above) or either side calls tools
+                if current_role != "assistant" or not (
+                    i - last_idx > 1 or has_tool_calls or self.last_non_tool_has_tool_calls
+                ):
+                    self.role_alternation_issues.append(
+                        f"Consecutive {current_role} messages at indices {last_idx} and {i}"
+                    )
+
+        self.last_non_tool_role = current_role
+        self.last_non_tool_idx = i
+        self.last_non_tool_has_tool_calls = has_tool_calls
+
+    def tool_issues(self) -> list[str]:
+        issues = list(self.tool_sequence_issues)
+        # Check for any remaining unresolved tool calls
+        if self.pending_tool_calls:
+            unresolved = [
+                f"{tool_id} (from message {idx})"
+                for tool_id, (idx, _) in self.pending_tool_calls.items()
+            ]
+            issues.append(f"Unresolved tool calls at end of sequence: {unresolved}")
+        return issues
+
+    def role_issues(self) -> list[str]:
+        return list(self.role_alternation_issues)
+
+    def system_issues(self) -> list[str]:
+        if (
+            self.last_system_idx is not None
+            and self.first_non_system_idx is not None
+            and self.last_system_idx > self.first_non_system_idx
+        ):
+            # System messages appear after non-system messages
+            return [
+                f"System message at index {self.last_system_idx} appears after "
+                f"non-system messages (consider model compatibility)"
+            ]
+        return []
+
+    def issues(self) -> list[str]:
+        return self.tool_issues() + self.role_issues() + self.system_issues()
+
+
 class MessageSequenceValidator:
     """Validates message sequences for LLM compatibility."""
 
@@ -41,6 +198,7 @@ class MessageSequenceValidator:
             mode: Validation mode (strict, warn, or silent)
         """
         self.mode = mode
+        self._state: _SequenceState | None = None
 
     def validate(self, messages: MessageList | Sequence[Message]) -> list[str]:
         """Validate a message sequence for LLM compatibility.
@@ -57,16 +215,7 @@ class MessageSequenceValidator:
         if self.mode == ValidationMode.SILENT:
             return []
 
-        issues = []
-
-        # Check tool call/response sequencing
-        issues.extend(self._validate_tool_sequencing(messages))
-
-        # Check role alternation patterns
-        issues.extend(self._validate_role_alternation(messages))
-
-        # Check system message placement
-        issues.extend(self._validate_system_messages(messages))
+        issues = self._scan(messages).issues()
 
         agent_name = "AnonymousAgent"  # Default name
         if messages[-1].agent and messages[-1].agent.name:
@@ -85,6 +234,31 @@ class MessageSequenceValidator:
 
         return issues
 
+    def _scan(self, messages: MessageList | Sequence[Message]) -> _SequenceState:
+        """Return scanner state covering every message in ``messages``.
+
+        State for the last validated ``MessageList`` is kept between calls. When
+        the list has only grown since then, just the new messages are scanned;
+        any other edit (replacement, removal, version change) starts over.
+        """
+        if not isinstance(messages, MessageList):
+            state = _SequenceState()
+            state.advance(messages)
+            return state
+
+        state = self._state
+        if (
+            state is None
+            or state.source is None
+            or state.source() is not messages
+            or state.edits != messages._edits
+            or state.length > len(messages)
+        ):
+            state = _SequenceState(source=weakref.ref(messages), edits=messages._edits)
+            self._state = state
+        state.advance(messages)
+        return state
+
     def _validate_tool_sequencing(self, messages: Sequence[Message]) -> list[str]:
         """Validate that tool responses immediately follow their tool calls.
 
@@ -94,91 +268,7 @@ class MessageSequenceValidator:
         2. Tool response messages must reference valid tool_call_ids
         3. All tool calls must have corresponding responses before the next non-tool message
         """
-        issues = []
-        pending_tool_calls = {}  # tool_call_id -> (message_index, tool_name)
-        processed_tool_responses = set()  # Track tool messages we've already validated
-
-        for i, msg in enumerate(messages):
-            # Track assistant messages with tool calls
-            if isinstance(msg, AssistantMessage) and msg.tool_calls:
-                # Record all tool calls from this message
-                for tool_call in msg.tool_calls:
-                    if tool_call.id in pending_tool_calls:
-                        issues.append(f"Duplicate tool_call_id '{tool_call.id}' at index {i}")
-                    pending_tool_calls[tool_call.id] = (
-                        i,
-                        tool_call.function.name,
-                    )
-
-                # The next messages should be tool responses
-                expected_responses = len(msg.tool_calls)
-                j = 1
-                while j <= expected_responses and i + j < len(messages):
-                    next_msg = messages[i + j]
-
-                    if not isinstance(next_msg, ToolMessage):
-                        issues.append(
-                            f"Expected tool response at index {i + j}, "
-                            f"but found {next_msg.role} message"
-                        )
-                        break
-
-                    # Mark this tool message as processed
-                    processed_tool_responses.add(i + j)
-
-                    # Verify the tool response references a pending tool call
-                    if next_msg.tool_call_id not in pending_tool_calls:
-                        issues.append(
-                            f"Tool response at index {i + j} references "
-                            f"unknown tool_call_id '{next_msg.tool_call_id}'"
-                        )
-                    else:
-                        # Mark this tool call as resolved
-                        del pending_tool_calls[next_msg.tool_call_id]
-
-                    j += 1
-
-            # Check for tool messages without preceding tool calls
-            elif isinstance(msg, ToolMessage):
-                # Skip if we've already processed this tool message
-                if i in processed_tool_responses:
-                    continue
-
-                if msg.tool_call_id not in pending_tool_calls:
-                    # Check if this might be from a previous assistant message
-                    found = False
-                    for prev_i in range(i - 1, -1, -1):
-                        prev_msg = messages[prev_i]
-                        if isinstance(prev_msg, AssistantMessage) and prev_msg.tool_calls:
-                            if any(tc.id == msg.tool_call_id for tc in prev_msg.tool_calls):
-                                found = True
-                                # But it should have been handled already
-                                issues.append(
-                                    f"Tool response at index {i} appears out of sequence "
-                                    f"(should immediately follow assistant message at index {prev_i})"
-                                )
-                                break
-                    if not found:
-                        issues.append(f"Tool response at index {i} has no corresponding tool call")
-
-            # Non-tool message with pending tool calls
-            elif pending_tool_calls and not isinstance(msg, ToolMessage):
-                # Some models might be OK with this, but most aren't
-                unresolved = list(pending_tool_calls.keys())
-                if unresolved:
-                    issues.append(
-                        f"Unresolved tool calls {unresolved} before {msg.role} message at index {i}"
-                    )
-
-        # Check for any remaining unresolved tool calls
-        if pending_tool_calls:
-            unresolved = [
-                f"{tool_id} (from message {idx})"
-                for tool_id, (idx, _) in pending_tool_calls.items()
-            ]
-            issues.append(f"Unresolved tool calls at end of sequence: {unresolved}")
-
-        return issues
+        return self._scan(messages).tool_issues()
 
     def _validate_role_alternation(self, messages: Sequence[Message]) -> list[str]:
         """Validate role alternation patterns.
@@ -188,67 +278,7 @@ class MessageSequenceValidator:
         2. System messages can appear at the beginning
         3. Tool messages are allowed after assistant messages with tool calls
         """
-        issues = []
-
-        # Skip system messages at the beginning
-        start_idx = 0
-        while start_idx < len(messages) and isinstance(messages[start_idx], SystemMessage):
-            start_idx += 1
-
-        last_non_tool_role = None
-        last_non_tool_idx = None
-
-        for i in range(start_idx, len(messages)):
-            msg = messages[i]
-            current_role = msg.role
-
-            # Tool messages are special - they follow assistant messages
-            # Skip them for role alternation checks
-            if current_role == "tool":
-                continue
-
-            # Check for consecutive same-role messages (except system)
-            if last_non_tool_role == current_role and current_role != "system":
-                # Some models allow consecutive assistant messages, but flag it
-                if current_role == "assistant":
-                    # This might be OK if:
-                    # 1. There were tool messages between the two assistant messages
-                    # 2. The current assistant has tool calls (continuing conversation to make tool calls)
-                    # 3. The previous assistant had tool calls (but they haven't been resolved yet)
-                    if last_non_tool_idx is not None:
-                        # Check if there were tool messages between the two assistant messages
-                        has_tool_messages_between = any(
-                            messages[j].role == "tool" for j in range(last_non_tool_idx + 1, i)
-                        )
-                        # Check if current assistant has tool calls
-                        current_has_tool_calls = (
-                            isinstance(msg, AssistantMessage) and msg.tool_calls
-                        )
-                        # Check if previous assistant had tool calls
-                        prev_msg = messages[last_non_tool_idx]
-                        prev_has_tool_calls = (
-                            isinstance(prev_msg, AssistantMessage) and prev_msg.tool_calls
-                        )
-
-                        # Only report issue if none of these conditions are met
-                        if not (
-                            has_tool_messages_between
-                            or current_has_tool_calls
-                            or prev_has_tool_calls
-                        ):
-                            issues.append(
-                                f"Consecutive {current_role} messages at indices {last_non_tool_idx} and {i}"
-                            )
-                else:
-                    if last_non_tool_idx is not None:
-                        issues.append(
-                            f"Consecutive {current_role} messages at indices {last_non_tool_idx} and {i}"
-                        )
-
-            last_non_tool_role = current_role
-            last_non_tool_idx = i
-
-        return issues
+        return self._scan(messages).role_issues()
 
     def _validate_system_messages(self, messages: Sequence[Message]) -> list[str]:
         """Validate system message placement.
@@ -257,31 +287,7 @@ class MessageSequenceValidator:
         1. System messages typically appear at the beginning
         2. Some models support system messages throughout, but this is model-specific
         """
-        issues: list[str] = []
-
-        # Find all system message indices
-        system_indices = [i for i, msg in enumerate(messages) if isinstance(msg, SystemMessage)]
-
-        if not system_indices:
-            return issues
-
-        # Check if system messages are only at the beginning
-        last_system_idx = system_indices[-1]
-        first_non_system_idx = None
-
-        for i, msg in enumerate(messages):
-            if not isinstance(msg, SystemMessage):
-                first_non_system_idx = i
-                break
-
-        if first_non_system_idx is not None and last_system_idx > first_non_system_idx:
-            # System messages appear after non-system messages
-            issues.append(
-                f"System message at index {last_system_idx} appears after "
-                f"non-system messages (consider model compatibility)"
-            )
-
-        return issues
+        return self._scan(messages).system_issues()
 
     def validate_before_append(
         self,
@@ -319,10 +325,7 @@ class MessageSequenceValidator:
             return []
 
         # Run validators WITHOUT logging first (avoid warn spam for filtered issues)
-        issues: list[str] = []
-        issues.extend(self._validate_tool_sequencing(messages))
-        issues.extend(self._validate_role_alternation(messages))
-        issues.extend(self._validate_system_messages(messages))
+        issues = self._scan(messages).issues()
 
         # If pending tool calls are allowed (e.g., instructor tool-call mode where
         # dummy tool responses are injected only in outbound payload), suppress all
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import weakref
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, overload
 
 from ulid import ULID
 
@@ -69,7 +70,7 @@ class MessageRegistry:
         # Track agent ownership with weak reference
         self._agent_refs[message.id] = weakref.ref(agent)
 
-        logger.debug(f"Registered message {message.id} with agent {agent._id}")
+        logger.debug("Registered message %s with agent %s", message.id, agent._id)
 
     def get(self, message_id: ULID) -> Message | None:
         """Retrieve message from store.
@@ -140,19 +141,113 @@ class MessageRegistry:
         return len(dead_refs)
 
 
+class _VersionLog:
+    """Append-only list of message IDs shared by every version that is a prefix of it."""
+
+    __slots__ = ("ids",)
+
+    def __init__(self, ids: list[ULID] | None = None):
+        self.ids: list[ULID] = ids if ids is not None else []
+
+
+# A version is a prefix of a log: (log, length). Versions never mutate; logs only grow.
+_Version = tuple[_VersionLog, int]
+
+
+class _VersionsView(Sequence[list[ULID]]):
+    """Read-only list-of-lists view over a VersionManager's history (materialized on access)."""
+
+    __slots__ = ("_history",)
+
+    def __init__(self, history: list[_Version]):
+        self._history = history
+
+    def __len__(self) -> int:
+        return len(self._history)
+
+    @overload
+    def __getitem__(self, index: int) -> list[ULID]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[list[ULID]]: ...
+
+    def __getitem__(self, index: int | slice) -> list[ULID] | list[list[ULID]]:
+        if isinstance(index, slice):
+            return [log.ids[:length] for log, length in self._history[index]]
+        log, length = self._history[index]
+        return log.ids[:length]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def copy(self) -> list[list[ULID]]:
+        return self[:]
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
 class VersionManager:
     """Manages message version history for an agent.
 
     Each version is a snapshot of the message IDs at a particular point in time.
     Operations like append, replace, or revert create new versions.
+
+    Versions are stored with structural sharing: each one is a prefix of an
+    append-only log of message IDs, so appending, reverting and forking cost
+    O(1) time and memory instead of copying the whole conversation. Only
+    operations that rewrite history (replace, prepend, clear) start a new log.
     """
 
     def __init__(self):
         """Initialize an empty version manager."""
-        self._versions: list[list[ULID]] = []
+        self._history: list[_Version] = []
         self._current_version_index: int = -1
         self._metadata: dict[int, dict[str, Any]] = {}  # Optional metadata per version
 
+    @property
+    def _versions(self) -> _VersionsView:
+        """Version history as a list of message ID lists (compatibility view)."""
+        return _VersionsView(self._history)
+
+    @_versions.setter
+    def _versions(self, versions: Iterable[list[ULID]]) -> None:
+        history: list[_Version] = []
+        for message_ids in versions:
+            history.append(self._share(history[-1] if history else None, message_ids))
+        self._history = history
+
+    def _current(self) -> _Version | None:
+        if not self._history or self._current_version_index < 0:
+            return None
+        return self._history[self._current_version_index]
+
+    @staticmethod
+    def _share(base: _Version | None, message_ids: Sequence[ULID]) -> _Version:
+        """Represent ``message_ids`` reusing ``base``'s log when it is a prefix or extension."""
+        count = len(message_ids)
+        if base is not None:
+            log = base[0]
+            if count <= len(log.ids):
+                if log.ids[:count] == list(message_ids):
+                    return log, count
+            elif log.ids == list(message_ids[: len(log.ids)]):
+                log.ids.extend(message_ids[len(log.ids) :])
+                return log, count
+        return _VersionLog(list(message_ids)), count
+
+    def _push(self, version: _Version, metadata: dict[str, Any] | None = None) -> int:
+        self._history.append(version)
+        self._current_version_index = len(self._history) - 1
+
+        if metadata:
+            self._metadata[self._current_version_index] = metadata
+
+        logger.debug(f"Created version {self._current_version_index} with {version[1]} messages")
+        return self._current_version_index
+
     @property
     def current_version(self) -> list[ULID]:
         """Get current version's message IDs.
@@ -160,9 +255,17 @@ class VersionManager:
         Returns:
             List of message IDs in the current version (copy to prevent modification)
         """
-        if not self._versions or self._current_version_index < 0:
+        current = self._current()
+        if current is None:
             return []
-        return self._versions[self._current_version_index].copy()
+        log, length = current
+        return log.ids[:length]
+
+    @property
+    def current_version_length(self) -> int:
+        """Number of messages in the current version, without materializing it."""
+        current = self._current()
+        return current[1] if current else 0
 
     @property
     def current_version_index(self) -> int:
@@ -180,7 +283,7 @@ class VersionManager:
         Returns:
             The number of versions stored
         """
-        return len(self._versions)
+        return len(self._history)
 
     def add_version(self, message_ids: list[ULID], metadata: dict[str, Any] | None = None) -> int:
         """Create a new version.
@@ -192,18 +295,43 @@ class VersionManager:
         Returns:
             The index of the newly created version
         """
-        # Make a copy to prevent external modification
-        new_version = message_ids.copy()
-        self._versions.append(new_version)
-        self._current_version_index = len(self._versions) - 1
+        return self._push(self._share(self._current(), message_ids), metadata)
 
-        if metadata:
-            self._metadata[self._current_version_index] = metadata
+    def append_message_ids(
+        self, message_ids: Sequence[ULID], metadata: dict[str, Any] | None = None
+    ) -> int:
+        """Create a new version extending the current one with ``message_ids``.
 
-        logger.debug(
-            f"Created version {self._current_version_index} with {len(new_version)} messages"
-        )
-        return self._current_version_index
+        Equivalent to ``add_version(current_version + message_ids)`` but shares the
+        current version's log, so it costs O(len(message_ids)).
+
+        Args:
+            message_ids: Message IDs appended after the current version
+            metadata: Optional metadata to associate with this version
+
+        Returns:
+            The index of the newly created version
+        """
+        current = self._current()
+        if current is None:
+            log, length = _VersionLog(), 0
+        else:
+            log, length = current
+            if length != len(log.ids):
+                # Branching from an older prefix (e.g. after a revert): start a new log.
+                log = _VersionLog(log.ids[:length])
+        log.ids.extend(message_ids)
+        return self._push((log, len(log.ids)), metadata)
+
+    def _resolve_index(self, version_index: int) -> int:
+        if version_index < 0:
+            version_index = len(self._history) + version_index
+
+        if version_index < 0 or version_index >= len(self._history):
+            raise IndexError(
+                f"Version {version_index} does not exist (have {len(self._history)} versions)"
+            )
+        return version_index
 
     def get_version(self, version_index: int) -> list[ULID]:
         """Get a specific version's message IDs.
@@ -217,15 +345,16 @@ class VersionManager:
         Raises:
             IndexError: If the version index is out of bounds
         """
-        if version_index < 0:
-            version_index = len(self._versions) + version_index
+        log, length = self._history[self._resolve_index(version_index)]
+        return log.ids[:length]
 
-        if version_index < 0 or version_index >= len(self._versions):
-            raise IndexError(
-                f"Version {version_index} does not exist (have {len(self._versions)} versions)"
-            )
+    def get_version_length(self, version_index: int) -> int:
+        """Number of messages in a version, without materializing it.
 
-        return self._versions[version_index].copy()
+        Raises:
+            IndexError: If the version index is out of bounds
+        """
+        return self._history[self._resolve_index(version_index)][1]
 
     def revert_to(self, version_index: int) -> list[ULID]:
         """Revert to a specific version by creating a new version with that content.
@@ -242,15 +371,16 @@ class VersionManager:
         Raises:
             IndexError: If the version index is out of bounds
         """
-        version = self.get_version(version_index)
-        self.add_version(
-            version,
+        target = self._history[self._resolve_index(version_index)]
+        self._push(
+            target,
             metadata={
                 "reverted_from": self._current_version_index,
                 "reverted_to": version_index,
             },
         )
-        return version
+        log, length = target
+        return log.ids[:length]
 
     def fork_at(self, version_index: int = -1) -> VersionManager:
         """Create a fork at specific version.
@@ -265,21 +395,22 @@ class VersionManager:
 
         # Handle negative indices
         if version_index < 0:
-            target_index = len(self._versions) + version_index
+            target_index = len(self._history) + version_index
         else:
             target_index = version_index
 
-        # Copy versions up to and including the target
-        for i in range(min(target_index + 1, len(self._versions))):
-            fork._versions.append(self._versions[i].copy())
-            if i in self._metadata:
-                fork._metadata[i] = self._metadata[i].copy()
+        # Share version logs up to and including the target; logs are append-only
+        # and every version is a fixed-length prefix, so both sides stay isolated.
+        fork._history = self._history[: max(target_index + 1, 0)]
+        for i, metadata in self._metadata.items():
+            if i < len(fork._history):
+                fork._metadata[i] = metadata.copy()
 
         # Set the current version to the last copied version
-        if fork._versions:
-            fork._current_version_index = len(fork._versions) - 1
+        if fork._history:
+            fork._current_version_index = len(fork._history) - 1
 
-        logger.debug(f"Forked at version {target_index}, fork has {len(fork._versions)} versions")
+        logger.debug(f"Forked at version {target_index}, fork has {len(fork._history)} versions")
         return fork
 
     def get_changes_between(self, version_a: int, version_b: int) -> dict[str, list[ULID]]:
@@ -292,8 +423,17 @@ class VersionManager:
         Returns:
             Dictionary with 'added' and 'removed' message IDs
         """
-        ids_a = set(self.get_version(version_a))
-        ids_b = set(self.get_version(version_b))
+        log_a, length_a = self._history[self._resolve_index(version_a)]
+        log_b, length_b = self._history[self._resolve_index(version_b)]
+
+        if log_a is log_b:
+            # Both are prefixes of the same log: the difference is the slice between them.
+            if length_a <= length_b:
+                return {"added": log_a.ids[length_a:length_b], "removed": []}
+            return {"added": [], "removed": log_a.ids[length_b:length_a]}
+
+        ids_a = set(log_a.ids[:length_a])
+        ids_b = set(log_b.ids[:length_b])
 
         return {
             "added": list(ids_b - ids_a),
@@ -309,11 +449,11 @@ class VersionManager:
             version_index: The last version to keep
         """
         if version_index < 0:
-            version_index = len(self._versions) + version_index
+            version_index = len(self._history) + version_index
 
-        if version_index < len(self._versions) - 1:
-            removed_count = len(self._versions) - version_index - 1
-            self._versions = self._versions[: version_index + 1]
+        if version_index < len(self._history) - 1:
+            removed_count = len(self._history) - version_index - 1
+            self._history = self._history[: version_index + 1]
             self._current_version_index = min(self._current_version_index, version_index)
 
             # Clean up metadata for removed versions
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 import logging
+import re
 from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from dataclasses import dataclass, field
 from typing import (
@@ -38,7 +39,7 @@ from good_agent.messages import (
     ToolMessage,
     UserMessage,
 )
-from good_agent.model.protocols import StreamChunk
+from good_agent.model.protocols import StreamChunk, ToolCallDelta
 from good_agent.tools import ToolCall, ToolCallFunction, ToolResponse
 
 # Lazy loading litellm types - moved to TYPE_CHECKING
@@ -294,6 +295,34 @@ def _mock_response_to_llm_response(
     )
 
 
+def _llm_response_to_stream_chunks(llm_response: _MockLLMResponse) -> list[StreamChunk]:
+    """Split a mock completion into word-sized content chunks and tool-call deltas."""
+    message = llm_response.choices[0].message
+    chunks = [
+        StreamChunk(content=piece) for piece in re.findall(r"\s*\S+\s*", message.content or "")
+    ]
+    for index, tool_call in enumerate(message.tool_calls or []):
+        chunks.append(
+            StreamChunk(
+                tool_calls=[
+                    ToolCallDelta(
+                        index=index,
+                        id=tool_call.id,
+                        name=tool_call.function.name,
+                        arguments=tool_call.function.arguments,
+                    )
+                ]
+            )
+        )
+    chunks.append(
+        StreamChunk(
+            finish_reason="tool_calls" if message.tool_calls else "stop",
+            usage=llm_response.usage,
+        )
+    )
+    return chunks
+
+
 def mock_message(
     content: str,
     role: Literal["assistant", "user", "system"] = "assistant",
@@ -611,8 +640,10 @@ class MockHandlerLanguageModel(AgentComponent):
     async def stream(
         self, messages: list[dict[str, Any]], **kwargs: Any
     ) -> AsyncIterator[StreamChunk]:
-        """Mock stream - not implemented yet"""
-        raise NotImplementedError("Streaming mock not yet implemented")
+        """Mock stream that replays the next mock response as chunks"""
+        llm_response = await self.complete(messages, **kwargs)
+        for chunk in _llm_response_to_stream_chunks(llm_response):
+            yield chunk
 
     def create_message(
         self,
@@ -814,8 +845,10 @@ class MockQueuedLanguageModel(AgentComponent):
     async def stream(
         self, messages: list[dict[str, Any]], **kwargs: Any
     ) -> AsyncIterator[StreamChunk]:
-        """Mock stream - not implemented yet"""
-        raise NotImplementedError("Streaming mock not yet implemented")
+        """Mock stream that replays the next mock response as chunks"""
+        llm_response = await self.complete(messages, **kwargs)
+        for chunk in _llm_response_to_stream_chunks(llm_response):
+            yield chunk
 
     def create_message(
         self,
@@ -24,6 +24,7 @@ if TYPE_CHECKING:
         ResponseWithResponseHeaders,
         ResponseWithUsage,
         StreamChunk,
+        ToolCallDelta,
     )
 
 # Lazy loading implementation
@@ -34,6 +35,7 @@ _LAZY_IMPORTS = {
     # From protocols.py
     "CompletionEvent": "protocols",
     "StreamChunk": "protocols",
+    "ToolCallDelta": "protocols",
     "ModelResponseProtocol": "protocols",
     "ResponseWithUsage": "protocols",
     "ResponseWithHiddenParams": "protocols",
@@ -77,6 +79,7 @@ __all__ = [
     "LanguageModel",
     "CompletionEvent",
     "StreamChunk",
+    "ToolCallDelta",
     "ModelConfig",
     "ModelResponseProtocol",
     "ResponseWithUsage",
@@ -151,8 +151,20 @@ class ModelCapabilities:
         from good_agent.model.overrides import model_override_registry
 
         model_name = model or self.llm.model
+
+        # Check our registry first (it has precedence for custom models)
         capabilities = model_override_registry.get_model_capabilities(model_name)
-        return capabilities.prompt_caching
+
+        # If we have a specific override, use it
+        if any(override.matches(model_name) for override in model_override_registry._overrides):
+            return capabilities.prompt_caching
+
+        # Otherwise try litellm's model map
+        try:
+            return bool(self.llm.litellm.utils.supports_prompt_caching(model_name))
+        except Exception:
+            # Fall back to our capability value
+            return capabilities.prompt_caching
 
     def supports_reasoning(self, model: str | None = None) -> bool:
         """Check if the model supports advanced reasoning modes"""
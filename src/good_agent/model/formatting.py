@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import weakref
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from good_agent.content import (
@@ -30,11 +32,53 @@ if TYPE_CHECKING:
     from good_agent.model.llm import LanguageModel
 
 
+@dataclass(slots=True)
+class FormattingCacheStats:
+    """Counters describing how the formatted-payload cache is being used"""
+
+    hits: int = 0
+    """Messages served from the cache"""
+    misses: int = 0
+    """Messages formatted because they were new or their render state changed"""
+    bypassed: int = 0
+    """Messages formatted without caching (templates or impure render handlers)"""
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of formatted messages served from the cache"""
+        total = self.hits + self.misses + self.bypassed
+        return self.hits / total if total else 0.0
+
+
+@dataclass(slots=True)
+class _FormattedMessage:
+    """A formatted payload and the render state it was produced under."""
+
+    message: weakref.ReferenceType[Message]
+    state: tuple[Any, ...]
+    payload: ChatCompletionMessageParam
+
+
+def _copy_payload(value: Any) -> Any:
+    """Copy the dict/list structure of a payload so callers can mutate it freely."""
+    if isinstance(value, dict):
+        return {key: _copy_payload(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_payload(item) for item in value]
+    return value
+
+
 class MessageFormatter:
     """Handles message formatting for LLM API compatibility.
 
     Converts internal message objects to LLM API format with proper
     content part handling, event hooks, and tool call validation.
+
+    Formatted payloads are cached per message while the message object, the
+    active modes, the render handlers and every component's
+    ``render_cache_key()`` stay the same. Messages with template parts, and
+    all messages while any render handler is not declared ``pure``, are
+    formatted on every call.
     """
 
     def __init__(self, language_model: LanguageModel):
@@ -44,6 +88,65 @@ class MessageFormatter:
             language_model: Parent LanguageModel instance
         """
         self.llm = language_model
+        self._payload_cache: dict[Any, _FormattedMessage] = {}
+        self._cache_stats = FormattingCacheStats()
+
+    @property
+    def cache_stats(self) -> FormattingCacheStats:
+        """Live hit, miss and bypass counters for the payload cache"""
+        return self._cache_stats
+
+    def clear_cache(self) -> None:
+        """Drop every cached payload so the next call formats all messages again."""
+        self._payload_cache.clear()
+
+    def _render_state(self) -> tuple[Any, ...] | None:
+        """Describe everything outside a message that its LLM payload depends on.
+
+        Returns None when the payload cannot be cached because a
+        MESSAGE_RENDER_* handler has not been declared pure.
+        """
+        agent = getattr(self.llm, "agent", None)
+        if agent is None:
+            return ()
+
+        get_handlers = getattr(agent, "_get_sorted_handlers", None)
+        if get_handlers is None:
+            return None
+
+        handlers = (
+            *get_handlers(AgentEvents.MESSAGE_RENDER_BEFORE),
+            *get_handlers(AgentEvents.MESSAGE_RENDER_AFTER),
+        )
+        if not all(registration.pure for registration in handlers):
+            return None
+
+        return (
+            tuple(agent.modes.mode_stack),
+            handlers,
+            tuple(extension.render_cache_key() for extension in agent.extensions.values()),
+        )
+
+    async def _format_cached(
+        self,
+        message: Message,
+        state: tuple[Any, ...] | None,
+        seen: dict[Any, _FormattedMessage],
+    ) -> ChatCompletionMessageParam:
+        if state is None or message._has_templates():
+            self._cache_stats.bypassed += 1
+            return await self.format_message(message, RenderMode.LLM)
+
+        entry = self._payload_cache.get(message.id)
+        if entry is not None and entry.message() is message and entry.state == state:
+            self._cache_stats.hits += 1
+        else:
+            self._cache_stats.misses += 1
+            payload = await self.format_message(message, RenderMode.LLM)
+            entry = _FormattedMessage(weakref.ref(message), state, payload)
+
+        seen[message.id] = entry
+        return _copy_payload(entry.payload)
 
     async def format_message_content(
         self,
@@ -161,6 +264,12 @@ class MessageFormatter:
         if agent is None:
             return None
 
+        # Rendering happens for every part of every message; skip the dispatch
+        # entirely when nothing is listening for this render phase.
+        has_subscribers = getattr(agent, "has_subscribers", None)
+        if has_subscribers is not None and not has_subscribers(event):
+            return None
+
         apply_fn = getattr(getattr(agent, "events", None), "apply", None)
         if apply_fn is None:
             apply_fn = getattr(agent, "apply", None)
@@ -349,6 +458,7 @@ class MessageFormatter:
         - Converting content parts to LLM format
         - Handling templates, images, and files
         - Ensuring tool call/response pairs are valid (injects synthetic tool responses)
+        - Reusing cached payloads for messages whose render state is unchanged
 
         Args:
             messages: List of Message objects to format
@@ -359,11 +469,16 @@ class MessageFormatter:
             don't have corresponding tool responses
         """
         # Process messages in order (not parallel) to maintain sequence
+        state = self._render_state()
+        seen: dict[Any, _FormattedMessage] = {}
         messages_for_llm: list[ChatCompletionMessageParam | dict[str, Any]] = []
         for msg in messages:
-            formatted = await self.format_message(msg, RenderMode.LLM)
+            formatted = await self._format_cached(msg, state, seen)
             messages_for_llm.append(formatted)
 
+        # Keep only the messages from this call so the cache follows the conversation
+        self._payload_cache = seen
+
         # Ensure all tool calls have corresponding tool responses
         # This is critical for AssistantMessageStructuredOutput which may have
         # tool_calls in the message history but no actual ToolMessage responses
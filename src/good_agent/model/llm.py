@@ -38,6 +38,7 @@ from good_agent.model.capabilities import ModelCapabilities
 from good_agent.model.formatting import MessageFormatter
 from good_agent.model.manager import ManagedRouter, ModelManager
 from good_agent.model.overrides import model_override_registry
+from good_agent.model.prompt_cache import PromptCachePlanner, PromptCacheStats
 from good_agent.model.protocols import (
     DEFAULT_MODEL,
     DEFAULT_TEMPERATURE,
@@ -158,6 +159,7 @@ class LanguageModel(AgentComponent):
         self.total_cost = 0.0
         self.last_usage: Any = None
         self.last_cost: Any = None
+        self._prompt_cache = PromptCachePlanner()
 
         # Request/response tracking for debugging
         self.api_requests: list[Any] = []
@@ -180,6 +182,23 @@ class LanguageModel(AgentComponent):
             self._extractor = StructuredOutputExtractor(self)
             self._streaming = StreamingHandler(self)
 
+    def _snapshot_state(self) -> Any:
+        return (self.total_tokens, self.total_cost, self.last_usage, self.last_cost)
+
+    def _restore_state(self, state: Any) -> None:
+        self.total_tokens, self.total_cost, self.last_usage, self.last_cost = state
+        self._prompt_cache.reset()
+        if self._formatter is not None:
+            self._formatter.clear_cache()
+        for records in (
+            self.api_requests,
+            self.api_response_kwargs,
+            self.api_stream_responses,
+            self.api_responses,
+            self.api_errors,
+        ):
+            records.clear()
+
     def _clone_init_args(self):
         return (), copy.deepcopy(self._override_config)
 
@@ -570,6 +589,32 @@ class LanguageModel(AgentComponent):
         """Get fallback model list"""
         return cast(list[str], self._get_config_value("fallback_models", []))
 
+    @property
+    def prompt_caching(self) -> bool:
+        """Whether provider cache breakpoints are added to requests"""
+        return bool(self._get_config_value("prompt_caching", False))
+
+    @property
+    def prompt_cache_stats(self) -> PromptCacheStats:
+        """Stable-prefix counters and cached versus uncached prompt tokens"""
+        return self._prompt_cache.stats
+
+    def _apply_prompt_caching(
+        self,
+        messages: Sequence[ChatCompletionMessageParam | dict[str, Any]],
+        config: dict[str, Any],
+    ) -> Sequence[ChatCompletionMessageParam | dict[str, Any]]:
+        """Mark the stable request prefix for providers with prompt caching.
+
+        Does nothing unless ``prompt_caching`` is enabled and the target model
+        supports context caching.
+        """
+        if not self.prompt_caching or not self.supports_context_caching(
+            str(config.get("model", self.model))
+        ):
+            return messages
+        return self._prompt_cache.apply(messages, config)
+
     @property
     def router(self) -> ManagedRouter:
         """Lazy-loaded ManagedRouter with isolated callbacks"""
@@ -739,6 +784,7 @@ class LanguageModel(AgentComponent):
         if usage.total_tokens > 0:
             self.last_usage = usage
             self.total_tokens += usage.total_tokens
+            self._prompt_cache.record_usage(usage)
 
         # Calculate cost if available
         try:
@@ -800,6 +846,7 @@ class LanguageModel(AgentComponent):
         # Apply model-specific overrides LAST
         model_name = str(config.get("model", self.model))
         config = model_override_registry.apply(model_name, config)
+        messages = self._apply_prompt_caching(messages, config)
 
         # Fire before event
         start_time = time.time()
@@ -0,0 +1,148 @@
+"""Provider prompt-cache breakpoints for stable conversation prefixes."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+MAX_CACHE_BREAKPOINTS = 4
+"""Anthropic accepts at most four ``cache_control`` blocks per request."""
+
+
+def _fingerprint(value: Any) -> int:
+    return hash(json.dumps(value, sort_keys=True, default=str))
+
+
+def _cache_control() -> dict[str, str]:
+    return {"type": "ephemeral"}
+
+
+def _mark_message(message: Any) -> Any:
+    """Return a copy of ``message`` whose last content block carries a cache marker."""
+    marked = dict(message)
+    content = marked.get("content")
+    if isinstance(content, str) and content:
+        marked["content"] = [{"type": "text", "text": content, "cache_control": _cache_control()}]
+    elif isinstance(content, list) and content and isinstance(content[-1], dict):
+        marked["content"] = [*content[:-1], {**content[-1], "cache_control": _cache_control()}]
+    else:
+        # Empty content (e.g. an assistant message that only calls tools)
+        marked["cache_control"] = _cache_control()
+    return marked
+
+
+@dataclass(slots=True)
+class _RequestShape:
+    """Fingerprints of the previous request, used to find the stable prefix."""
+
+    messages: list[int]
+    tools: int | None
+    breakpoint: int | None = None
+
+
+@dataclass(slots=True)
+class PromptCacheStats:
+    """Counters describing how provider prompt caching is being used"""
+
+    requests: int = 0
+    """Requests inspected by the planner"""
+    marked_requests: int = 0
+    """Requests that carried at least one cache breakpoint"""
+    stable_messages: int = 0
+    """Messages that matched the previous request's prefix, summed over requests"""
+    cached_prompt_tokens: int = 0
+    """Prompt tokens the provider reported as read from its cache"""
+    uncached_prompt_tokens: int = 0
+    """Prompt tokens the provider processed without a cache hit"""
+
+
+@dataclass
+class PromptCachePlanner:
+    """Places provider cache breakpoints at the end of the stable request prefix.
+
+    Each request is compared with the previous one. Tool definitions, the
+    system message and the longest run of leading messages that did not change
+    since then are considered stable and receive ``cache_control`` markers, so
+    the provider can reuse its processed prefix instead of re-reading it. The
+    breakpoint from the previous request is kept while there is room, so the
+    prefix cached last turn is still read when the new breakpoint moves past
+    the provider's lookback window. Nothing is marked on the first request
+    because nothing is yet known to be stable.
+    """
+
+    max_breakpoints: int = MAX_CACHE_BREAKPOINTS
+    stats: PromptCacheStats = field(default_factory=PromptCacheStats)
+    _previous: _RequestShape | None = field(default=None, init=False, repr=False)
+
+    def reset(self) -> None:
+        """Forget the previous request so the next one is treated as the first."""
+        self._previous = None
+
+    def apply(
+        self,
+        messages: Sequence[Any],
+        config: dict[str, Any],
+    ) -> list[Any]:
+        """Add cache breakpoints to ``messages`` and ``config["tools"]``.
+
+        Args:
+            messages: Formatted messages for the request
+            config: Request configuration; its ``tools`` list is replaced with
+                a marked copy when the tool definitions are stable
+
+        Returns:
+            A new message list; marked messages are copies and the inputs are
+            left untouched
+        """
+        shape = _RequestShape(
+            messages=[_fingerprint(message) for message in messages],
+            tools=_fingerprint(config["tools"]) if config.get("tools") else None,
+        )
+        previous, self._previous = self._previous, shape
+        self.stats.requests += 1
+
+        result = list(messages)
+        if previous is None:
+            return result
+
+        stable = 0
+        for current, earlier in zip(shape.messages, previous.messages, strict=False):
+            if current != earlier:
+                break
+            stable += 1
+        self.stats.stable_messages += stable
+
+        budget = self.max_breakpoints
+        if shape.tools is not None and shape.tools == previous.tools:
+            tools = list(config["tools"])
+            tools[-1] = {**tools[-1], "cache_control": _cache_control()}
+            config["tools"] = tools
+            budget -= 1
+
+        positions: list[int] = []
+        if stable:
+            if result[0].get("role") == "system":
+                positions.append(0)
+            if previous.breakpoint is not None and previous.breakpoint < stable:
+                positions.append(previous.breakpoint)
+            positions.append(stable - 1)
+            shape.breakpoint = stable - 1
+
+        # Prefer the newest breakpoints when the budget is tight
+        marked = sorted(set(positions))[-budget:] if budget > 0 else []
+        for position in marked:
+            result[position] = _mark_message(result[position])
+
+        if marked or budget < self.max_breakpoints:
+            self.stats.marked_requests += 1
+        return result
+
+    def record_usage(self, usage: Any) -> None:
+        """Add the cached and uncached prompt tokens reported in ``usage``."""
+        prompt_tokens = getattr(usage, "prompt_tokens", None) or 0
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None) or 0
+        self.stats.cached_prompt_tokens += cached
+        self.stats.uncached_prompt_tokens += max(prompt_tokens - cached, 0)
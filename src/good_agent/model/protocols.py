@@ -56,12 +56,28 @@ class CompletionEvent(TypedDict):
     llm: Any  # LanguageModel
 
 
+@dataclass
+class ToolCallDelta:
+    """Incremental fragment of a streamed tool call.
+
+    ``id`` and ``name`` usually arrive only on the first fragment for a given
+    ``index``; ``arguments`` carries the next slice of the JSON argument string.
+    """
+
+    index: int
+    id: str | None = None
+    name: str | None = None
+    arguments: str | None = None
+
+
 @dataclass
 class StreamChunk:
     """Streaming response chunk"""
 
     content: str | None = None
     finish_reason: str | None = None
+    tool_calls: list[ToolCallDelta] | None = None
+    usage: Any = None
 
 
 # Constants
@@ -73,6 +89,7 @@ FILTER_ARGS = [
     "max_retries",
     "fallback_models",
     "debug",
+    "prompt_caching",
 ]
 
 DEFAULT_TEMPERATURE = 1
@@ -9,7 +9,7 @@ from collections.abc import AsyncIterator, Sequence
 from typing import TYPE_CHECKING, Any, Protocol, Unpack
 
 from good_agent.events import AgentEvents, LLMStreamParams
-from good_agent.model.protocols import StreamChunk
+from good_agent.model.protocols import StreamChunk, ToolCallDelta
 
 if TYPE_CHECKING:
     from litellm.types.completion import ChatCompletionMessageParam
@@ -32,6 +32,10 @@ class SupportsStreamingLanguageModel(Protocol):
 
     def _update_usage(self, response_obj: Any) -> None: ...
 
+    def _apply_prompt_caching(
+        self, messages: Sequence[ChatCompletionMessageParam], config: dict[str, Any]
+    ) -> Sequence[ChatCompletionMessageParam]: ...
+
     def do(self, event: AgentEvents, **kwargs: Any) -> None: ...
 
     async def apply_typed(self, event: AgentEvents, params_type, return_type, **kwargs: Any): ...
@@ -85,6 +89,7 @@ class StreamingHandler:
         if "parallel_tool_calls" in config and not config.get("tools"):
             # Some providers reject this flag without accompanying tools
             config.pop("parallel_tool_calls", None)
+        messages = self.llm._apply_prompt_caching(messages, config)
 
         # Fire before event
         start_time = time.time()
@@ -137,6 +142,7 @@ class StreamingHandler:
                 stream_iter: AsyncIterator = stream_response
                 async for chunk in stream_iter:
                     chunks.append(chunk)
+                    usage = getattr(chunk, "usage", None)
 
                     # Extract content and finish reason from chunk
                     if chunk.choices and len(chunk.choices) > 0:
@@ -153,12 +159,29 @@ class StreamingHandler:
                         )
 
                         # Create and yield StreamChunk
-                        stream_chunk = StreamChunk(content=content, finish_reason=finish_reason)
-
-                        # Track for debugging
-                        self.llm.api_stream_responses.append(stream_chunk)  # type: ignore[arg-type]
+                        stream_chunk = StreamChunk(
+                            content=content,
+                            finish_reason=finish_reason,
+                            tool_calls=_extract_tool_call_deltas(delta),
+                            usage=usage,
+                        )
+                    elif usage is not None:
+                        # Trailing usage-only chunk (e.g. stream_options.include_usage)
+                        stream_chunk = StreamChunk(usage=usage)
+                    else:
+                        continue
+
+                    # Track for debugging
+                    self.llm.api_stream_responses.append(stream_chunk)  # type: ignore[arg-type]
+
+                    self.llm.do(
+                        AgentEvents.LLM_STREAM_CHUNK,
+                        model=model,
+                        messages=messages,
+                        chunk=stream_chunk,
+                    )
 
-                        yield stream_chunk
+                    yield stream_chunk
 
                 # Build complete response from chunks for tracking
                 if chunks:
@@ -239,4 +262,31 @@ class StreamingHandler:
         return None
 
 
+def _delta_field(obj: Any, name: str) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _extract_tool_call_deltas(delta: Any) -> list[ToolCallDelta] | None:
+    """Normalize provider tool-call fragments from a streaming delta."""
+    raw = delta.get("tool_calls") if isinstance(delta, dict) else getattr(delta, "tool_calls", None)
+    if not isinstance(raw, (list, tuple)) or not raw:
+        return None
+
+    deltas: list[ToolCallDelta] = []
+    for position, item in enumerate(raw):
+        function = _delta_field(item, "function")
+        index = _delta_field(item, "index")
+        deltas.append(
+            ToolCallDelta(
+                index=index if isinstance(index, int) else position,
+                id=_delta_field(item, "id"),
+                name=_delta_field(function, "name") if function is not None else None,
+                arguments=_delta_field(function, "arguments") if function is not None else None,
+            )
+        )
+    return deltas
+
+
 __all__ = ["StreamingHandler"]
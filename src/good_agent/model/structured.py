@@ -49,6 +49,7 @@ class StructuredOutputExtractor:
         # Apply model-specific overrides LAST so they take precedence
         model_name = str(config.get("model", self.llm.model))
         config = model_override_registry.apply(model_name, config)
+        messages = self.llm._apply_prompt_caching(messages, config)  # type: ignore[assignment]
 
         # Fire before event (using apply_typed for type safety)
         from good_agent.core.event_router import EventContext
@@ -42,7 +42,9 @@ from pydantic.json_schema import GenerateJsonSchema
 from tenacity import before_sleep_log, retry, stop_after_attempt, wait_exponential
 
 from good_agent.core.components import AgentComponent
+from good_agent.core.event_router import EventContext, on
 from good_agent.core.models import Renderable
+from good_agent.events import AgentEvents
 
 logger = logging.getLogger(__name__)
 
@@ -136,6 +138,15 @@ class ToolManager(AgentComponent):
         tools = state.get("tools", {})
         self._tools = dict(tools.items())
 
+    def _snapshot_state(self) -> Any:
+        return {name: (tool, len(tool._responses)) for name, tool in self._tools.items()}
+
+    def _restore_state(self, state: Any) -> None:
+        self._tools = {}
+        for name, (tool, responses) in state.items():
+            del tool._responses[responses:]
+            self._tools[name] = tool
+
     @property
     def config(self) -> AgentConfigManager:
         return self.agent.config
@@ -388,6 +399,12 @@ class ToolManager(AgentComponent):
 
             self._mcp_client = None
 
+    @on(AgentEvents.AGENT_CLOSE_BEFORE)
+    async def _release_mcp_servers(self, ctx: EventContext) -> None:
+        """Return pooled MCP sessions when the agent closes."""
+        if self._mcp_client is not None:
+            await self.disconnect_mcp_servers()
+
     def __call__(
         self,
         mode: Literal["replace", "append", "filter"] = "replace",
@@ -633,7 +650,9 @@ class Tool(BaseToolDefinition, Generic[P, FuncResp]):
     patterns.
     """
 
-    _tool_metadata: ToolMetadata
+    _cached_model: type[BaseModel] | None = None
+    _cached_schema: dict[str, Any] | None = None
+    _cached_signature: ToolSignature | None = None
 
     def __repr__(self) -> str:
         """Return concise tool representation for debugging.
@@ -888,11 +907,58 @@ class Tool(BaseToolDefinition, Generic[P, FuncResp]):
             before_sleep=before_sleep_log(logging.getLogger(__name__), logging.INFO),
         )(fn)
 
+    @property
+    def name(self) -> str:
+        """Tool name exposed to the LLM"""
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self.invalidate_schema_cache()
+
+    @property
+    def description(self) -> str:
+        """Tool description exposed to the LLM"""
+        return self._description
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self._description = value
+        # Only the signature embeds the description
+        self._cached_signature = None
+
+    @property
+    def _tool_metadata(self) -> ToolMetadata:
+        """Metadata describing the visible parameters"""
+        return self._metadata
+
+    @_tool_metadata.setter
+    def _tool_metadata(self, value: ToolMetadata) -> None:
+        self._metadata = value
+        self.invalidate_schema_cache()
+
+    def invalidate_schema_cache(self) -> None:
+        """Drop the memoized model, schema and signature.
+
+        Called automatically when the name, description or metadata are
+        reassigned; call it directly after mutating ``_tool_metadata`` in place.
+        """
+        self._cached_model = None
+        self._cached_schema = None
+        self._cached_signature = None
+
     @property
     def signature(self) -> ToolSignature:
-        """Get the tool signature in OpenAI format"""
-        _schema = self.model.model_json_schema(schema_generator=BaseToolGenerateJsonSchema)
-        return ToolSignature(
+        """Get the tool signature in OpenAI format.
+
+        The result is memoized and shared between callers; copy it before
+        modifying it.
+        """
+        if self._cached_signature is not None:
+            return self._cached_signature
+        _schema = self.get_schema()
+        self._cached_signature = ToolSignature(
             type="function",
             function=_ToolSignatureFunction(
                 name=self.name,
@@ -905,13 +971,24 @@ class Tool(BaseToolDefinition, Generic[P, FuncResp]):
                 ),
             ),
         )
+        return self._cached_signature
 
     def get_schema(self) -> dict[str, Any]:
-        """Get the tool schema (wrapper for model_json_schema)"""
-        return self.model.model_json_schema(schema_generator=BaseToolGenerateJsonSchema)
+        """Get the tool schema (memoized wrapper for model_json_schema)"""
+        if self._cached_schema is None:
+            self._cached_schema = self.model.model_json_schema(
+                schema_generator=BaseToolGenerateJsonSchema
+            )
+        return self._cached_schema
 
     @property
     def model(self) -> type[BaseModel]:
+        """Pydantic model of the visible parameters, built once and memoized"""
+        if self._cached_model is None:
+            self._cached_model = self._build_model()
+        return self._cached_model
+
+    def _build_model(self) -> type[BaseModel]:
         """Generate Pydantic model from function signature (only visible parameters)"""
         # Create a dynamic model from the function signature excluding hidden params
         fields = {}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
@@ -23,6 +24,22 @@ def _get_token_counter():
     return _token_counter
 
 
+@lru_cache(maxsize=64)
+def _get_tokenizer(model: str) -> Any | None:
+    """Resolve litellm's tokenizer for ``model`` once rather than on every count.
+
+    litellm re-selects (and for non-OpenAI models re-probes HuggingFace for) the
+    tokenizer on each ``token_counter`` call unless one is passed in.
+    """
+    try:
+        from litellm.utils import _select_tokenizer
+
+        return _select_tokenizer(model)
+    except Exception as e:
+        logger.debug(f"Falling back to per-call tokenizer selection for {model}: {e}")
+        return None
+
+
 @lru_cache(maxsize=1024)
 def count_text_tokens(text: str, model: str = "gpt-4o") -> int:
     """Count tokens in plain text with caching.
@@ -36,7 +53,7 @@ def count_text_tokens(text: str, model: str = "gpt-4o") -> int:
     """
     token_counter = _get_token_counter()
     try:
-        return token_counter(model=model, text=text)
+        return token_counter(model=model, custom_tokenizer=_get_tokenizer(model), text=text)
     except Exception as e:
         logger.warning(f"Failed to count tokens for text: {e}")
         # Fallback to rough estimation (4 chars per token)
@@ -69,6 +86,7 @@ def count_message_tokens(
         # Count tokens using litellm
         return token_counter(
             model=model,
+            custom_tokenizer=_get_tokenizer(model),
             messages=[message_dict],
             tools=tool_calls if tool_calls else None,
         )
@@ -110,6 +128,7 @@ def count_messages_tokens(
 
         return token_counter(
             model=model,
+            custom_tokenizer=_get_tokenizer(model),
             messages=messages,
             tools=tools if tools else None,
         )
@@ -212,3 +231,26 @@ def get_message_token_count(
     token_cache[cache_key] = count
 
     return count
+
+
+def get_message_token_counts(
+    messages: Iterable[Message],
+    model: str = "gpt-4o",
+    include_tools: bool = True,
+) -> list[int]:
+    """Get token counts for several messages.
+
+    Cached counts are reused. The rest are counted one message at a time, like
+    ``get_message_token_count``, so the numbers include litellm's per-message
+    overhead; this is not a batch encode. The tokenizer is resolved once per
+    model (see ``_get_tokenizer``), not once per message.
+
+    Args:
+        messages: Message objects to count tokens for
+        model: Model name for tokenizer selection
+        include_tools: Whether to include tool call tokens
+
+    Returns:
+        Token count for each message, in order
+    """
+    return [get_message_token_count(message, model, include_tools) for message in messages]
@@ -1,11 +1,15 @@
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
+from good_agent import tool
 from good_agent.agent.core import Agent
 from good_agent.cli.serve import create_app
-from good_agent.messages import AssistantMessage
+from good_agent.messages import AssistantMessage, ToolMessage
+from good_agent.model.protocols import StreamChunk
+from good_agent.tools import ToolCall, ToolCallFunction
 
 
 @pytest.fixture
@@ -15,7 +19,7 @@ def mock_agent():
     agent.model.model_name = "mock-gpt-4"
 
     # Mock _fork_with_messages to return the same agent or a copy
-    # Since request_agent.call() is awaited, we need to make sure the return value of fork is usable
+    # Since request_agent.execute() is iterated, we need to make sure the return value of fork is usable
 
     # Make _fork_with_messages an async method that returns the agent itself
     async def fork(messages):
@@ -23,11 +27,11 @@ def mock_agent():
 
     agent._fork_with_messages = AsyncMock(side_effect=fork)
 
-    # Mock call()
-    async def call(*args, **kwargs):
-        return AssistantMessage(content="Hello from API")
+    # Mock execute()
+    async def execute(*args, **kwargs):
+        yield AssistantMessage(content="Hello from API")
 
-    agent.call = AsyncMock(side_effect=call)
+    agent.execute = MagicMock(side_effect=execute)
 
     return agent
 
@@ -49,7 +53,228 @@ def test_serve_endpoint(mock_agent):
 
     # Verify agent was called
     mock_agent._fork_with_messages.assert_called_once()
-    mock_agent.call.assert_called_once()
+    mock_agent.execute.assert_called_once_with()
+
+
+def test_serve_executes_server_side_tools():
+    cities: list[str] = []
+
+    @tool
+    async def lookup(city: str) -> str:
+        cities.append(city)
+        return f"sunny in {city}"
+
+    app = create_app(lambda: Agent("System prompt", tools=[lookup]), pool_size=1)
+    with TestClient(app) as client:
+        # Requests run on the pool's warm fork, so that is the agent to mock
+        pooled = client.portal.call(app.state.agent_pool.acquire)
+        app.state.agent_pool.release(pooled)
+        for stream in (False, True):
+            cities.clear()
+            with pooled.mock(
+                pooled.mock.create(
+                    "Checking",
+                    role="assistant",
+                    tool_calls=[{"name": "lookup", "arguments": {"city": "Paris"}}],
+                ),
+                pooled.mock.create("It is sunny in Paris", role="assistant"),
+            ):
+                response = client.post(
+                    "/v1/chat/completions",
+                    json={
+                        "model": "test-model",
+                        "stream": stream,
+                        "messages": [{"role": "user", "content": "Weather?"}],
+                    },
+                )
+
+            assert response.status_code == 200
+            assert cities == ["Paris"]
+            if stream:
+                chunks = [
+                    json.loads(line[len("data: ") :])
+                    for line in response.iter_lines()
+                    if line and line != "data: [DONE]"
+                ]
+                deltas = [chunk["choices"][0]["delta"] for chunk in chunks]
+                assert all("tool_calls" not in delta for delta in deltas)
+                assert "".join(delta.get("content", "") for delta in deltas).endswith(
+                    "It is sunny in Paris"
+                )
+                assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+            else:
+                choice = response.json()["choices"][0]
+                assert choice["message"]["content"] == "It is sunny in Paris"
+                assert choice["finish_reason"] == "stop"
+
+
+def test_serve_reports_usage(mock_agent):
+    usage = {"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15}
+
+    async def execute(*args, **kwargs):
+        yield AssistantMessage(
+            content="",
+            tool_calls=[
+                ToolCall(
+                    id="call_1",
+                    function=ToolCallFunction(name="lookup", arguments='{"city": "Paris"}'),
+                )
+            ],
+            usage=usage,
+        )
+        yield ToolMessage(content="sunny", tool_call_id="call_1", tool_name="lookup")
+        yield AssistantMessage(content="Sunny", usage=usage)
+
+    mock_agent.execute = MagicMock(side_effect=execute)
+    client = TestClient(create_app(lambda: mock_agent))
+
+    response = client.post(
+        "/v1/chat/completions",
+        json={"model": "test-model", "messages": [{"role": "user", "content": "Hi"}]},
+    )
+
+    # Usage covers every LLM call made during the turn
+    assert response.json()["usage"] == {
+        "prompt_tokens": 24,
+        "completion_tokens": 6,
+        "total_tokens": 30,
+    }
+
+
+def test_serve_maps_tool_history(mock_agent):
+    client = TestClient(create_app(lambda: mock_agent))
+
+    response = client.post(
+        "/v1/chat/completions",
+        json={
+            "model": "test-model",
+            "messages": [
+                {"role": "user", "content": "Weather?"},
+                {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {"name": "lookup", "arguments": '{"city": "Paris"}'},
+                        }
+                    ],
+                },
+                {"role": "tool", "tool_call_id": "call_1", "content": "sunny"},
+            ],
+        },
+    )
+
+    assert response.status_code == 200
+    history = next(
+        call.args[1] for call in mock_agent._reset_conversation.call_args_list if len(call.args) > 1
+    )
+    assistant, tool_message = history[1], history[2]
+    assert isinstance(assistant, AssistantMessage)
+    assert assistant.tool_calls[0].id == "call_1"
+    assert assistant.tool_calls[0].function.arguments == '{"city": "Paris"}'
+    assert isinstance(tool_message, ToolMessage)
+    assert tool_message.tool_call_id == "call_1"
+    assert tool_message.tool_name == "lookup"
+
+
+def test_serve_streaming(mock_agent):
+    async def execute(*args, **kwargs):
+        yield StreamChunk(content="Hello ")
+        yield StreamChunk(content="there")
+        yield AssistantMessage(
+            content="Hello there",
+            usage={"prompt_tokens": 5, "completion_tokens": 2, "total_tokens": 7},
+        )
+
+    mock_agent.execute = MagicMock(side_effect=execute)
+    client = TestClient(create_app(lambda: mock_agent))
+
+    with client.stream(
+        "POST",
+        "/v1/chat/completions",
+        json={
+            "model": "test-model",
+            "stream": True,
+            "messages": [{"role": "user", "content": "Hi"}],
+        },
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [line[len("data: ") :] for line in response.iter_lines() if line]
+
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(event) for event in events[:-1]]
+    assert all(chunk["object"] == "chat.completion.chunk" for chunk in chunks)
+    assert chunks[0]["choices"][0]["delta"] == {"role": "assistant"}
+    content = "".join(chunk["choices"][0]["delta"].get("content", "") for chunk in chunks)
+    assert content == "Hello there"
+    assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+    assert chunks[-1]["usage"]["total_tokens"] == 7
+    mock_agent.execute.assert_called_once_with(
+        streaming=True, stream_options={"include_usage": True}
+    )
+
+
+def test_serve_streaming_closes_execution(mock_agent):
+    closed = []
+
+    async def execute(*args, **kwargs):
+        try:
+            yield StreamChunk(content="Checking")
+            yield AssistantMessage(content="Checking")
+        finally:
+            closed.append(True)
+
+    mock_agent.execute = MagicMock(side_effect=execute)
+    client = TestClient(create_app(lambda: mock_agent))
+
+    with client.stream(
+        "POST",
+        "/v1/chat/completions",
+        json={
+            "model": "test-model",
+            "stream": True,
+            "messages": [{"role": "user", "content": "Weather?"}],
+        },
+    ) as response:
+        events = [line[len("data: ") :] for line in response.iter_lines() if line]
+
+    assert events[-1] == "[DONE]"
+    assert closed == [True]
+
+
+def test_serve_reuses_pooled_agent(mock_agent):
+    client = TestClient(create_app(lambda: mock_agent, pool_size=2))
+
+    for _ in range(3):
+        response = client.post(
+            "/v1/chat/completions",
+            json={"model": "test-model", "messages": [{"role": "user", "content": "Hi"}]},
+        )
+        assert response.status_code == 200
+
+    # One warm agent is recycled instead of forking per request
+    mock_agent._fork_with_messages.assert_called_once()
+    assert mock_agent.execute.call_count == 3
+
+
+def test_serve_pool_exhausted_returns_503(mock_agent):
+    app = create_app(lambda: mock_agent, pool_size=1, acquire_timeout=0.01)
+    client = TestClient(app)
+
+    async def hold():
+        await app.state.agent_pool.acquire()
+
+    with client:
+        client.portal.call(hold)
+        response = client.post(
+            "/v1/chat/completions",
+            json={"model": "test-model", "messages": [{"role": "user", "content": "Hi"}]},
+        )
+
+    assert response.status_code == 503
 
 
 @pytest.mark.asyncio
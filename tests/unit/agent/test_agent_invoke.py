@@ -846,3 +846,103 @@ class TestAgentInvokeEdgeCases:
             assert result.success is True
             assert result.response is None
             assert agent[-1].content == "None"
+
+
+class TestConcurrentToolResolution:
+    """Test concurrent resolution of pending tool calls"""
+
+    @staticmethod
+    def _tool_calls(name: str, delays: list[float]) -> list[ToolCall]:
+        return [
+            ToolCall(
+                id=f"call_{index}",
+                type="function",
+                function=ToolCallFunction(
+                    name=name, arguments=json.dumps({"name": f"t{index}", "delay": delay})
+                ),
+            )
+            for index, delay in enumerate(delays)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_resolution_runs_calls_together(self):
+        """Pending calls overlap but messages keep tool_call order"""
+        active = peak = 0
+
+        @tool
+        async def slow_tool(name: str, delay: float) -> str:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(delay)
+            active -= 1
+            return f"Done: {name}"
+
+        async with Agent("Test agent", tools=[slow_tool], concurrent_tool_calls=True) as agent:
+            agent.assistant.append("", tool_calls=self._tool_calls("slow_tool", [0.15, 0.05, 0.1]))
+
+            resolved = [msg async for msg in agent.resolve_pending_tool_calls()]
+
+            assert peak == 3
+            assert [msg.tool_call_id for msg in resolved] == ["call_0", "call_1", "call_2"]
+            assert [msg.tool_call_id for msg in agent.tool] == ["call_0", "call_1", "call_2"]
+            assert resolved[0].content == "Done: t0"
+            assert agent.get_pending_tool_calls() == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_resolution_respects_limit_and_fires_events(self):
+        """max_tool_concurrency bounds in-flight calls; events fire per call"""
+
+        active = 0
+        peak = 0
+
+        @tool
+        async def slow_tool(name: str, delay: float) -> str:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(delay)
+            active -= 1
+            return name
+
+        async with Agent(
+            "Test agent",
+            tools=[slow_tool],
+            concurrent_tool_calls=True,
+            max_tool_concurrency=2,
+        ) as agent:
+            before: list[str] = []
+            after: list[str] = []
+            agent.on("tool:call:before")(lambda ctx: before.append(ctx.parameters["tool_call_id"]))
+            agent.on("tool:call:after")(lambda ctx: after.append(ctx.parameters["tool_call_id"]))
+
+            agent.assistant.append("", tool_calls=self._tool_calls("slow_tool", [0.05] * 5))
+            resolved = [msg async for msg in agent.resolve_pending_tool_calls()]
+            await agent.join()
+
+            assert peak == 2
+            assert len(resolved) == 5
+            assert sorted(before) == sorted(after) == [f"call_{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_tool_call_timeout_produces_error_message(self):
+        """Tools exceeding tool_call_timeout resolve to an error ToolMessage"""
+
+        @tool
+        async def slow_tool(name: str, delay: float) -> str:
+            await asyncio.sleep(delay)
+            return name
+
+        async with Agent(
+            "Test agent",
+            tools=[slow_tool],
+            concurrent_tool_calls=True,
+            tool_call_timeout=0.05,
+        ) as agent:
+            agent.assistant.append("", tool_calls=self._tool_calls("slow_tool", [0.01, 1.0]))
+            resolved = [msg async for msg in agent.resolve_pending_tool_calls()]
+
+            assert resolved[0].content == "t0"
+            assert resolved[1].tool_response is not None
+            assert resolved[1].tool_response.success is False
+            assert "timed out" in resolved[1].content
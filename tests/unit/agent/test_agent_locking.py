@@ -4,6 +4,7 @@ import threading
 import pytest
 
 from good_agent import Agent, tool
+from good_agent.agent.locking import ReentrantAsyncLock
 from good_agent.messages import AssistantMessage
 
 
@@ -91,3 +92,72 @@ async def test_threadsafe_proxy_executes_on_agent_loop():
         user_contents = [msg.content for msg in agent.user]
         assert "from thread" in user_contents
         assert isinstance(holder.get("assistant"), AssistantMessage)
+
+
+@pytest.mark.asyncio
+async def test_state_lock_is_task_reentrant_without_helper_threads():
+    threads_before = threading.active_count()
+    agents = [Agent() for _ in range(20)]
+
+    for agent in agents:
+        async with agent.state_guard():
+            async with agent.state_guard():
+                assert agent.state_lock.locked
+
+    assert threading.active_count() <= threads_before
+    assert not any(agent.state_lock.locked for agent in agents)
+
+
+@pytest.mark.asyncio
+async def test_state_lock_excludes_callers_on_other_threads():
+    lock = ReentrantAsyncLock()
+    order: list[str] = []
+    thread_waiting = threading.Event()
+
+    async def other_thread_critical_section():
+        thread_waiting.set()
+        async with lock:
+            order.append("thread")
+
+    async with lock:
+        thread = threading.Thread(target=asyncio.run, args=(other_thread_critical_section(),))
+        thread.start()
+        await asyncio.to_thread(thread_waiting.wait, 5)
+        await asyncio.sleep(0.05)
+        order.append("loop")
+
+    await asyncio.to_thread(thread.join, 5)
+    assert order == ["loop", "thread"]
+    assert not lock.locked
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_block_lock():
+    lock = ReentrantAsyncLock()
+    await lock.acquire()
+
+    async def acquire_and_release():
+        async with lock:
+            return "acquired"
+
+    waiter = asyncio.create_task(lock.acquire())
+    second = asyncio.create_task(acquire_and_release())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await lock.release()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert await asyncio.wait_for(second, timeout=1) == "acquired"
+    assert not lock.locked
+
+
+@pytest.mark.asyncio
+async def test_release_by_non_owner_raises():
+    lock = ReentrantAsyncLock()
+    await lock.acquire(owner_id=1)
+
+    with pytest.raises(RuntimeError, match="owner"):
+        await lock.release(owner_id=2)
+    await lock.release(owner_id=1)
+    assert not lock.locked
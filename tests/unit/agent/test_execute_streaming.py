@@ -0,0 +1,131 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from good_agent import Agent, tool
+from good_agent.messages import AssistantMessage, ToolMessage
+from good_agent.model.protocols import StreamChunk
+
+
+class TestExecuteStreaming:
+    """Test execute(streaming=True) yields deltas before assembled messages."""
+
+    @pytest.mark.asyncio
+    async def test_streaming_yields_chunks_then_message(self):
+        agent = Agent("System prompt")
+
+        with agent.mock(agent.mock.create("Hello there friend", role="assistant")):
+            items = [item async for item in agent.execute("Hi", streaming=True)]
+
+        chunks = [item for item in items if isinstance(item, StreamChunk)]
+        assert "".join(chunk.content or "" for chunk in chunks) == "Hello there friend"
+        assert len([chunk for chunk in chunks if chunk.content]) == 3
+
+        assert isinstance(items[-1], AssistantMessage)
+        assert items[-1].content == "Hello there friend"
+        assert agent.messages[-1] is items[-1]
+        assert items[-1].usage is not None
+
+    @pytest.mark.asyncio
+    async def test_streaming_executes_tool_calls(self):
+        started: list[str] = []
+
+        @tool
+        async def lookup(city: str) -> str:
+            started.append(city)
+            await asyncio.sleep(0)
+            return f"sunny in {city}"
+
+        agent = Agent("System prompt", tools=[lookup])
+
+        with agent.mock(
+            agent.mock.create(
+                "Checking",
+                role="assistant",
+                tool_calls=[
+                    {"name": "lookup", "arguments": {"city": "Paris"}},
+                    {"name": "lookup", "arguments": {"city": "Oslo"}},
+                ],
+            ),
+            agent.mock.create("Both sunny", role="assistant"),
+        ):
+            items = [item async for item in agent.execute("Weather?", streaming=True)]
+
+        messages = [item for item in items if not isinstance(item, StreamChunk)]
+        assert [type(m) for m in messages] == [
+            AssistantMessage,
+            ToolMessage,
+            ToolMessage,
+            AssistantMessage,
+        ]
+        assistant = messages[0]
+        assert isinstance(assistant, AssistantMessage) and assistant.tool_calls
+        assert [m.tool_call_id for m in messages[1:3]] == [tc.id for tc in assistant.tool_calls]
+        assert messages[1].content == "sunny in Paris"
+        assert started == ["Paris", "Oslo"]
+
+        tool_deltas = [
+            delta
+            for item in items
+            if isinstance(item, StreamChunk)
+            for delta in item.tool_calls or ()
+        ]
+        assert [delta.index for delta in tool_deltas] == [0, 1]
+        assert agent.get_pending_tool_calls() == []
+
+    @pytest.mark.asyncio
+    async def test_streaming_starts_tools_early_only_when_concurrent(self):
+        started: list[str] = []
+
+        @tool
+        async def lookup(city: str) -> str:
+            started.append(city)
+            return f"sunny in {city}"
+
+        for concurrent, expected in ((False, []), (True, ["Paris"])):
+            started.clear()
+            agent = Agent("System prompt", tools=[lookup], concurrent_tool_calls=concurrent)
+            with agent.mock(
+                agent.mock.create(
+                    "Checking",
+                    role="assistant",
+                    tool_calls=[{"name": "lookup", "arguments": {"city": "Paris"}}],
+                ),
+                agent.mock.create("Sunny", role="assistant"),
+            ):
+                async for item in agent.execute("Weather?", streaming=True):
+                    if isinstance(item, AssistantMessage) and item.tool_calls:
+                        await asyncio.sleep(0)
+                        assert started == expected
+            assert started == ["Paris"]
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_cancels_started_tools(self):
+        cancelled = asyncio.Event()
+
+        @tool
+        async def slow_lookup(city: str) -> str:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return city
+
+        agent = Agent("System prompt", tools=[slow_lookup], concurrent_tool_calls=True)
+        with agent.mock(
+            agent.mock.create(
+                "Checking",
+                role="assistant",
+                tool_calls=[{"name": "slow_lookup", "arguments": {"city": "Paris"}}],
+            ),
+        ):
+            async with contextlib.aclosing(agent.execute("Weather?", streaming=True)) as stream:
+                async for item in stream:
+                    if isinstance(item, AssistantMessage):
+                        await asyncio.sleep(0)
+                        break
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert agent._tool_executor._started == {}
@@ -0,0 +1,95 @@
+import pytest
+
+from good_agent import Agent
+from good_agent.events import AgentEvents
+from good_agent.messages import UserMessage
+
+
+class TestForkSharesHistory:
+    @pytest.mark.asyncio
+    async def test_fork_shares_messages_and_diverges_on_write(self):
+        async with Agent("System") as parent:
+            parent.append("Question")
+            parent.assistant.append("Answer")
+            shared = list(parent.messages)
+
+            fork = parent.fork()
+            assert [m.id for m in fork.messages] == [m.id for m in shared]
+            assert all(
+                a.content_parts is b.content_parts
+                for a, b in zip(fork.messages, shared, strict=True)
+            )
+            assert all(m.agent is fork for m in fork.messages)
+            assert all(m.agent is parent for m in parent.messages)
+
+            fork.append("Follow-up")
+            parent.messages[1] = UserMessage(content="Edited question")
+
+            assert len(parent.messages) == 3
+            assert fork.messages[1].id == shared[1].id
+            assert fork.messages[1].index == 1
+            assert fork.messages[-1].content == "Follow-up"
+            assert fork.messages[-1].agent is fork
+
+            # Version history of the fork resolves the shared messages
+            fork.revert_to_version(0)
+            assert [m.id for m in fork.messages] == [m.id for m in shared]
+
+    @pytest.mark.asyncio
+    async def test_template_messages_are_copied(self):
+        async with Agent("System") as parent:
+            parent.append("Agent: {{ agent.id }}")
+
+            fork = parent.fork()
+            copied = fork.messages[-1]
+            assert copied is not parent.messages[-1]
+            assert copied.agent is fork
+            assert str(fork.id) in copied.render()
+            assert str(parent.id) in parent.messages[-1].render()
+
+    @pytest.mark.asyncio
+    async def test_fork_renders_through_its_own_agent(self):
+        async with Agent("System") as parent:
+            parent.append("Question")
+            fork = parent.fork()
+
+            seen: list[Agent] = []
+
+            @fork.on(AgentEvents.MESSAGE_RENDER_BEFORE)
+            def _record(ctx):
+                seen.append(ctx.parameters["message"].agent)
+
+            fork.messages[-1].render()
+            parent.messages[-1].render()
+            assert seen == [fork]
+
+    @pytest.mark.asyncio
+    async def test_slice_fork_shares_messages(self):
+        async with Agent("System") as parent:
+            parent.append("One")
+            parent.append("Two")
+
+            fork = await parent._fork_with_messages(list(parent.messages[:2]))
+            assert [m.id for m in fork.messages] == [m.id for m in parent.messages[:2]]
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_fan_out_fork_cost(self):
+        """Forking shallow-copies each message once but shares its content."""
+        async with Agent("System", message_validation_mode="silent") as parent:
+            for index in range(250):
+                parent.messages.append(UserMessage(content=f"question {index}"))
+                parent.assistant.append(f"answer {index}")
+
+            children = [parent.fork() for _ in range(20)]
+
+            for child in children:
+                assert len(child.messages) == len(parent.messages)
+                for mine, theirs in zip(child.messages, parent.messages, strict=True):
+                    # One new binding per message and fork: O(N) objects, no new content
+                    assert mine is not theirs
+                    assert mine.id == theirs.id
+                    assert mine.content_parts is theirs.content_parts
+            for child in children:
+                await child.events.close()
@@ -0,0 +1,36 @@
+import asyncio
+import threading
+
+import pytest
+
+from good_agent import Agent
+
+
+class TestStateLockPerformance:
+    """Micro-benchmarks for Agent state lock acquisition."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    async def test_state_guard_latency_and_thread_count(self):
+        """Acquiring state guards on many agents must not spawn threads.
+
+        The previous implementation started one event-loop thread per agent and
+        hopped threads on every acquisition.
+        """
+        n_agents = 200
+        rounds = 20
+        threads_before = threading.active_count()
+        agents = [Agent() for _ in range(n_agents)]
+        acquired = 0
+
+        async def exercise(agent: Agent) -> None:
+            nonlocal acquired
+            for _ in range(rounds):
+                async with agent.state_guard():
+                    acquired += 1
+                    await asyncio.sleep(0)
+
+        await asyncio.gather(*(exercise(agent) for agent in agents))
+
+        assert acquired == n_agents * rounds
+        assert threading.active_count() - threads_before <= 0
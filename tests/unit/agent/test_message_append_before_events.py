@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from good_agent import Agent
@@ -56,6 +58,52 @@ async def test_message_append_before_passthrough():
         assert agent.messages[-1].content == "unchanged"
 
 
+def test_sync_append_without_async_handlers_stays_on_caller_thread(monkeypatch):
+    agent = Agent("System")
+    started: list[threading.Thread] = []
+    original_start = threading.Thread.start
+
+    def tracking_start(self):
+        started.append(self)
+        original_start(self)
+
+    monkeypatch.setattr(threading.Thread, "start", tracking_start)
+
+    for index in range(50):
+        agent.append(f"message {index}")
+    forked = agent.context_manager.fork()
+
+    # Agent construction in fork() may start the router's loop, but appends never spawn threads
+    assert not {"AgentMessageLoop", "AgentBlockingBridge"} & {thread.name for thread in started}
+    assert len(forked.messages) == len(agent.messages) == 51
+    assert forked.messages[0].content == "System"
+
+
+def test_sync_append_with_async_handler_still_intercepts():
+    agent = Agent("System")
+
+    @agent.on(AgentEvents.MESSAGE_APPEND_BEFORE)
+    async def intercept(ctx):
+        return ctx.parameters["message"].model_copy(update={"content_parts": ["intercepted"]})
+
+    agent.append("first")
+    agent.append("second")
+
+    assert [m.content for m in agent.messages[1:]] == ["intercepted", "intercepted"]
+
+
+def test_blocking_calls_share_one_bridge_thread():
+    agent = Agent("System")
+    agent.append("original")
+
+    for index in range(20):
+        agent.replace_message(1, agent.model.create_message(f"replacement {index}"))
+
+    bridges = [t for t in threading.enumerate() if t.name == "AgentBlockingBridge"]
+    assert len(bridges) == 1
+    assert agent.messages[1].content == "replacement 19"
+
+
 @pytest.mark.asyncio
 async def test_execute_before_interceptable(monkeypatch):
     async with Agent("System") as agent:
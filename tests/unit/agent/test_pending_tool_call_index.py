@@ -0,0 +1,100 @@
+import json
+import time
+
+import pytest
+
+from good_agent import Agent, tool
+from good_agent.messages import AssistantMessage, ToolMessage, UserMessage
+from good_agent.tools import ToolCall, ToolCallFunction
+
+
+@tool
+async def double(x: int) -> int:
+    return x * 2
+
+
+def _call(call_id: str, x: int = 1) -> ToolCall:
+    return ToolCall(
+        id=call_id,
+        type="function",
+        function=ToolCallFunction(name="double", arguments=json.dumps({"x": x})),
+    )
+
+
+def _response(call_id: str) -> ToolMessage:
+    return ToolMessage(content="2", tool_call_id=call_id, tool_name="double")
+
+
+class TestPendingToolCallIndex:
+    @pytest.mark.asyncio
+    async def test_appends_update_pending_calls(self):
+        async with Agent("System", tools=[double]) as agent:
+            agent.assistant.append("", tool_calls=[_call("a"), _call("b")])
+            assert [call.id for call in agent.get_pending_tool_calls()] == ["a", "b"]
+
+            agent.append(_response("b"))
+            assert [call.id for call in agent.get_pending_tool_calls()] == ["a"]
+            index = agent.messages._tool_call_index()
+            assert index.calls["b"][0] == 1
+
+            resolved = [message async for message in agent.resolve_pending_tool_calls()]
+            assert [message.tool_call_id for message in resolved] == ["a"]
+            assert agent.has_pending_tool_calls() is False
+            assert agent.messages._tool_call_index() is index
+
+    @pytest.mark.asyncio
+    async def test_edits_and_reverts_rebuild(self):
+        async with Agent("System", tools=[double]) as agent:
+            agent.assistant.append("", tool_calls=[_call("a")])
+            agent.append(_response("a"))
+            assert agent.has_pending_tool_calls() is False
+
+            # Replacing the response reopens the call
+            agent.messages[-1] = UserMessage(content="Skip it")
+            assert [call.id for call in agent.get_pending_tool_calls()] == ["a"]
+
+            agent.append(_response("a"))
+            assert agent.has_pending_tool_calls() is False
+            agent.revert_to_version(1)
+            assert [call.id for call in agent.get_pending_tool_calls()] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_record_invocation_reuses_existing_call(self):
+        async with Agent("System", tools=[double]) as agent:
+            agent.assistant.append("", tool_calls=[_call("a", 3)])
+            agent.add_tool_invocation(double, 6, {"x": 3}, tool_call_id="a")
+            agent.add_tool_invocation(double, 8, {"x": 4}, tool_call_id="b")
+
+            assert [message.role for message in agent.messages] == [
+                "system",
+                "assistant",
+                "tool",
+                "assistant",
+                "tool",
+            ]
+            assert agent.has_pending_tool_calls() is False
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_pending_check_cost(self):
+        """Pending-call checks read the index instead of scanning the history."""
+        async with Agent("System", tools=[double], message_validation_mode="silent") as agent:
+            for index in range(1_000):
+                call_id = f"call_{index}"
+                agent.messages.append(AssistantMessage(tool_calls=[_call(call_id)]))
+                agent.messages.append(_response(call_id))
+            agent.messages.append(AssistantMessage(tool_calls=[_call("open")]))
+
+            start = time.perf_counter()
+            agent.get_pending_tool_calls()
+            first_ms = (time.perf_counter() - start) * 1000
+
+            checks = 1_000
+            start = time.perf_counter()
+            for _ in range(checks):
+                pending = agent.get_pending_tool_calls()
+            per_check_us = (time.perf_counter() - start) / checks * 1_000_000
+
+            assert [call.id for call in pending] == ["open"]
+            assert per_check_us < first_ms * 1000
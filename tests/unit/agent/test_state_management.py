@@ -85,11 +85,12 @@ class TestStateManagement:
                 # Same number of messages
                 assert len(fork.messages) == len(original.messages)
 
-                # Messages have different IDs but same content
+                # The fork binds the same messages (IDs and content) to itself
                 for _i, (orig_msg, fork_msg) in enumerate(
                     zip(original.messages, fork.messages, strict=False)
                 ):
-                    assert orig_msg.id != fork_msg.id
+                    assert orig_msg.id == fork_msg.id
+                    assert fork_msg.agent is fork
                     assert orig_msg.content == fork_msg.content
                     assert orig_msg.role == fork_msg.role
 
@@ -0,0 +1,121 @@
+import copy
+
+import pytest
+
+from good_agent import Agent, AgentComponent, tool
+from good_agent.core.components import AdapterMetadata, ToolAdapter
+
+
+@tool
+async def fetch_url(url: str) -> str:
+    """Fetch content from a URL."""
+    return url
+
+
+@tool
+async def lookup(query: str) -> str:
+    """Look something up."""
+    return query
+
+
+class PrefixAdapter(ToolAdapter):
+    def should_adapt(self, tool, agent):
+        return tool.name == "fetch_url"
+
+    def analyze_transformation(self, tool, signature):
+        return AdapterMetadata(modified_params=set(), added_params={"prefix"}, removed_params=set())
+
+    def adapt_signature(self, tool, signature, agent):
+        adapted = copy.deepcopy(signature)
+        adapted["function"]["parameters"]["properties"]["prefix"] = {"type": "string"}
+        return adapted
+
+    def adapt_parameters(self, tool_name, parameters, agent):
+        return parameters
+
+
+def _count_builds(agent: Agent) -> list[int]:
+    coordinator = agent._llm_coordinator
+    build = coordinator._build_tool_definitions
+    calls = [0]
+
+    async def counted():
+        calls[0] += 1
+        return await build()
+
+    coordinator._build_tool_definitions = counted  # type: ignore[method-assign]
+    return calls
+
+
+class TestToolDefinitionsSnapshot:
+    @pytest.mark.asyncio
+    async def test_reused_until_tools_change(self):
+        async with Agent("System", tools=[fetch_url]) as agent:
+            builds = _count_builds(agent)
+            coordinator = agent._llm_coordinator
+
+            first = await coordinator.get_tool_definitions()
+            second = await coordinator.get_tool_definitions()
+            assert builds[0] == 1
+            assert first == second and first is not second
+
+            agent.tools["lookup"] = lookup
+            definitions = await coordinator.get_tool_definitions()
+            assert builds[0] == 2
+            assert definitions is not None
+            assert [d["function"]["name"] for d in definitions] == ["fetch_url", "lookup"]
+
+    @pytest.mark.asyncio
+    async def test_impure_handler_dispatches_every_call(self):
+        async with Agent("System", tools=[fetch_url]) as agent:
+            seen: list[str] = []
+
+            @agent.hooks.on_tools_generate_signature
+            def record(ctx):
+                seen.append(ctx.parameters["tool"].name)
+
+            await agent._llm_coordinator.get_tool_definitions()
+            await agent._llm_coordinator.get_tool_definitions()
+            assert seen == ["fetch_url", "fetch_url"]
+
+    @pytest.mark.asyncio
+    async def test_pure_handler_memoized(self):
+        async with Agent("System", tools=[fetch_url]) as agent:
+            seen: list[str] = []
+
+            @agent.hooks.on_tools_generate_signature(pure=True)
+            def record(ctx):
+                seen.append(ctx.parameters["tool"].name)
+
+            await agent._llm_coordinator.get_tool_definitions()
+            await agent._llm_coordinator.get_tool_definitions()
+            assert seen == ["fetch_url"]
+
+    @pytest.mark.asyncio
+    async def test_mode_switch_and_adapters_rebuild(self):
+        component = AgentComponent()
+        async with Agent("System", tools=[fetch_url], extensions=[component]) as agent:
+
+            @agent.modes("focused")
+            async def focused(agent: Agent):
+                yield agent
+
+            builds = _count_builds(agent)
+            coordinator = agent._llm_coordinator
+
+            await coordinator.get_tool_definitions()
+            async with agent.mode("focused"):
+                await coordinator.get_tool_definitions()
+            assert builds[0] == 2
+
+            component.register_tool_adapter(PrefixAdapter(component))
+            definitions = await coordinator.get_tool_definitions()
+            assert builds[0] == 3
+            assert definitions is not None
+            assert "prefix" in definitions[0]["function"]["parameters"]["properties"]
+
+            component.enabled = False
+            definitions = await coordinator.get_tool_definitions()
+            assert builds[0] == 4
+            assert definitions is not None
+            assert "prefix" not in definitions[0]["function"]["parameters"]["properties"]
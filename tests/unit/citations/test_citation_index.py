@@ -1,3 +1,7 @@
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from good_agent.core.types import URL
@@ -75,3 +79,137 @@ class TestCitationIndex:
         citation_index.aliases["https://cycle"] = "https://alias.loop"
         resolved = citation_index._resolve_aliases("https://cycle")
         assert isinstance(resolved, URL)
+
+
+class TestCitationIndexLookups:
+    def test_tag_index_follows_updates(self):
+        citation_index = CitationIndex()
+        first = citation_index.add("https://a.com/1", tags=["news", "2024"])
+        second = citation_index.add("https://a.com/2", tags="news")
+        citation_index.add("https://a.com/1", tags=["archived"])
+
+        assert citation_index.find_by_tag("news") == [first, second]
+        assert citation_index.find_by_tags(["2024", "archived"], match_all=True) == [first]
+        assert citation_index.find_by_tags(["archived", "missing"]) == [first]
+
+        citation_index.remove_tag(first, "news")
+        assert citation_index.find_by_tag("news") == [second]
+        assert citation_index.find_by_tags(["news", "2024"], match_all=True) == []
+
+    def test_metadata_index_follows_updates(self):
+        citation_index = CitationIndex()
+        first = citation_index.add("https://a.com/1", source="web", year=2024)
+        second = citation_index.add("https://a.com/2", source="web", authors=["Ada"])
+
+        assert citation_index.find_by_metadata(source="web") == [first, second]
+        assert citation_index.find_by_metadata(source="web", year=2024) == [first]
+        assert citation_index.find_by_metadata(authors=["Ada"]) == [second]
+
+        citation_index.update_metadata(first, source="pdf")
+        assert citation_index.find_by_metadata(source="web") == [second]
+        assert citation_index.find_by_metadata(source="pdf", year=2024) == [first]
+
+        citation_index.set_metadata(second, source="pdf")
+        assert citation_index.find_by_metadata(source="pdf") == [first, second]
+        assert citation_index.find_by_metadata(authors=["Ada"]) == []
+
+    def test_aliases_are_listed_for_their_current_target(self):
+        citation_index = CitationIndex()
+        citation_index.add("https://a.com/x")
+        citation_index.add("https://b.com/x")
+        citation_index.add_alias("https://a.com/x", "https://mirror.com/x")
+        citation_index.add_alias("https://a.com/x", "https://old.com/x")
+
+        assert citation_index._get_aliases("https://a.com/x") == {
+            URL("https://mirror.com/x"),
+            URL("https://old.com/x"),
+        }
+
+        citation_index.add_alias("https://b.com/x", "https://mirror.com/x")
+        assert citation_index._get_aliases("https://a.com/x") == {URL("https://old.com/x")}
+        assert citation_index._get_aliases("https://b.com/x") == {URL("https://mirror.com/x")}
+
+    def test_concurrent_adds_get_unique_indices(self):
+        citation_index = CitationIndex()
+        urls = [f"https://example.com/doc/{number}" for number in range(200)]
+
+        def add_all(offset: int) -> list[int]:
+            return [citation_index.add(urls[(offset + n) % len(urls)]) for n in range(len(urls))]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(add_all, range(0, 200, 25)))
+
+        assert len(citation_index) == len(urls)
+        assert sorted(citation_index.indices()) == list(range(1, len(urls) + 1))
+        for result in results:
+            assert sorted(result) == list(range(1, len(urls) + 1))
+
+    def test_snapshot_round_trip(self):
+        citation_index = CitationIndex(index_offset=10)
+        first = citation_index.add("https://a.com/1", value="Body", tags=["news"], title="One")
+        second = citation_index.add("https://a.com/2", tags=["news", "pdf"])
+        citation_index.add_alias("https://a.com/1", "https://mirror.com/1")
+
+        restored = CitationIndex.from_snapshot(citation_index.snapshot())
+
+        assert restored.as_dict() == citation_index.as_dict()
+        assert restored.get_value(first) == "Body"
+        assert restored.get_metadata(first) == {"title": "One"}
+        assert restored.find_by_tags(["news", "pdf"], match_all=True) == [second]
+        assert restored.find_by_metadata(title="One") == [first]
+        assert restored.lookup("https://mirror.com/1") == first
+        assert restored._get_aliases("https://a.com/1") == {URL("https://mirror.com/1")}
+        assert restored.add("https://a.com/3") == second + 1
+
+    def test_snapshot_version_is_checked(self):
+        with pytest.raises(ValueError, match="Unsupported"):
+            CitationIndex.from_snapshot(b'{"version": 0}')
+
+    def test_index_pickles_without_its_lock(self):
+        citation_index = CitationIndex()
+        citation_index.add("https://a.com/1", tags=["news"])
+
+        restored = pickle.loads(pickle.dumps(citation_index))
+
+        assert restored.find_by_tag("news") == [1]
+        assert restored.add("https://a.com/2") == 2
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    def test_tag_lookup_and_reload_cost(self):
+        """Tag lookups and reloads on an index shared by many sub-agents."""
+        citation_index = CitationIndex()
+        urls = [f"https://example.com/source/{number}" for number in range(2000)]
+        for number, url in enumerate(urls):
+            citation_index.add(url, tags=[f"agent-{number % 50}"], agent=number % 50)
+
+        lookups = 200
+        start = time.perf_counter()
+        for _ in range(lookups):
+            scanned = [
+                citation_index.url_to_index[url]
+                for url, tags in citation_index.tags_store.items()
+                if "agent-7" in tags
+            ]
+        scan_us = (time.perf_counter() - start) / lookups * 1_000_000
+
+        start = time.perf_counter()
+        for _ in range(lookups):
+            found = citation_index.find_by_tag("agent-7")
+        indexed_us = (time.perf_counter() - start) / lookups * 1_000_000
+
+        start = time.perf_counter()
+        rebuilt = CitationIndex()
+        for number, url in enumerate(urls):
+            rebuilt.add(url, tags=[f"agent-{number % 50}"], agent=number % 50)
+        rebuild_ms = (time.perf_counter() - start) * 1000
+
+        snapshot = citation_index.snapshot()
+        start = time.perf_counter()
+        restored = CitationIndex.from_snapshot(snapshot)
+        restore_ms = (time.perf_counter() - start) * 1000
+
+        assert found == sorted(scanned)
+        assert restored.find_by_metadata(agent=7) == found
+        assert indexed_us < scan_us
+        assert restore_ms < rebuild_ms
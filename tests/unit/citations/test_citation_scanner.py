@@ -0,0 +1,145 @@
+import time
+
+import pytest
+
+from good_agent import Agent
+from good_agent.content import RenderMode
+from good_agent.extensions.citations import CitationIndex, CitationManager
+from good_agent.extensions.citations.formats import CitationPatterns
+from good_agent.extensions.citations.manager import NORMALIZED_CACHE_SIZE
+
+
+def _texts(parts: list) -> list[str]:
+    return [part.text for part in parts]
+
+
+class TestInlineScanner:
+    def test_forms_are_found_in_document_order(self):
+        text = (
+            '[!CITE_4!] <item url="https://a.com/x"/> [docs](https://b.com/y) [2] https://c.com/z'
+        )
+
+        kinds = [match.lastgroup for match in CitationPatterns.INLINE.finditer(text)]
+
+        assert kinds == ["llm", "xml_url", "link_url", "markdown", "url"]
+
+    def test_markdown_link_becomes_text_and_citation(self):
+        manager = CitationManager()
+
+        parts, citations = manager._process_content_parts(
+            ["See [docs](https://x.com/a) and https://y.com/b"], None, "assistant"
+        )
+
+        assert _texts(parts) == ["See docs [!CITE_1!] and [!CITE_2!]"]
+        assert citations == ["https://x.com/a", "https://y.com/b"]
+
+    def test_mixed_forms_keep_grouped_numbering(self):
+        manager = CitationManager()
+
+        parts, citations = manager._process_content_parts(
+            ['See https://c.com/3 and <r url="https://a.com/1"/> then [2]\n\n[2]: https://r.com/2'],
+            None,
+            "tool",
+        )
+
+        # Reference blocks first, then XML attributes, then inline URLs
+        assert citations == ["https://r.com/2", "https://a.com/1", "https://c.com/3"]
+        assert _texts(parts) == ['See [!CITE_3!] and <r idx="2"/> then [!CITE_1!]']
+
+
+class TestNormalizationCache:
+    def test_unchanged_content_reuses_result(self):
+        manager = CitationManager()
+        content = ["Visit https://a.com/x and [1]"]
+
+        first = manager._process_content_parts(content, None, "assistant")
+        second = manager._process_content_parts(content, None, "assistant")
+
+        assert _texts(second[0]) == _texts(first[0]) == ["Visit [!CITE_1!] and [!CITE_1!]"]
+        assert second[1] == first[1]
+        assert second[0] is not first[0] and second[1] is not first[1]
+        assert len(manager._normalized) == 1
+
+    def test_index_generation_invalidates_result(self):
+        index = CitationIndex()
+        manager = CitationManager(citation_index=index)
+        content = ["Known [!CITE_1!]"]
+
+        parts, citations = manager._process_content_parts(content, None, "assistant")
+        assert citations is None
+
+        index.add("https://a.com/x")
+        parts, citations = manager._process_content_parts(content, None, "assistant")
+        assert citations == ["https://a.com/x"]
+        assert _texts(parts) == ["Known [!CITE_1!]"]
+
+    def test_swapping_index_drops_cached_results(self):
+        manager = CitationManager()
+        content = ["Known [!CITE_1!]"]
+        manager._process_content_parts(content, None, "assistant")
+        manager._transform_cached("Known [!CITE_1!]", ["https://a.com/x"], RenderMode.LLM, "user")
+
+        replacement = CitationIndex()
+        replacement.add("https://b.com/y")
+        manager.index = replacement
+
+        assert not manager._normalized and not manager._transformed
+        assert manager.render_cache_key() == (replacement, 1)
+        _, citations = manager._process_content_parts(content, None, "assistant")
+        assert citations == ["https://b.com/y"]
+
+    def test_cache_is_bounded(self):
+        manager = CitationManager()
+        for number in range(NORMALIZED_CACHE_SIZE + 5):
+            manager._process_content_parts([f"item {number}"], None, "user")
+
+        assert len(manager._normalized) == NORMALIZED_CACHE_SIZE
+
+    def test_index_generation_tracks_new_entries_and_aliases(self):
+        index = CitationIndex()
+        index.add("https://a.com/x")
+        index.add("https://a.com/x", tags=["seen"])
+        assert index.generation == 1
+
+        index.add_alias("https://a.com/x", "http://a.com/x")
+        assert index.generation == 2
+
+    @pytest.mark.asyncio
+    async def test_rerender_reuses_transformed_text(self):
+        manager = CitationManager()
+        async with Agent(extensions=[manager]) as agent:
+            agent.append("Text [1].\n\n[1]: https://example.com/doc")
+            message = agent.messages[-1]
+
+            first = message.render(RenderMode.LLM)
+            cached = len(manager._transformed)
+            assert message.render(RenderMode.LLM) == first
+            assert len(manager._transformed) == cached
+
+            assert "[example.com](https://example.com/doc)" in message.render(RenderMode.DISPLAY)
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    def test_normalization_cost(self):
+        """Per-call cost of normalizing an unchanged multi-citation message."""
+        manager = CitationManager()
+        paragraph = (
+            "Findings in https://example.com/study/{n} agree with [docs](https://docs.org/{n}) "
+            'and <source url="https://data.gov/set/{n}"/> as noted in [1].\n'
+        )
+        content = ["".join(paragraph.format(n=n) for n in range(40))]
+        calls = 100
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            manager._normalized.clear()
+            parts, _ = manager._process_content_parts(content, None, "assistant")
+        uncached_us = (time.perf_counter() - start) / calls * 1_000_000
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            cached_parts, _ = manager._process_content_parts(content, None, "assistant")
+        cached_us = (time.perf_counter() - start) / calls * 1_000_000
+
+        assert _texts(cached_parts) == _texts(parts)
+        assert cached_us < uncached_us
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from good_agent.core.event_router import EventContext, EventRouter
+
+N_COMPONENTS = 12
+HANDLERS_PER_COMPONENT = 4
+
+
+def _build_router() -> EventRouter:
+    """A router shaped like an agent with a dozen components broadcasting to it."""
+    root = EventRouter()
+    for index in range(N_COMPONENTS):
+        component = EventRouter()
+        for offset in range(HANDLERS_PER_COMPONENT):
+
+            def handler(ctx: EventContext) -> None:
+                return None
+
+            component.on(f"bench:event:{offset}", priority=100 + index)(handler)
+
+        @component.on("*", priority=index)
+        def observe(ctx: EventContext) -> None:
+            return None
+
+        root.broadcast_to(component)
+    return root
+
+
+def _per_call_us(fn: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+async def _per_call_us_async(fn: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await fn()  # type: ignore[misc]
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestEventDispatchBenchmarks:
+    """Micro-benchmarks for handler lookup and dispatch."""
+
+    def test_handler_lookup(self) -> None:
+        """Compiled lookups should be plain dictionary reads after the first call."""
+        router = _build_router()
+        registry = router._handler_registry
+
+        cold_us = _per_call_us(
+            lambda: registry._collect_handlers("bench:event:0", True, set()), 2_000
+        )
+        warm_us = _per_call_us(lambda: router._get_sorted_handlers("bench:event:0"), 20_000)
+        handlers = router._get_sorted_handlers("bench:event:0")
+
+        assert len(handlers) == 2 * N_COMPONENTS
+        assert warm_us < cold_us
+
+    def test_apply_typed_sync_dispatch(self) -> None:
+        """Dispatch reads the compiled table instead of collecting handlers each time."""
+        router = _build_router()
+
+        def uncompiled() -> None:
+            router._handler_registry._invalidate()
+            router.apply_typed_sync("bench:event:1", value=1)
+
+        compiled_us = _per_call_us(lambda: router.apply_typed_sync("bench:event:1", value=1), 5_000)
+        assert compiled_us < _per_call_us(uncompiled, 5_000)
+
+    async def test_apply_async_dispatch(self) -> None:
+        router = _build_router()
+
+        async def uncompiled() -> None:
+            router._handler_registry._invalidate()
+            await router.apply_async("bench:event:2", value=1)
+
+        compiled_us = await _per_call_us_async(
+            lambda: router.apply_async("bench:event:2", value=1), 5_000
+        )
+        assert compiled_us < await _per_call_us_async(uncompiled, 5_000)
+
+    async def test_apply_typed_unsubscribed_event(self) -> None:
+        """Events only wildcard observers see still dispatch from the compiled table."""
+        router = _build_router()
+
+        async def uncompiled() -> None:
+            router._handler_registry._invalidate()
+            await router.apply_typed("bench:unsubscribed", value=1)
+
+        compiled_us = await _per_call_us_async(
+            lambda: router.apply_typed("bench:unsubscribed", value=1), 5_000
+        )
+        assert compiled_us < await _per_call_us_async(uncompiled, 5_000)
+
+    def test_registration_churn(self) -> None:
+        """Registering and removing a handler invalidates and rebuilds tables."""
+        router = _build_router()
+        before = len(router._get_sorted_handlers("bench:event:3"))
+
+        for _ in range(1_000):
+            handler_fn = router.on("bench:event:3")(lambda ctx: None)
+            assert len(router._get_sorted_handlers("bench:event:3")) == before + 1
+            router._handler_registry.deregister(handler_fn._handler_id)  # type: ignore[attr-defined]
+
+        assert len(router._get_sorted_handlers("bench:event:3")) == before
+
+    async def test_unsubscribed_event_fast_path(self) -> None:
+        """Events nobody listens for skip context setup and logging."""
+        router = EventRouter()
+
+        @router.on("bench:somebody")
+        def handler(ctx: EventContext) -> None:
+            return None
+
+        async def per_call(event: str) -> float:
+            return await _per_call_us_async(lambda: router.apply_typed(event, value=1), 20_000)
+
+        def sync_per_call(event: str) -> float:
+            return _per_call_us(lambda: router.apply_sync(event, value=1), 20_000)
+
+        assert await per_call("bench:nobody") < await per_call("bench:somebody")
+        assert sync_per_call("bench:nobody") < sync_per_call("bench:somebody")
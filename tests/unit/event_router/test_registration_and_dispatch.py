@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from typing import Any
 
 import pytest
 
@@ -75,3 +76,88 @@ async def test_emit_decorator_fires_lifecycle_events() -> None:
     assert result == "work:7"
     assert before == [7]
     assert after == ["work:7"]
+
+
+def test_compiled_handlers_reused_until_registration_changes(router: EventRouter) -> None:
+    @router.on("demo:compiled")
+    def first(_: EventContext) -> None:
+        pass
+
+    handlers = router._get_sorted_handlers("demo:compiled")
+    assert router._get_sorted_handlers("demo:compiled") is handlers
+
+    @router.on("demo:compiled", priority=200)
+    def second(_: EventContext) -> None:
+        pass
+
+    assert [r.handler for r in router._get_sorted_handlers("demo:compiled")] == [second, first]
+
+    router._handler_registry.deregister(second._handler_id)  # type: ignore[attr-defined]
+    assert [r.handler for r in router._get_sorted_handlers("demo:compiled")] == [first]
+
+
+def test_compiled_handlers_see_broadcast_target_changes(router: EventRouter) -> None:
+    target = EventRouter()
+    downstream = EventRouter()
+    router.consume_from(downstream)  # downstream -> router
+    target.consume_from(router)  # router -> target
+
+    assert downstream._get_sorted_handlers("demo:chain") == ()
+
+    @target.on("demo:chain")
+    def handler(_: EventContext) -> None:
+        pass
+
+    # Registration two hops away invalidates the upstream table
+    assert [r.handler for r in downstream._get_sorted_handlers("demo:chain")] == [handler]
+
+
+def test_has_subscribers_tracks_registration_and_tracing(router: EventRouter) -> None:
+    assert not router.has_subscribers("demo:quiet")
+
+    @router.on("demo:quiet")
+    def handler(_: EventContext) -> None:
+        pass
+
+    assert router.has_subscribers("demo:quiet")
+    router._handler_registry.deregister(handler._handler_id)  # type: ignore[attr-defined]
+    assert not router.has_subscribers("demo:quiet")
+
+    router.set_event_trace(True)
+    assert router.has_subscribers("demo:quiet")
+
+
+@pytest.mark.asyncio
+async def test_unsubscribed_events_return_minimal_context(router: EventRouter) -> None:
+    ctx = await router.apply_typed("demo:quiet", output="initial", value=1)
+    assert ctx.return_value == "initial"
+    assert ctx.parameters == {"output": "initial", "value": 1}
+    assert ctx.event == "demo:quiet"
+
+    sync_ctx = router.apply_typed_sync("demo:quiet", output="initial", value=2)
+    assert sync_ctx.return_value == "initial"
+    assert sync_ctx.parameters["value"] == 2
+
+    async_ctx = await router.apply_async("demo:quiet", value=3)
+    assert async_ctx.parameters == {"value": 3}
+    assert async_ctx.return_value is None
+
+    router.do("demo:quiet", value=4)
+    await router.join()
+
+
+def test_apply_sync_traces_unsubscribed_events(router: EventRouter) -> None:
+    traced: list[tuple[str, str]] = []
+
+    def log_event(event: str, method: str, *args: Any, **kwargs: Any) -> None:
+        traced.append((event, method))
+
+    router._log_event = log_event  # type: ignore[method-assign]
+
+    router.apply_sync("demo:quiet", value=1)
+    assert traced == []
+
+    router.set_event_trace(True)
+    ctx = router.apply_sync("demo:quiet", value=2)
+    assert ctx.parameters == {"value": 2}
+    assert traced == [("demo:quiet", "apply_sync"), ("demo:quiet", "apply_sync")]
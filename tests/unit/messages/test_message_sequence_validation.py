@@ -1,3 +1,4 @@
+import time
 from typing import Literal
 
 import pytest
@@ -414,3 +415,109 @@ class TestAgentMessageSequenceValidation:
         """Test that default validation mode is 'warn'."""
         async with Agent("Test") as agent:
             assert agent._sequence_validator.mode == ValidationMode.WARN
+
+
+def _tool_turn(index: int) -> list:
+    tool_call_id = f"call_{index}"
+    return [
+        UserMessage(content=f"Question {index}"),
+        AssistantMessage(
+            tool_calls=[
+                ToolCall(
+                    id=tool_call_id,
+                    type="function",
+                    function=ToolCallFunction(name="lookup", arguments="{}"),
+                )
+            ],
+        ),
+        ToolMessage(content="result", tool_call_id=tool_call_id, tool_name="lookup"),
+        AssistantMessage(content=f"Answer {index}"),
+    ]
+
+
+@pytest.mark.asyncio
+class TestIncrementalSequenceValidation:
+    """Validation state is carried across calls on the agent's message list."""
+
+    async def test_appends_only_scan_new_messages(self):
+        async with Agent("System", message_validation_mode="strict") as agent:
+            validator = agent._sequence_validator
+            agent.messages.extend(_tool_turn(0))
+            assert validator.validate(agent.messages) == []
+            state = validator._state
+            assert state is not None and state.length == 5
+
+            agent.messages.extend(_tool_turn(1)[:2])
+            assert (
+                validator.validate_partial_sequence(agent.messages, allow_pending_tools=True) == []
+            )
+            assert validator._state is state and state.length == 7
+
+            # The open tool call is resolved by the next append
+            agent.messages.extend(_tool_turn(1)[2:])
+            assert validator.validate(agent.messages) == []
+            assert validator._state is state and state.length == 9
+
+    async def test_edits_revalidate_from_scratch(self):
+        async with Agent("System") as agent:
+            validator = agent._sequence_validator
+            agent.messages.extend(_tool_turn(0))
+            assert validator.validate(agent.messages) == []
+            state = validator._state
+
+            # Replacing the tool response leaves the call unanswered
+            agent.messages[3] = UserMessage(content="Never mind")
+            issues = validator.validate(agent.messages)
+            assert validator._state is not state
+            assert any("Expected tool response at index 3" in issue for issue in issues)
+
+            agent.messages.pop(3)
+            issues = validator.validate(agent.messages)
+            assert any("Expected tool response at index 3" in issue for issue in issues)
+
+    async def test_version_revert_revalidates(self):
+        async with Agent("System") as agent:
+            agent.messages.append(UserMessage(content="First"))
+            assert agent.validate_message_sequence() == []
+
+            agent.messages.append(UserMessage(content="Second"))
+            assert any("Consecutive user" in issue for issue in agent.validate_message_sequence())
+
+            agent.revert_to_version(1)
+            assert len(agent.messages) == 2
+            assert agent.validate_message_sequence() == []
+
+    async def test_out_of_sequence_response_reports_call_site(self):
+        validator = MessageSequenceValidator(mode=ValidationMode.SILENT)
+        messages = _tool_turn(0) + _tool_turn(1)
+        messages.append(ToolMessage(content="again", tool_call_id="call_0", tool_name="lookup"))
+
+        issues = validator._validate_tool_sequencing(messages)
+        assert issues == [
+            "Tool response at index 8 appears out of sequence "
+            "(should immediately follow assistant message at index 1)"
+        ]
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    async def test_pre_call_validation_cost(self):
+        """Re-validating a long conversation after one append is O(delta)."""
+        async with Agent("System", message_validation_mode="silent") as agent:
+            agent.messages.extend(message for index in range(500) for message in _tool_turn(index))
+            validator = MessageSequenceValidator(mode=ValidationMode.WARN)
+
+            start = time.perf_counter()
+            assert validator.validate(list(agent.messages)) == []
+            full_ms = (time.perf_counter() - start) * 1000
+
+            validator.validate(agent.messages)
+            turns = [_tool_turn(500 + index) for index in range(50)]
+            elapsed = 0.0
+            for turn in turns:
+                agent.messages.extend(turn)
+                start = time.perf_counter()
+                assert validator.validate(agent.messages) == []
+                elapsed += time.perf_counter() - start
+            per_turn_ms = elapsed / len(turns) * 1000
+
+            assert per_turn_ms < full_ms
@@ -1,4 +1,5 @@
 import asyncio
+import gc
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -8,6 +9,7 @@ from good_agent.messages import AssistantMessage, UserMessage
 from good_agent.messages.store import (
     InMemoryMessageStore,
     MessageNotFoundError,
+    SQLiteSpillTier,
     get_message,
     get_message_store,
     message_store,
@@ -232,6 +234,78 @@ class TestInMemoryMessageStore:
         assert mock_redis.delete.call_count >= 0  # May be called, but error handling can suppress
 
 
+class TestMessageStoreTiers:
+    """Test hot-tier bounds, weak release and the spill tier"""
+
+    def test_hot_tier_evicts_least_recently_used(self):
+        store = InMemoryMessageStore(max_messages=2)
+        first = UserMessage(content="first")
+        second = UserMessage(content="second")
+        third = UserMessage(content="third")
+
+        store.put(first)
+        store.put(second)
+        store.get(first.id)  # refresh first so second is the LRU entry
+        store.put(third)
+
+        assert store.hot_size == 2
+        assert store.stats.evictions == 1
+        assert list(store._memory_cache) == [str(first.id), str(third.id)]
+
+    def test_evicted_message_released_when_unreferenced(self):
+        store = InMemoryMessageStore(max_messages=1)
+        kept = UserMessage(content="kept")
+        store.put(kept)
+        store.put(UserMessage(content="dropped"))
+        dropped_id = list(store._memory_cache)[0]
+        store.put(UserMessage(content="newest"))
+        gc.collect()
+
+        # Still referenced here, so served from the weak tier and promoted
+        assert store.get(kept.id) is kept
+        assert store.stats.weak_hits == 1
+        assert store.hot_size == 1
+
+        assert not store.exists(ULID.from_str(dropped_id))
+        with pytest.raises(MessageNotFoundError):
+            store.get(ULID.from_str(dropped_id))
+        assert store.stats.misses == 1
+
+    def test_byte_bound(self):
+        store = InMemoryMessageStore(max_messages=None, max_bytes=1)
+        store.put(UserMessage(content="a" * 100))
+        newest = UserMessage(content="b" * 100)
+        store.put(newest)
+
+        # The newest message is always kept even if it alone exceeds the bound
+        assert list(store._memory_cache) == [str(newest.id)]
+        assert store.hot_bytes > 1
+        assert store.stats.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_spill_tier_faults_messages_back_in(self, tmp_path):
+        spill = SQLiteSpillTier(str(tmp_path / "messages.db"))
+        store = InMemoryMessageStore(max_messages=1, spill=spill)
+        message_id = ULID()
+        store.put(UserMessage(content="spilled", id=message_id))
+        store.put(UserMessage(content="newest"))
+        gc.collect()
+
+        assert store.stats.spills == 1
+        assert len(spill) == 1
+        assert store.exists(message_id)
+        assert message_id not in store
+
+        restored = await store.aget(message_id)
+        assert restored.content == "spilled"
+        assert store.stats.faults == 1
+        assert store.get(message_id) is restored
+
+        store.clear()
+        assert len(spill) == 0
+        spill.close()
+
+
 class TestGlobalMessageStore:
     """Test the global message store interface"""
 
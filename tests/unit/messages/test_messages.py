@@ -724,6 +724,24 @@ class TestFilteredMessageList:
         # Non-empty list is True
         assert user_msgs
 
+    @pytest.mark.asyncio
+    async def test_filtered_list_is_live_view(self, agent):
+        """Role views read the agent's messages without copying them."""
+        users = agent.user
+        assert len(users) == 0
+
+        agent.append("First user", role="user")
+        agent.append("Reply", role="assistant")
+        agent.append("Second user", role="user")
+
+        assert len(users) == 2
+        assert users[-1] is agent.messages[-1]
+        assert list(users) == [agent.messages[0], agent.messages[2]]
+        assert users == agent.user
+        assert agent.messages[0] in users
+        assert list.__len__(users) == 0
+        assert agent.messages.user == list(users)
+
 
 class TestMessageEventIntegration:
     """Test message event system integration."""
@@ -0,0 +1,104 @@
+import time
+
+import pytest
+
+from good_agent import Agent
+from good_agent.messages import AssistantMessage, MessageList, UserMessage
+
+
+class TestRoleIndex:
+    def test_filter_by_role_follows_edits(self):
+        messages = MessageList([UserMessage(content="a"), AssistantMessage(content="b")])
+        assert [m.content for m in messages.filter(role="user")] == ["a"]
+
+        messages.append(UserMessage(content="c"))
+        assert [m.content for m in messages.filter(role="user")] == ["a", "c"]
+
+        messages[0] = AssistantMessage(content="d")
+        assert [m.content for m in messages.filter(role="user")] == ["c"]
+        assert [m.content for m in messages.filter(role="assistant")] == ["d", "b"]
+
+        del messages[1]
+        assert [m.content for m in messages.filter(role="assistant")] == ["d"]
+        assert list(messages.filter(role="tool")) == []
+
+    @pytest.mark.asyncio
+    async def test_role_views_track_the_conversation(self):
+        async with Agent("System") as agent:
+            assert not agent.user
+            assert agent.user.content is None
+
+            agent.append("First")
+            agent.assistant.append("Reply")
+            agent.append("Second")
+            assert agent.user
+            assert len(agent.user) == 2
+            assert agent.user[-1].content == "Second"
+            assert agent.user.content == "First"
+
+            # Views hold no messages of their own: clearing one leaves the index alone
+            view = agent.user
+            view.clear()
+            assert len(agent.user) == 2
+
+            agent.system.set("New system")
+            assert len(agent.system) == 1
+            assert agent.system[0].content == "New system"
+
+            agent.revert_to_version(1)
+            assert agent.system[0].content == "System"
+            assert len(agent.user) == 1
+
+    def test_filter_by_role_is_a_live_view(self):
+        messages = MessageList([UserMessage(content="a"), AssistantMessage(content="b")])
+        users = messages.filter(role="user")
+        assert users == messages.user
+
+        messages.append(UserMessage(content="c"))
+        assert [m.content for m in users] == ["a", "c"]
+        assert users[-1] is messages[-1]
+        assert list.__len__(users) == 0
+
+    @pytest.mark.asyncio
+    async def test_role_views_support_list_helpers(self):
+        async with Agent("System") as agent:
+            agent.append("First", name="alice")
+            agent.assistant.append("Reply")
+            agent.append("Second", name="bob")
+
+            assert [m.content for m in agent.user.filter(name="bob")] == ["Second"]
+            assert [m.content for m in agent.user.filter(role="user")] == ["First", "Second"]
+            assert list(agent.user.filter(role="assistant")) == []
+
+            counts = agent.messages.token_counts("gpt-4o")
+            assert agent.user.token_counts("gpt-4o") == {"user": counts["user"]}
+            assert agent.tool.token_counts("gpt-4o") == {}
+
+            agent.append("Third")
+            assert agent.user.token_counts("gpt-4o")["user"] > counts["user"]
+            assert agent.assistant._tool_call_index().pending == {}
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_role_view_access_cost(self):
+        """Role views read the index instead of filtering the whole conversation."""
+        async with Agent("System", message_validation_mode="silent") as agent:
+            for index in range(1_000):
+                agent.messages.append(UserMessage(content=f"question {index}"))
+                agent.messages.append(AssistantMessage(content=f"answer {index}"))
+
+            iterations = 500
+            start = time.perf_counter()
+            for _ in range(iterations):
+                [m for m in agent.messages if m.role == "assistant"][-1]
+            scan_us = (time.perf_counter() - start) / iterations * 1_000_000
+
+            start = time.perf_counter()
+            for _ in range(iterations):
+                last = agent.assistant[-1]
+            view_us = (time.perf_counter() - start) / iterations * 1_000_000
+
+            assert last.content == "answer 999"
+            assert not agent.tool
+            assert view_us < scan_us
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import time
 from types import SimpleNamespace
 
 import pytest
 
+from good_agent import Agent
 from good_agent.content import FileContentPart, ImageContentPart, RenderMode
 from good_agent.messages import Message, UserMessage
 from good_agent.model.formatting import MessageFormatter
@@ -72,3 +74,115 @@ async def test_format_message_content_emits_file_payload():
     assert file_payload.get("file", {}).get("file_id") == "file-789"
     assert file_payload["file"].get("format") == "application/pdf"
     assert file_payload["file"].get("filename") == "report.pdf"
+
+
+def _formatter_for(agent: Agent) -> MessageFormatter:
+    agent.model._ensure_helpers()
+    assert agent.model._formatter is not None
+    return agent.model._formatter
+
+
+class TestFormattedPayloadCache:
+    @pytest.mark.asyncio
+    async def test_only_new_messages_are_formatted(self):
+        async with Agent("System") as agent:
+            agent.append("first question")
+            agent.append("first answer", role="assistant")
+            formatter = _formatter_for(agent)
+
+            first = await agent.model.format_message_list_for_llm(agent.messages)
+            assert formatter.cache_stats.misses == 3
+
+            agent.append("second question")
+            second = await agent.model.format_message_list_for_llm(agent.messages)
+
+            assert second[:3] == first
+            assert second[3]["content"] == [{"type": "text", "text": "second question"}]
+            assert formatter.cache_stats.hits == 3
+            assert formatter.cache_stats.misses == 4
+            assert formatter.cache_stats.hit_rate == pytest.approx(3 / 7)
+
+    @pytest.mark.asyncio
+    async def test_payloads_are_copied(self):
+        async with Agent("System") as agent:
+            agent.append("question")
+            first = await agent.model.format_message_list_for_llm(agent.messages)
+            first[1]["content"].append({"type": "text", "text": "injected"})
+
+            second = await agent.model.format_message_list_for_llm(agent.messages)
+            assert len(second[1]["content"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_impure_render_handler_disables_cache(self):
+        async with Agent("System") as agent:
+            agent.append("question")
+            seen: list[str] = []
+
+            @agent.hooks.on_message_render_before
+            def record(ctx):
+                seen.append(ctx.parameters["message"].role)
+
+            await agent.model.format_message_list_for_llm(agent.messages)
+            await agent.model.format_message_list_for_llm(agent.messages)
+
+            assert seen == ["system", "user", "system", "user"]
+            assert _formatter_for(agent).cache_stats.bypassed == 4
+
+    @pytest.mark.asyncio
+    async def test_pure_render_handler_runs_once_per_message(self):
+        async with Agent("System") as agent:
+            agent.append("question")
+            seen: list[str] = []
+
+            @agent.hooks.on_message_render_before(pure=True)
+            def record(ctx):
+                seen.append(ctx.parameters["message"].role)
+
+            @agent.modes("research")
+            async def research(agent: Agent):
+                yield agent
+
+            await agent.model.format_message_list_for_llm(agent.messages)
+            await agent.model.format_message_list_for_llm(agent.messages)
+            assert seen == ["system", "user"]
+
+            async with agent.mode("research"):
+                await agent.model.format_message_list_for_llm(agent.messages)
+            assert seen == ["system", "user", "system", "user"]
+
+    @pytest.mark.asyncio
+    async def test_template_messages_are_rendered_every_time(self):
+        async with Agent("System", context={"topic": "cats"}) as agent:
+            agent.append("Tell me about {{ topic }}")
+            formatter = _formatter_for(agent)
+
+            first = await agent.model.format_message_list_for_llm(agent.messages)
+            agent.context["topic"] = "dogs"
+            second = await agent.model.format_message_list_for_llm(agent.messages)
+
+            assert "cats" in first[1]["content"][0]["text"]
+            assert "dogs" in second[1]["content"][0]["text"]
+            assert formatter.cache_stats.bypassed == 2
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_long_conversation_formatting(self):
+        """Formatting the next turn reuses cached payloads for earlier messages."""
+        async with Agent("System") as agent:
+            for index in range(200):
+                agent.append(f"question {index}")
+                agent.append(f"answer {index}", role="assistant")
+            formatter = _formatter_for(agent)
+
+            start = time.perf_counter()
+            await agent.model.format_message_list_for_llm(agent.messages)
+            cold_ms = (time.perf_counter() - start) * 1000
+
+            agent.append("one more question")
+            start = time.perf_counter()
+            await agent.model.format_message_list_for_llm(agent.messages)
+            warm_ms = (time.perf_counter() - start) * 1000
+
+            assert formatter.cache_stats.hit_rate > 0
+            assert warm_ms < cold_ms
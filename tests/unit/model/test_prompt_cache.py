@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import copy
+from types import SimpleNamespace
+from typing import Any
+
+from good_agent import Agent
+from good_agent.model.prompt_cache import PromptCachePlanner
+
+EPHEMERAL = {"type": "ephemeral"}
+
+
+def _conversation(turns: int) -> list[dict[str, Any]]:
+    messages: list[dict[str, Any]] = [{"role": "system", "content": "You are helpful."}]
+    for index in range(turns):
+        messages.append({"role": "user", "content": f"question {index}"})
+        messages.append({"role": "assistant", "content": f"answer {index}"})
+    return messages
+
+
+def _tools() -> list[dict[str, Any]]:
+    return [
+        {"type": "function", "function": {"name": "search", "parameters": {}}},
+        {"type": "function", "function": {"name": "fetch", "parameters": {}}},
+    ]
+
+
+def _marked(messages: list[Any]) -> list[int]:
+    positions = []
+    for position, message in enumerate(messages):
+        content = message.get("content")
+        if message.get("cache_control") or (
+            isinstance(content, list) and content and content[-1].get("cache_control")
+        ):
+            positions.append(position)
+    return positions
+
+
+class TestPromptCachePlanner:
+    def test_first_request_is_not_marked(self):
+        planner = PromptCachePlanner()
+        config = {"tools": _tools()}
+
+        messages = planner.apply(_conversation(1), config)
+
+        assert _marked(messages) == []
+        assert "cache_control" not in config["tools"][-1]
+
+    def test_stable_prefix_is_marked_without_touching_inputs(self):
+        planner = PromptCachePlanner()
+        planner.apply(_conversation(1), {"tools": _tools()})
+
+        request = _conversation(2)
+        original = copy.deepcopy(request)
+        config = {"tools": _tools()}
+        messages = planner.apply(request, config)
+
+        # System message and the end of the three messages seen last time
+        assert _marked(messages) == [0, 2]
+        assert messages[2]["content"] == [
+            {"type": "text", "text": "answer 0", "cache_control": EPHEMERAL}
+        ]
+        assert config["tools"][-1]["cache_control"] == EPHEMERAL
+        assert request == original
+        assert planner.stats.stable_messages == 3
+
+    def test_previous_breakpoint_is_kept_and_changes_shrink_prefix(self):
+        planner = PromptCachePlanner()
+        planner.apply(_conversation(1), {})
+        planner.apply(_conversation(2), {})
+
+        messages = planner.apply(_conversation(3), {})
+        assert _marked(messages) == [0, 2, 4]
+
+        edited = _conversation(4)
+        edited[1] = {"role": "user", "content": "a different question"}
+        assert _marked(planner.apply(edited, {})) == [0]
+
+    def test_changed_tools_are_not_marked(self):
+        planner = PromptCachePlanner()
+        planner.apply(_conversation(1), {"tools": _tools()})
+
+        config = {"tools": _tools()[:1]}
+        planner.apply(_conversation(2), config)
+        assert "cache_control" not in config["tools"][-1]
+
+    def test_record_usage_splits_cached_tokens(self):
+        planner = PromptCachePlanner()
+        planner.record_usage(
+            SimpleNamespace(
+                prompt_tokens=1200, prompt_tokens_details=SimpleNamespace(cached_tokens=1000)
+            )
+        )
+        planner.record_usage(SimpleNamespace(prompt_tokens=300, prompt_tokens_details=None))
+
+        assert planner.stats.cached_prompt_tokens == 1000
+        assert planner.stats.uncached_prompt_tokens == 500
+
+
+class TestLanguageModelPromptCaching:
+    async def test_opt_in_and_capability_gate(self):
+        async with Agent("System", model="claude-sonnet-4-5") as agent:
+            messages = _conversation(1)
+            agent.model._apply_prompt_caching(messages, {"model": "claude-sonnet-4-5"})
+            marked = agent.model._apply_prompt_caching(
+                _conversation(2), {"model": "claude-sonnet-4-5"}
+            )
+            assert _marked(list(marked)) == []
+
+        async with Agent("System", model="claude-sonnet-4-5", prompt_caching=True) as agent:
+            agent.model._apply_prompt_caching(_conversation(1), {"model": "claude-sonnet-4-5"})
+            marked = agent.model._apply_prompt_caching(
+                _conversation(2), {"model": "claude-sonnet-4-5"}
+            )
+            assert _marked(list(marked)) == [0, 2]
+            assert agent.model.prompt_cache_stats.marked_requests == 1
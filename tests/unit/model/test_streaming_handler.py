@@ -44,6 +44,9 @@ class FakeLanguageModel:
     def _update_usage(self, _response: Any) -> None:
         pass
 
+    def _apply_prompt_caching(self, messages: Any, _config: dict[str, Any]) -> Any:
+        return messages
+
     def do(self, event: AgentEvents, **kwargs: Any) -> None:
         self.last_events.append((event, kwargs))
 
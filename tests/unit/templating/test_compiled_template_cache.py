@@ -0,0 +1,102 @@
+import time
+
+import pytest
+
+from good_agent.core.templating import (
+    COMPILED_TEMPLATE_CACHE_SIZE,
+    TEMPLATE_REGISTRY,
+    add_named_template,
+    compile_template,
+    create_environment,
+    default_environment,
+    register_filter,
+    render_template,
+)
+
+SYSTEM_PROMPT = """
+You are {{ name }}, a research assistant.
+
+!# section 'guidelines'
+{% include 'cache_test_guidelines' %}
+!# end section
+
+!# section 'tools'
+{% for tool in tools %}
+- {{ tool }}
+{% endfor %}
+!# end section
+"""
+
+
+@pytest.fixture(autouse=True)
+def guidelines_template():
+    original_templates = dict(TEMPLATE_REGISTRY.templates)
+    add_named_template("cache_test_guidelines", "Cite sources for {{ name }}.", replace=True)
+    yield
+    TEMPLATE_REGISTRY._templates.clear()
+    TEMPLATE_REGISTRY._templates.update(original_templates)
+
+
+class TestCompiledTemplateCache:
+    def test_compilations_are_reused_per_environment(self):
+        env = create_environment()
+        other = create_environment()
+
+        template = compile_template(env, "Hello {{ name }}")
+        assert compile_template(env, "Hello {{ name }}") is template
+        assert compile_template(other, "Hello {{ name }}") is not template
+        assert template.render(name="World") == "Hello World"
+
+    def test_cache_is_bounded(self):
+        env = create_environment()
+        for index in range(COMPILED_TEMPLATE_CACHE_SIZE + 10):
+            compile_template(env, f"{index}: {{{{ value }}}}")
+
+        cache = env._compiled_templates  # type: ignore[attr-defined]
+        assert len(cache) == COMPILED_TEMPLATE_CACHE_SIZE
+        assert "0: {{ value }}" not in cache
+
+    def test_render_template_shares_default_environment(self):
+        rendered = render_template(SYSTEM_PROMPT, {"name": "Ada", "tools": ["search"]})
+        assert "Cite sources for Ada." in rendered
+        assert "<guidelines>" in rendered
+
+        env = default_environment()
+        assert default_environment() is env
+        assert default_environment(use_sandbox=True) is not env
+
+        # Included templates are re-read when the registry changes
+        add_named_template("cache_test_guidelines", "Be brief, {{ name }}.", replace=True)
+        rendered = render_template(SYSTEM_PROMPT, {"name": "Ada", "tools": []})
+        assert "Be brief, Ada." in rendered
+
+    def test_default_environment_picks_up_new_filters(self):
+        env = default_environment()
+
+        @register_filter("cache_test_shout")
+        def shout(value: str) -> str:
+            return value.upper()
+
+        assert default_environment() is not env
+        assert render_template("{{ word | cache_test_shout }}", {"word": "hi"}) == "HI"
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    def test_system_prompt_render_cost(self):
+        """Per-render cost of a system prompt with an include and sections."""
+        context = {"name": "Ada", "tools": ["search", "fetch", "summarize"]}
+        renders = 200
+
+        start = time.perf_counter()
+        for _ in range(renders):
+            create_environment().from_string(SYSTEM_PROMPT.strip()).render(**context)
+        uncached_us = (time.perf_counter() - start) / renders * 1_000_000
+
+        render_template(SYSTEM_PROMPT, context)
+        start = time.perf_counter()
+        for _ in range(renders):
+            rendered = render_template(SYSTEM_PROMPT, context)
+        cached_us = (time.perf_counter() - start) / renders * 1_000_000
+
+        assert "- summarize" in rendered
+        assert cached_us < uncached_us
@@ -1,9 +1,13 @@
 """Tests for agent pool functionality."""
 
+import asyncio
+
 import pytest
 
 from good_agent import Agent
-from good_agent.agent.pool import AgentPool
+from good_agent.agent.pool import AgentPool, AgentPoolExhaustedError, WarmAgentPool
+from good_agent.extensions.citations import CitationManager
+from good_agent.messages import UserMessage
 
 
 class TestAgentPoolInitialization:
@@ -218,3 +222,129 @@ class TestAgentPoolEdgeCases:
 
         assert len(pool) == 3
         assert pool[0] is pool[1] is pool[2] is agent
+
+
+class TestWarmAgentPool:
+    """Tests for the leasing WarmAgentPool."""
+
+    @pytest.mark.asyncio
+    async def test_warm_up_builds_agents_once(self):
+        template = Agent("You are helpful")
+        pool = WarmAgentPool(lambda: template, size=3)
+
+        await pool.warm_up()
+        assert pool.created == 3
+
+        async with pool.lease() as agent:
+            assert agent is not template
+            assert agent.messages[0].content == "You are helpful"
+        assert pool.created == 3
+
+    @pytest.mark.asyncio
+    async def test_warm_up_and_acquire_never_exceed_size(self):
+        template = Agent("You are helpful")
+        fork = template._fork_with_messages
+
+        async def slow_fork(messages):
+            await asyncio.sleep(0.01)
+            return await fork(messages)
+
+        template._fork_with_messages = slow_fork
+        pool = WarmAgentPool(lambda: template, size=2)
+
+        results = await asyncio.gather(pool.warm_up(), pool.acquire(), pool.acquire())
+        assert pool.created == 2
+        assert pool.in_use == 2
+
+        for agent in results[1:]:
+            pool.release(agent)
+        await pool.warm_up()
+        assert pool.created == 2
+
+    @pytest.mark.asyncio
+    async def test_lease_swaps_conversation_and_release_restores_template(self):
+        template = Agent("You are helpful")
+        pool = WarmAgentPool(lambda: template, size=1)
+
+        async with pool.lease([UserMessage("first")]) as agent:
+            assert [m.content for m in agent.messages] == ["first"]
+            agent.append("follow-up")
+            assert len(agent.messages) == 2
+            first_agent = agent
+
+        assert [m.content for m in first_agent.messages] == ["You are helpful"]
+
+        async with pool.lease([UserMessage("second")]) as agent:
+            assert agent is first_agent
+            assert [m.content for m in agent.messages] == ["second"]
+            assert agent.messages[0].agent is agent
+            assert pool.in_use == 1
+
+        assert pool.in_use == 0
+        assert template.messages[0].content == "You are helpful"
+        assert len(template.messages) == 1
+
+    @pytest.mark.asyncio
+    async def test_slots_do_not_share_template_messages(self):
+        template = Agent("You are helpful")
+        pool = WarmAgentPool(lambda: template, size=2)
+        first = await pool.acquire()
+        second = await pool.acquire()
+
+        assert first.messages[0] is not second.messages[0]
+        assert first.messages[0].agent is first
+        assert second.messages[0].agent is second
+        assert template.messages[0].agent is template
+        pool.release(first)
+        pool.release(second)
+
+    @pytest.mark.asyncio
+    async def test_release_restores_request_state(self):
+        template = Agent("You are helpful", extensions=[CitationManager()])
+        pool = WarmAgentPool(lambda: template, size=1)
+
+        async with pool.lease([UserMessage("first")]) as agent:
+            citations = agent[CitationManager]
+            citations.index.add("https://example.com/a")
+            agent.context["tenant"] = "acme"
+            agent.model.total_tokens = 42
+            agent.modes._mode_stack.push("research")
+
+        async with pool.lease([UserMessage("second")]) as agent:
+            assert len(agent[CitationManager].index) == 0
+            assert agent.context.get("tenant") is None
+            assert agent.model.total_tokens == 0
+            assert agent.modes.mode_stack == []
+
+        assert len(template[CitationManager].index) == 0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_pool_applies_backpressure(self):
+        pool = WarmAgentPool(lambda: Agent(), size=1, acquire_timeout=0.01)
+        agent = await pool.acquire()
+
+        with pytest.raises(AgentPoolExhaustedError):
+            await pool.acquire()
+
+        pool.release(agent)
+        async with pool.lease() as again:
+            assert again is agent
+
+    @pytest.mark.asyncio
+    async def test_waiter_receives_released_agent(self):
+        pool = WarmAgentPool(lambda: Agent(), size=1)
+        agent = await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        pool.release(agent)
+        assert await waiter is agent
+        pool.release(agent)
+
+    @pytest.mark.asyncio
+    async def test_release_rejects_foreign_agent(self):
+        pool = WarmAgentPool(lambda: Agent(), size=1)
+        with pytest.raises(ValueError):
+            pool.release(Agent())
@@ -0,0 +1,500 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp import ClientSession
+from mcp.types import ListToolsResult, ToolListChangedNotification
+from mcp.types import Tool as MCPTool
+
+from good_agent import Agent
+from good_agent.mcp import MCPClientManager, MCPToolAdapter
+from good_agent.mcp.adapter import MCPToolSpec
+from good_agent.mcp.discovery import MCPDiscoveryCache
+from good_agent.mcp.pool import (
+    LatencyHistogram,
+    MCPSessionPool,
+    clear_mcp_session_pool,
+    get_mcp_session_pool,
+)
+from good_agent.tools import ToolCall, ToolCallFunction
+
+
+def _tools(*names: str) -> ListToolsResult:
+    return ListToolsResult(
+        tools=[
+            MCPTool(
+                name=name,
+                description=name.title(),
+                inputSchema={"type": "object", "properties": {"text": {"type": "string"}}},
+            )
+            for name in names
+        ]
+    )
+
+
+def _mock_session(server_version: str | None = None) -> AsyncMock:
+    session = AsyncMock(spec=ClientSession)
+    initialize_result = None
+    if server_version is not None:
+        initialize_result = SimpleNamespace(
+            serverInfo=SimpleNamespace(name="test-server", version=server_version)
+        )
+    session.initialize = AsyncMock(return_value=initialize_result)
+    session.list_tools = AsyncMock(return_value=_tools("echo"))
+    session.list_resources = AsyncMock(return_value=MagicMock(resources=[]))
+    session.call_tool = AsyncMock(return_value={"result": "ok"})
+    return session
+
+
+class RecordingOpener:
+    """Session opener that counts opens and records transport shutdown."""
+
+    def __init__(self, session=None, error: Exception | None = None):
+        self.session = session or _mock_session()
+        self.error = error
+        self.opened = 0
+        self.closed = 0
+        self.message_handler = None
+
+    @asynccontextmanager
+    async def _transport(self):
+        try:
+            yield
+        finally:
+            self.closed += 1
+
+    async def __call__(self, config, stack, message_handler=None):
+        self.opened += 1
+        self.message_handler = message_handler
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        await stack.enter_async_context(self._transport())
+        return self.session
+
+
+@pytest.fixture(autouse=True)
+async def clean_pool():
+    yield
+    await clear_mcp_session_pool()
+
+
+class TestMCPSessionPool:
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_share_one_session(self):
+        pool = MCPSessionPool()
+        opener = RecordingOpener()
+        config = {"url": "test://server"}
+
+        first, second = await asyncio.gather(
+            pool.acquire(config, opener), pool.acquire(config, opener)
+        )
+
+        assert first is second
+        assert first.refcount == 2
+        assert opener.opened == 1
+        assert opener.session.list_tools.await_count == 1
+        assert [spec.name for spec in first.tool_specs] == ["echo"]
+        await pool.aclose()
+        assert opener.closed == 1
+
+    @pytest.mark.asyncio
+    async def test_adapters_built_per_agent(self):
+        pool = MCPSessionPool()
+        opener = RecordingOpener()
+
+        plain = await pool.acquire({"url": "test://server"}, opener)
+        namespaced = await pool.acquire({"url": "test://server", "namespace": "ns"}, opener)
+
+        assert plain is namespaced
+        first, second = plain.adapters(None, 30.0)["echo"], plain.adapters(None, 30.0)["echo"]
+        assert first is not second
+        assert first.spec is second.spec
+        assert first._input_model is second._input_model
+        assert list(plain.adapters("ns", 30.0)) == ["ns:echo"]
+        assert opener.opened == 1
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_idle_eviction_and_reacquire(self):
+        pool = MCPSessionPool(idle_timeout=0.05)
+        opener = RecordingOpener()
+        config = {"url": "test://server"}
+
+        entry = await pool.acquire(config, opener)
+        pool.release(entry)
+        # Reacquiring before the timeout keeps the session open
+        assert await pool.acquire(config, opener) is entry
+        await asyncio.sleep(0.1)
+        assert entry.is_connected
+
+        pool.release(entry)
+        await asyncio.sleep(0.1)
+        assert not entry.is_connected
+        assert opener.closed == 1
+        assert len(pool) == 0
+
+        replacement = await pool.acquire(config, opener)
+        assert replacement is not entry
+        assert opener.opened == 2
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failed_open_is_not_pooled(self):
+        pool = MCPSessionPool()
+        opener = RecordingOpener(error=ConnectionError("refused"))
+        config = {"url": "test://server"}
+
+        results = await asyncio.gather(
+            pool.acquire(config, opener),
+            pool.acquire(config, opener),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert opener.opened == 1
+        assert len(pool) == 0
+
+        opener.error = None
+        assert (await pool.acquire(config, opener)).is_connected
+        await pool.aclose()
+
+
+class TestSharedMCPConnections:
+    @pytest.mark.asyncio
+    async def test_managers_multiplex_calls_over_shared_session(self):
+        opener = RecordingOpener()
+        first, second = MCPClientManager(), MCPClientManager()
+
+        with (
+            patch.object(first, "_create_session", opener),
+            patch.object(second, "_create_session", opener),
+        ):
+            conn_a = await first.connect({"url": "test://server"})
+            conn_b = await second.connect({"url": "test://server", "timeout": 5.0})
+
+        assert opener.opened == 1
+        assert conn_a.session is conn_b.session is opener.session
+        assert conn_a.pooled is not None and conn_a.pooled.refcount == 2
+
+        results = await asyncio.gather(
+            conn_a.tools["echo"]._execute_mcp_tool(),
+            conn_b.tools["echo"]._execute_mcp_tool(),
+        )
+        assert all(result.success for result in results)
+        assert opener.session.call_tool.await_count == 2
+
+        await first.disconnect_all()
+        assert conn_b.pooled is not None and conn_b.pooled.refcount == 1
+        await second.disconnect_all()
+        assert conn_b.pooled is None
+
+    @pytest.mark.asyncio
+    async def test_agents_attach_to_pooled_session(self):
+        opener = RecordingOpener()
+
+        with patch.object(MCPClientManager, "_create_session", opener):
+            async with Agent("System", mcp_servers=["test://server"]) as agent:
+                async with Agent("System", mcp_servers=["test://server"]) as other:
+                    assert "echo" in agent.tools
+                    assert "echo" in other.tools
+                    assert opener.opened == 1
+                    entry = get_mcp_session_pool().get({"url": "test://server"})
+                    assert entry is not None and entry.refcount == 2
+
+        assert entry.refcount == 0
+        assert opener.closed == 0  # Kept open until the idle timeout
+
+
+class TestDiscoveryCaching:
+    @pytest.mark.asyncio
+    async def test_listings_persist_per_server_version(self, tmp_path):
+        cache = MCPDiscoveryCache(tmp_path)
+        config = {"url": "test://server"}
+
+        first = RecordingOpener(_mock_session(server_version="1.0"))
+        pool = MCPSessionPool(discovery_cache=cache)
+        await pool.acquire(config, first)
+        await pool.aclose()
+        assert first.session.list_tools.await_count == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        # A new process-level pool reads the listings from disk
+        second = RecordingOpener(_mock_session(server_version="1.0"))
+        pool = MCPSessionPool(discovery_cache=cache)
+        entry = await pool.acquire(config, second)
+        assert second.session.list_tools.await_count == 0
+        assert [spec.name for spec in entry.tool_specs] == ["echo"]
+        assert "echo" in entry.adapters(None, 30.0)
+        await pool.aclose()
+
+        upgraded = RecordingOpener(_mock_session(server_version="2.0"))
+        pool = MCPSessionPool(discovery_cache=cache)
+        await pool.acquire(config, upgraded)
+        assert upgraded.session.list_tools.await_count == 1
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_expired_records_are_refetched(self, tmp_path):
+        config = {"url": "test://server"}
+        pool = MCPSessionPool(discovery_cache=MCPDiscoveryCache(tmp_path))
+        await pool.acquire(config, RecordingOpener(_mock_session(server_version="1.0")))
+        await pool.aclose()
+
+        opener = RecordingOpener(_mock_session(server_version="1.0"))
+        pool = MCPSessionPool(discovery_cache=MCPDiscoveryCache(tmp_path, ttl=0))
+        await pool.acquire(config, opener)
+        assert opener.session.list_tools.await_count == 1
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_open_session_refreshes_after_ttl(self):
+        pool = MCPSessionPool(discovery_ttl=0.05)
+        opener = RecordingOpener()
+        config = {"url": "test://server"}
+
+        await pool.acquire(config, opener)
+        await pool.acquire(config, opener)
+        assert opener.session.list_tools.await_count == 1
+
+        await asyncio.sleep(0.1)
+        await pool.acquire(config, opener)
+        assert opener.session.list_tools.await_count == 2
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_list_changed_notification_refreshes_tools(self, tmp_path):
+        cache = MCPDiscoveryCache(tmp_path)
+        opener = RecordingOpener(_mock_session(server_version="1.0"))
+        manager = MCPClientManager()
+
+        with (
+            patch("good_agent.mcp.client.get_mcp_session_pool") as get_pool,
+            patch.object(manager, "_create_session", opener),
+        ):
+            get_pool.return_value = pool = MCPSessionPool(discovery_cache=cache)
+            connection = await manager.connect({"url": "test://server", "namespace": "ns"})
+            assert list(connection.tools) == ["ns:echo"]
+
+            opener.session.list_tools.return_value = _tools("echo", "reverse")
+            await opener.message_handler(
+                ToolListChangedNotification(method="notifications/tools/list_changed")
+            )
+            entry = connection.pooled
+            assert entry is not None and entry._refresh_task is not None
+            await entry._refresh_task
+
+            assert list(connection.tools) == ["ns:echo", "ns:reverse"]
+            cached = cache.load(entry._discovery_key)
+            assert cached is not None
+            assert [tool["name"] for tool in cached.tools] == ["echo", "reverse"]
+
+            await manager.disconnect_all()
+            await pool.aclose()
+
+    def test_input_models_are_memoized_by_schema(self):
+        schema = {"type": "object", "properties": {"text": {"type": "string"}}}
+        first = MCPToolAdapter(None, MCPToolSpec(name="echo", input_schema=schema), name="a:echo")
+        second = MCPToolAdapter(None, MCPToolSpec(name="echo", input_schema=dict(schema)))
+        changed = MCPToolAdapter(
+            None, MCPToolSpec(name="echo", input_schema={**schema, "required": ["text"]})
+        )
+
+        assert first._input_model is second._input_model
+        assert changed._input_model is not first._input_model
+
+
+class SlowServer:
+    """Stand-in for ``ClientSession.call_tool`` that tracks overlapping calls."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.cancelled = 0
+
+    async def call_tool(self, name, arguments=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+        return {"name": name, "arguments": arguments}
+
+
+def _echo_calls(count: int) -> list[ToolCall]:
+    return [
+        ToolCall(
+            id=f"call_{index}",
+            type="function",
+            function=ToolCallFunction(name="echo", arguments=f'{{"text": "t{index}"}}'),
+        )
+        for index in range(count)
+    ]
+
+
+class TestPipelinedToolCalls:
+    @pytest.mark.asyncio
+    async def test_in_flight_limit_and_latency(self):
+        pool = MCPSessionPool()
+        opener = RecordingOpener()
+        server = SlowServer()
+        opener.session.call_tool = server.call_tool
+
+        entry = await pool.acquire({"url": "test://server", "max_in_flight": 2}, opener)
+        await asyncio.gather(*(entry.call_tool("echo", {"text": str(i)}) for i in range(5)))
+
+        assert server.peak == 2
+        assert entry.latency.count == 5
+        assert entry.latency.errors == 0
+        assert 25 <= entry.latency.percentile(0.5) <= entry.latency.max_ms
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_first_config_sets_session_call_settings(self, caplog):
+        pool = MCPSessionPool()
+        opener = RecordingOpener()
+
+        first = await pool.acquire({"url": "test://server", "max_in_flight": 2}, opener)
+        with caplog.at_level("WARNING", logger="good_agent.mcp.pool"):
+            await pool.acquire({"url": "test://server"}, opener)
+            assert not caplog.records
+            second = await pool.acquire(
+                {"url": "test://server", "max_in_flight": 4, "pipeline": True}, opener
+            )
+
+        assert second is first
+        assert (second.max_in_flight, second.pipeline) == (2, False)
+        assert "max_in_flight=4 (session uses 2)" in caplog.text
+        assert "pipeline=True (session uses False)" in caplog.text
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cancellation_reaches_server_call(self):
+        pool = MCPSessionPool()
+        opener = RecordingOpener()
+        server = SlowServer(delay=10)
+        opener.session.call_tool = server.call_tool
+
+        entry = await pool.acquire({"url": "test://server", "max_in_flight": 1}, opener)
+        task = asyncio.ensure_future(entry.call_tool("echo"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert server.cancelled == 1
+        assert entry.latency.count == 0
+
+        # The in-flight slot was released
+        server.delay = 0
+        assert await entry.call_tool("echo") == {"name": "echo", "arguments": None}
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_in_flight", [1, 3])
+    async def test_agent_pipelines_mcp_calls_in_order(self, max_in_flight):
+        opener = RecordingOpener()
+        server = SlowServer()
+        opener.session.call_tool = server.call_tool
+        config = {"url": "test://server", "max_in_flight": max_in_flight, "pipeline": True}
+
+        with patch.object(MCPClientManager, "_create_session", opener):
+            async with Agent("System", mcp_servers=[config]) as agent:
+                agent.assistant.append("", tool_calls=_echo_calls(4))
+                resolved = [msg async for msg in agent.resolve_pending_tool_calls()]
+
+                assert [msg.tool_call_id for msg in resolved] == [f"call_{i}" for i in range(4)]
+                assert server.peak == max_in_flight
+                assert agent.tools._mcp_client.get_latency()["server"].count == 4
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("concurrent", "peak"), [(False, 1), (True, 2)])
+    async def test_agent_overlaps_mcp_calls_only_when_enabled(self, concurrent, peak):
+        opener = RecordingOpener()
+        server = SlowServer()
+        opener.session.call_tool = server.call_tool
+        config = {"url": "test://server", "max_in_flight": 2}
+
+        with patch.object(MCPClientManager, "_create_session", opener):
+            async with Agent(
+                "System", mcp_servers=[config], concurrent_tool_calls=concurrent
+            ) as agent:
+                agent.assistant.append("", tool_calls=_echo_calls(4))
+                resolved = [msg async for msg in agent.resolve_pending_tool_calls()]
+
+                assert [msg.tool_call_id for msg in resolved] == [f"call_{i}" for i in range(4)]
+                assert server.peak == peak
+
+    @pytest.mark.asyncio
+    async def test_cancelling_resolution_cancels_server_calls(self):
+        opener = RecordingOpener()
+        server = SlowServer(delay=10)
+        opener.session.call_tool = server.call_tool
+
+        with patch.object(MCPClientManager, "_create_session", opener):
+            config = {"url": "test://server", "pipeline": True}
+            async with Agent("System", mcp_servers=[config]) as agent:
+                agent.assistant.append("", tool_calls=_echo_calls(3))
+
+                async def resolve():
+                    return [msg async for msg in agent.resolve_pending_tool_calls()]
+
+                task = asyncio.ensure_future(resolve())
+                await asyncio.sleep(0.05)
+                assert server.active == 3
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+                assert server.cancelled == 3
+                assert server.active == 0
+
+    def test_latency_histogram_buckets(self):
+        histogram = LatencyHistogram()
+        for seconds in (0.0005, 0.004, 0.004, 0.2, 45.0):
+            histogram.record(seconds)
+
+        assert histogram.count == 5
+        assert histogram.percentile(0.2) == 1
+        assert histogram.percentile(0.6) == 5
+        assert histogram.percentile(0.8) == 250
+        assert histogram.percentile(1.0) == histogram.max_ms == 45000
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+def test_adapter_construction_reuses_input_models():
+    """Building adapters for 200 tools is cheaper once their input models are memoized."""
+    from good_agent.mcp import adapter as adapter_module
+
+    specs = [
+        MCPToolSpec(
+            name=f"tool_{index}",
+            input_schema={
+                "type": "object",
+                "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}},
+                "required": ["query"],
+            },
+        )
+        for index in range(200)
+    ]
+
+    def build() -> float:
+        start = time.perf_counter()
+        for spec in specs:
+            MCPToolAdapter(None, spec)
+        return (time.perf_counter() - start) * 1000
+
+    adapter_module._input_models.clear()
+    cold_ms = build()
+    warm_ms = build()
+
+    assert warm_ms < cold_ms
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from good_agent import Agent, tool
+from good_agent.tools import Tool
+
+
+def _make_tool(index: int) -> Tool:
+    async def fn(query: str, limit: int = 10, tags: list[str] | None = None) -> str:
+        return query
+
+    return Tool(fn, name=f"tool_{index}", description=f"Tool number {index}")
+
+
+class TestToolSchemaCache:
+    """Model, schema and signature are built once per tool."""
+
+    def test_model_schema_and_signature_are_memoized(self):
+        @tool
+        async def search(query: str, limit: int = 5) -> str:
+            """Search for things."""
+            return query
+
+        assert search.model is search.model
+        assert search.get_schema() is search.get_schema()
+        assert search.signature is search.signature
+        assert search.signature["function"]["parameters"]["required"] == ["query"]
+
+    def test_reassigning_metadata_invalidates(self):
+        @tool
+        async def search(query: str) -> str:
+            """Search for things."""
+            return query
+
+        model = search.model
+        signature = search.signature
+
+        search.description = "Find things."
+        assert search.signature is not signature
+        assert search.signature["function"]["description"] == "Find things."
+        assert search.model is model
+
+        search.name = "find"
+        assert search.model is not model
+        assert search.signature["function"]["name"] == "find"
+
+    def test_invalidate_after_in_place_mutation(self):
+        tool_instance = _make_tool(0)
+        assert "tags" in tool_instance.get_schema()["properties"]
+
+        del tool_instance._tool_metadata.parameters["tags"]
+        tool_instance.invalidate_schema_cache()
+
+        assert "tags" not in tool_instance.get_schema()["properties"]
+        assert "tags" not in tool_instance.model.model_fields
+
+
+class TestToolDefinitionPerformance:
+    """Per-turn cost of building tool definitions for the LLM."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    async def test_tool_definitions_per_turn(self):
+        """Cached turns of get_tool_definitions() with 40 tools beat the first turn.
+
+        Every turn previously rebuilt a Pydantic model and JSON schema per tool.
+        """
+        n_tools = 40
+        turns = 50
+        agent = Agent("System prompt", tools=[_make_tool(i) for i in range(n_tools)])
+        await agent.initialize()
+        coordinator = agent._llm_coordinator
+
+        start = time.perf_counter()
+        first = await coordinator.get_tool_definitions()
+        first_turn_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for _ in range(turns):
+            definitions = await coordinator.get_tool_definitions()
+        per_turn_ms = (time.perf_counter() - start) / turns * 1000
+
+        assert definitions == first
+        assert per_turn_ms < first_turn_ms
@@ -1,3 +1,7 @@
+import time
+
+import pytest
+
 from good_agent.agent import Agent
 from good_agent.messages import (
     AssistantMessage,
@@ -299,3 +303,83 @@ class TestCachingBehavior:
 
         assert count_with > count_without
         assert len(msg._token_count_cache) == 2
+
+
+class TestRunningTokenTally:
+    """The message list keeps a running token tally per model."""
+
+    @staticmethod
+    def _expected(agent: Agent) -> int:
+        return sum(get_message_token_count(m, model=agent.config.model) for m in agent.messages)
+
+    def test_only_new_messages_are_tokenized(self, monkeypatch):
+        from good_agent.utilities import tokens
+
+        agent = Agent("You are helpful.")
+        agent.append("Hello!")
+        assert agent.token_count == self._expected(agent)
+
+        calls: list[dict] = []
+        original = tokens.count_message_tokens
+
+        def counting(message_dict, *args, **kwargs):
+            calls.append(message_dict)
+            return original(message_dict, *args, **kwargs)
+
+        monkeypatch.setattr(tokens, "count_message_tokens", counting)
+
+        agent.append("Hi there!", role="assistant")
+        assert agent.token_count == self._expected(agent)
+        assert agent.token_count == self._expected(agent)
+        assert [c["content"] for c in calls] == ["Hi there!"]
+
+    def test_tally_follows_replace_delete_and_revert(self):
+        agent = Agent("You are helpful.")
+        agent.append("First question")
+        agent.append("First answer", role="assistant")
+        assert agent.token_count == self._expected(agent)
+
+        agent.messages[1] = UserMessage("A much longer replacement for the first question")
+        assert agent.token_count == self._expected(agent)
+
+        del agent.messages[2]
+        agent.messages.insert(1, UserMessage("Inserted"))
+        assert agent.token_count == self._expected(agent)
+
+        agent.system.set("A different system prompt.")
+        by_role = agent.get_token_count_by_role()
+        assert sum(by_role.values()) == self._expected(agent)
+
+        agent.revert_to_version(0)
+        assert agent.token_count == self._expected(agent)
+
+    def test_tallies_are_kept_per_model(self):
+        agent = Agent("You are helpful.")
+        agent.append("Hello!")
+        gpt4o = agent.messages.token_counts("gpt-4o")
+        legacy = agent.messages.token_counts("gpt-3.5-turbo")
+
+        agent.append("Another message")
+        assert sum(agent.messages.token_counts("gpt-4o").values()) > sum(gpt4o.values())
+        assert sum(agent.messages.token_counts("gpt-3.5-turbo").values()) > sum(legacy.values())
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    def test_token_count_per_turn(self):
+        """agent.token_count after one append is cheaper than the first full count."""
+        agent = Agent("You are helpful.")
+        for index in range(300):
+            agent.append(f"Question number {index} about something")
+            agent.append(f"Answer number {index} with some detail", role="assistant")
+
+        start = time.perf_counter()
+        cold = agent.token_count
+        cold_ms = (time.perf_counter() - start) * 1000
+
+        agent.append("One more question")
+        start = time.perf_counter()
+        warm = agent.token_count
+        warm_ms = (time.perf_counter() - start) * 1000
+
+        assert warm > cold
+        assert warm_ms < cold_ms
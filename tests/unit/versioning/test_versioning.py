@@ -341,6 +341,95 @@ class TestVersionManager:
         assert vm.get_version(0) == original
 
 
+class TestVersionManagerStructuralSharing:
+    """Versions share an append-only log instead of copying the full ID list."""
+
+    @staticmethod
+    def _stored_ids(vm: VersionManager) -> int:
+        logs = {id(log): log for log, _ in vm._history}
+        return sum(len(log.ids) for log in logs.values())
+
+    def test_appends_share_one_log(self):
+        vm = VersionManager()
+        ids = [ULID() for _ in range(2000)]
+        for message_id in ids:
+            vm.append_message_ids([message_id])
+
+        assert vm.version_count == 2000
+        assert vm.current_version == ids
+        assert vm.get_version(9) == ids[:10]
+        assert self._stored_ids(vm) == 2000
+
+    def test_add_version_extending_current_is_shared(self):
+        vm = VersionManager()
+        ids = [ULID() for _ in range(3)]
+        vm.add_version(ids[:1])
+        vm.add_version(ids[:2])
+        vm.add_version(ids)
+
+        assert self._stored_ids(vm) == 3
+        assert vm.get_version_length(0) == 1
+
+    def test_append_after_revert_branches_without_touching_history(self):
+        vm = VersionManager()
+        a, b, c = ULID(), ULID(), ULID()
+        vm.append_message_ids([a])
+        vm.append_message_ids([b])
+        vm.revert_to(0)
+        vm.append_message_ids([c])
+
+        assert vm.current_version == [a, c]
+        assert vm.get_version(1) == [a, b]
+        assert vm.get_version(2) == [a]
+        changes = vm.get_changes_between(1, 3)
+        assert set(changes["added"]) == {c}
+        assert set(changes["removed"]) == {b}
+
+    def test_fork_appends_are_isolated(self):
+        vm = VersionManager()
+        a, b, c = ULID(), ULID(), ULID()
+        vm.append_message_ids([a])
+        fork = vm.fork_at(-1)
+
+        fork.append_message_ids([b])
+        vm.append_message_ids([c])
+
+        assert fork.current_version == [a, b]
+        assert vm.current_version == [a, c]
+        assert vm.get_version(0) == fork.get_version(0) == [a]
+
+    def test_versions_view_round_trips(self):
+        vm = VersionManager()
+        ids = [ULID(), ULID()]
+        vm.append_message_ids(ids[:1])
+        vm.append_message_ids(ids[1:])
+
+        snapshot = vm._versions.copy()
+        assert snapshot == [ids[:1], ids]
+
+        restored = VersionManager()
+        restored._versions = snapshot
+        restored._current_version_index = 1
+        assert restored.current_version == ids
+        assert len(restored._versions) == 2
+
+    @pytest.mark.asyncio
+    async def test_agent_appends_extend_version_history(self):
+        async with Agent("test") as agent:
+            for i in range(5):
+                agent.append(f"message {i}")
+            history = agent._versioning_manager._history
+
+            assert len({id(log) for log, _ in history._history}) == 1
+            assert history.current_version == [message.id for message in agent.messages]
+
+            replacement = UserMessage(content="replaced")
+            agent.replace_message(1, replacement)
+
+            assert history.current_version[1] == replacement.id
+            assert history.get_version(-2)[1] != replacement.id
+
+
 class TestInMemoryMessageStore:
     """Test the InMemoryMessageStore implementation."""
 